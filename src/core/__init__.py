@@ -13,10 +13,20 @@ from .interfaces import (
 from .entity_base import Entity
 from .game_state import GameStateController, GameStateEnum
 from .level_controller import LevelController
-from .entity_manager import EntityManager
 from .camera_controller import CameraController
 from .asset_loader import AssetLoader
 
+
+def __getattr__(name):
+    # EntityManager imports the entity modules, which import core helpers
+    # (surface_cache, frame_data, ...); loading it on first use keeps
+    # `import entity.player` from re-entering a half-initialised package.
+    if name == 'EntityManager':
+        from .entity_manager import EntityManager
+        return EntityManager
+    raise AttributeError(f"module 'core' has no attribute {name!r}")
+
+
 __all__ = [
     'IDrawable',
     'IUpdatable',
@@ -0,0 +1,64 @@
+"""
+Activation - Region aktif di sekitar viewport kamera.
+Enemy dan NPC di luar viewport (+ margin) di-park: tidak ada physics, AI,
+maupun animasi. Saat bangun, entity mengejar waktu yang terlewat dengan
+aturan deterministik (catch_up: hanya jam animasi yang dimajukan, posisi dan
+AI lanjut dari state saat di-park).
+"""
+import pygame
+from typing import Any, Dict, Iterable, List, Set
+
+from core.spatial_hash import SpatialHash
+
+
+class ActivationRegion:
+    """
+    Menentukan entity mana yang di-update tiap tick.
+
+    Per tick: awake = region.update(view_rect, spatial, kinds)
+    Entity yang belum pernah aktif dianggap di-park sejak reset() terakhir.
+    """
+
+    def __init__(self, margin: int = 160):
+        self.margin = margin
+        self.tick = 0
+        self._epoch = 0
+        self._awake: Set[Any] = set()
+        self._parked_at: Dict[Any, int] = {}
+
+    def update(self, view_rect: pygame.Rect, spatial: SpatialHash, kinds: Iterable[str]) -> List[Any]:
+        """
+        Wake the entities near `view_rect` and park the rest.
+
+        Returns:
+            Awake entities in tracking order (list order of the spatial hash)
+        """
+        self.tick += 1
+        region = view_rect.inflate(2 * self.margin, 2 * self.margin)
+        awake = spatial.query_rect(region, kinds)
+        awake_set = set(awake)
+
+        for obj in self._awake - awake_set:
+            if obj in spatial:
+                self._parked_at[obj] = self.tick
+        for obj in awake_set - self._awake:
+            since = self._parked_at.pop(obj, self._epoch)
+            catch_up = getattr(obj, 'catch_up', None)
+            if catch_up is not None and self.tick > since:
+                catch_up(self.tick - since)
+
+        self._awake = awake_set
+        return awake
+
+    def is_awake(self, obj: Any) -> bool:
+        return obj in self._awake
+
+    def reset(self):
+        """Forget parked state (level load, respawn); everything counts as parked from now."""
+        self._awake = set()
+        self._parked_at.clear()
+        self._epoch = self.tick
+
+    @property
+    def awake_count(self) -> int:
+        return len(self._awake)
@@ -3,9 +3,10 @@ Asset Loader - Centralized asset loading dan caching.
 """
 import pygame
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from utils.exception import AssetLoadError, AudioLoadError
 from utils import assets
+from core.surface_cache import SURFACE_VARIANTS, SurfaceVariantCache
 from environment.trap import load_spike_frames
 from environment.campfire import load_campfire_frames
 
@@ -28,6 +29,9 @@ class AssetLoader:
         # Menu assets
         self.menu_assets: Dict[str, pygame.Surface] = {}
         
+        # Scaled/mirrored variants, built once per (surface, size, flip)
+        self.variants: SurfaceVariantCache = SURFACE_VARIANTS
+        
     def load_all_assets(self, game_surface_height: int):
         """Load all game assets."""
         self.load_tiles()
@@ -101,6 +105,19 @@ class AssetLoader:
         except pygame.error as e:
             raise AssetLoadError("Menu assets", e)
     
+    def prewarm_level(self, platforms: Iterable[Dict], trigger_traps: Iterable, campfires: Iterable):
+        """Build the tile, spike and campfire variants for every size the level draws."""
+        variants = self.variants
+        for char, size in {(p['char'], p['rect'].size) for p in platforms}:
+            tile_image = self.tile_images.get(char)
+            if tile_image:
+                variants.prewarm(tile_image, size)
+        for frames, sizes in ((self.spike_frames, {t.trap_rect.size for t in trigger_traps}),
+                              (self.campfire_frames, {c.rect.size for c in campfires})):
+            for size in sizes:
+                for frame in frames:
+                    variants.prewarm(frame, size)
+    
     def load_music(self, music_file: str):
         """Load and play background music."""
         try:
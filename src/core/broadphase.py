@@ -0,0 +1,140 @@
+"""
+Broadphase - Sort-and-sweep untuk semua AABB dinamis (player, hitbox serangan,
+block rect enemy, hazard, spell boss). Urutan sumbu-x disimpan antar frame dan
+dirapikan dengan insertion sort (gerakan koheren, jadi hampir O(n)). Pasangan
+yang overlap dikumpulkan per kategori sekali per tick untuk semua handler.
+"""
+import pygame
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class Proxy:
+    """Satu AABB terdaftar: pemilik, kategori, rect dan tag opsional."""
+    __slots__ = ('owner', 'category', 'tag', 'rect', 'order', 'tick')
+
+    def __init__(self, owner: Any, category: str, tag: Optional[str]):
+        self.owner = owner
+        self.category = category
+        self.tag = tag
+        self.rect: Optional[pygame.Rect] = None
+        self.order = 0
+        self.tick = -1
+
+    def __repr__(self):
+        return f"Proxy({self.category}/{self.tag}, {self.rect})"
+
+
+Pair = Tuple[Proxy, Proxy]
+
+
+class SweepAndPrune:
+    """
+    Broadphase sort-and-sweep di sumbu x.
+
+    Per tick:
+        begin(); add(...) untuk setiap AABB; end()
+        pairs('player', 'hazard') -> [(player_proxy, hazard_proxy), ...]
+
+    Pasangan dikembalikan dalam urutan pendaftaran (add), jadi handler
+    memproses objek dalam urutan yang sama seperti loop list biasa.
+    """
+
+    def __init__(self, pair_categories: Iterable[Tuple[str, str]]):
+        self._pair_keys = [tuple(p) for p in pair_categories]
+        self._partners: Dict[str, set] = {}
+        for a, b in self._pair_keys:
+            self._partners.setdefault(a, set()).add(b)
+            self._partners.setdefault(b, set()).add(a)
+
+        self._proxies: Dict[Tuple[int, str, Optional[str]], Proxy] = {}
+        self._sorted: List[Proxy] = []
+        self._pairs: Dict[Tuple[str, str], List[Pair]] = {key: [] for key in self._pair_keys}
+        self._tick = 0
+        self._next_order = 0
+
+        # Stats of the last tick (F3 overlay / profiling)
+        self.swaps = 0
+        self.tests = 0
+
+    def begin(self):
+        """Start registering this tick's AABBs."""
+        self._tick += 1
+        self._next_order = 0
+
+    def add(self, owner: Any, category: str, rect: pygame.Rect, tag: Optional[str] = None) -> Proxy:
+        """Register (or move) the AABB of `owner` for this tick."""
+        key = (id(owner), category, tag)
+        proxy = self._proxies.get(key)
+        if proxy is None or proxy.owner is not owner:
+            proxy = Proxy(owner, category, tag)
+            self._proxies[key] = proxy
+            self._sorted.append(proxy)
+        proxy.rect = rect
+        proxy.order = self._next_order
+        proxy.tick = self._tick
+        self._next_order += 1
+        return proxy
+
+    def end(self):
+        """Drop AABBs not registered this tick, re-sort, sweep and build the pair lists."""
+        tick = self._tick
+        if any(p.tick != tick for p in self._sorted):
+            self._sorted = [p for p in self._sorted if p.tick == tick]
+            self._proxies = {k: p for k, p in self._proxies.items() if p.tick == tick}
+
+        # Insertion sort on the left edge; nearly sorted from last tick
+        items = self._sorted
+        swaps = 0
+        for i in range(1, len(items)):
+            proxy = items[i]
+            left = proxy.rect.left
+            j = i - 1
+            while j >= 0 and items[j].rect.left > left:
+                items[j + 1] = items[j]
+                j -= 1
+                swaps += 1
+            items[j + 1] = proxy
+        self.swaps = swaps
+
+        # Sweep: keep the proxies whose x-interval is still open
+        for pairs in self._pairs.values():
+            pairs.clear()
+        partners = self._partners
+        active: List[Proxy] = []
+        tests = 0
+        for proxy in items:
+            wanted = partners.get(proxy.category)
+            left = proxy.rect.left
+            active = [a for a in active if a.rect.right > left]
+            if wanted:
+                for other in active:
+                    if other.category in wanted:
+                        tests += 1
+                        if proxy.rect.colliderect(other.rect):
+                            self._emit(proxy, other)
+            active.append(proxy)
+        self.tests = tests
+
+        for pairs in self._pairs.values():
+            pairs.sort(key=lambda pair: (pair[0].order, pair[1].order))
+
+    def _emit(self, a: Proxy, b: Proxy):
+        pairs = self._pairs.get((a.category, b.category))
+        if pairs is not None:
+            pairs.append((a, b))
+        pairs = self._pairs.get((b.category, a.category))
+        if pairs is not None:
+            pairs.append((b, a))
+
+    def pairs(self, category_a: str, category_b: str) -> List[Pair]:
+        """Overlapping (a, b) pairs of this tick, in registration order."""
+        return self._pairs.get((category_a, category_b), [])
+
+    def clear(self):
+        self._proxies.clear()
+        self._sorted.clear()
+        for pairs in self._pairs.values():
+            pairs.clear()
+
+    def __len__(self) -> int:
+        return len(self._sorted)
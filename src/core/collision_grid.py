@@ -0,0 +1,205 @@
+"""
+Collision Grid - Dunia collision statis berbasis grid tile.
+Setiap sel menyimpan bitmask dimensi yang solid dan sub-rect solid sel itu
+(P hanya setinggi 20 px), sehingga resolusi gerak dan probe tanah hanya
+mengecek beberapa sel yang ditempati body, bukan seluruh list platform.
+Gerak body di-sweep (time of impact + normal kontak), jadi kecepatan besar
+tidak bisa menembus platform tipis.
+"""
+import pygame
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+DIM_BITS = {'normal': 1, 'gema': 2, 'both': 3}
+
+
+class CollisionGrid:
+    """
+    Grid sel -> [[mask, rect], ...] untuk satu level.
+    Biasanya satu entri per sel; sel yang bentuknya beda per dimensi
+    (misalnya G di normal, P di gema) punya satu entri per bentuk.
+    """
+
+    def __init__(self, tile_size: int = 40):
+        self.tile_size = tile_size
+        self._cells: Dict[Tuple[int, int], List[list]] = {}
+        self.version = 0  # bumped on every change (caches derived from the grid)
+        self._views = {dim: CollisionView(self, DIM_BITS[dim]) for dim in ('normal', 'gema')}
+
+    def build(self, platforms: Iterable[Dict]):
+        """Rebuild from tile platforms ({'rect', 'dim'}, one tile each)."""
+        self._cells.clear()
+        self.add(platforms)
+
+    def add(self, platforms: Iterable[Dict]):
+        """Mark tiles solid for their dimension."""
+        ts = self.tile_size
+        cells = self._cells
+        self.version += 1
+        for p in platforms:
+            rect = p['rect']
+            bit = DIM_BITS[p.get('dim', 'both')]
+            # A tile rect may span several cells (spans, oversized tiles)
+            for row in range(rect.top // ts, (rect.bottom - 1) // ts + 1):
+                for col in range(rect.left // ts, (rect.right - 1) // ts + 1):
+                    entries = cells.setdefault((col, row), [])
+                    for entry in entries:
+                        if entry[1] == rect:
+                            entry[0] |= bit
+                            break
+                    else:
+                        entries.append([bit, rect])
+
+    def clear(self):
+        self._cells.clear()
+        self.version += 1
+
+    def view(self, dim: str) -> 'CollisionView':
+        """Prebuilt view of the cells solid in `dim` (normal or gema)."""
+        return self._views[dim]
+
+    @property
+    def cell_count(self) -> int:
+        return len(self._cells)
+
+
+class SweepHit(NamedTuple):
+    """First contact of a swept rect: fraction of the move, contact normal and the solid hit."""
+    time: float
+    normal: Tuple[int, int]
+    solid: pygame.Rect
+
+
+class CollisionView:
+    """Query interface for one dimension; passed to entity physics as `platforms`."""
+
+    def __init__(self, grid: CollisionGrid, bit: int):
+        self._grid = grid
+        self._bit = bit
+        self.nav = None  # NavLayer of this dimension (set by NavGraph.build)
+
+    @property
+    def grid(self) -> CollisionGrid:
+        return self._grid
+
+    def solid_cells(self) -> Iterable[Tuple[int, int, pygame.Rect]]:
+        """(col, row, solid rect) for every solid entry of this dimension."""
+        bit = self._bit
+        for (col, row), entries in self._grid._cells.items():
+            for mask, solid in entries:
+                if mask & bit:
+                    yield col, row, solid
+
+    def query(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Solid rects of the cells `rect` overlaps, in map scan order (row, then column)."""
+        grid = self._grid
+        ts = grid.tile_size
+        cells = grid._cells
+        bit = self._bit
+        found = []
+        for row in range(rect.top // ts, (rect.bottom - 1) // ts + 1):
+            for col in range(rect.left // ts, (rect.right - 1) // ts + 1):
+                entries = cells.get((col, row))
+                if entries:
+                    for mask, solid in entries:
+                        if mask & bit and solid not in found:
+                            found.append(solid)
+        return found
+
+    def sweep(self, rect: pygame.Rect, dx: int, dy: int) -> Optional[SweepHit]:
+        """
+        Swept AABB against the tile world: earliest solid `rect` would enter
+        while moving by (dx, dy). Solids already overlapping `rect` are ignored
+        (see move_x / move_y), and ending flush against a solid is not a hit.
+        """
+        if not dx and not dy:
+            return None
+        swept = rect.union(rect.move(dx, dy))
+        best: Optional[SweepHit] = None
+        for solid in self.query(swept):
+            if not solid.colliderect(swept) or solid.colliderect(rect):
+                continue
+            if dx:
+                near_x = (solid.left - rect.right) / dx if dx > 0 else (solid.right - rect.left) / dx
+                far_x = (solid.right - rect.left) / dx if dx > 0 else (solid.left - rect.right) / dx
+            elif rect.left < solid.right and solid.left < rect.right:
+                near_x, far_x = float('-inf'), float('inf')
+            else:
+                continue
+            if dy:
+                near_y = (solid.top - rect.bottom) / dy if dy > 0 else (solid.bottom - rect.top) / dy
+                far_y = (solid.bottom - rect.top) / dy if dy > 0 else (solid.top - rect.bottom) / dy
+            elif rect.top < solid.bottom and solid.top < rect.bottom:
+                near_y, far_y = float('-inf'), float('inf')
+            else:
+                continue
+            entry = max(near_x, near_y)
+            if entry >= min(far_x, far_y) or not 0 <= entry < 1:
+                continue
+            if best is None or entry < best.time:
+                if near_x > near_y:
+                    normal = (-1 if dx > 0 else 1, 0)
+                else:
+                    normal = (0, -1 if dy > 0 else 1)
+                best = SweepHit(entry, normal, solid)
+        return best
+
+    def move_x(self, rect: pygame.Rect, velocity_x: float) -> Optional[SweepHit]:
+        """
+        Move `rect` horizontally by `velocity_x` (Rect rounding), stopping flush
+        at the first solid ahead, then push it out of solids it started inside.
+        Returns the contact that stopped it, if any.
+        """
+        target = rect.copy()
+        target.x += velocity_x
+        hit = self.sweep(rect, target.x - rect.x, 0)
+        if hit is None:
+            rect.x = target.x
+        elif hit.normal[0] < 0:
+            rect.right = hit.solid.left
+        else:
+            rect.left = hit.solid.right
+        return self._push_out(rect, velocity_x, 0) or hit
+
+    def move_y(self, rect: pygame.Rect, velocity_y: float) -> Optional[SweepHit]:
+        """Vertical counterpart of move_x; a hit with normal (0, -1) means landing."""
+        target = rect.copy()
+        target.y += velocity_y
+        hit = self.sweep(rect, 0, target.y - rect.y)
+        if hit is None:
+            rect.y = target.y
+        elif hit.normal[1] < 0:
+            rect.bottom = hit.solid.top
+        else:
+            rect.top = hit.solid.bottom
+        return self._push_out(rect, 0, velocity_y) or hit
+
+    def _push_out(self, rect: pygame.Rect, velocity_x: float, velocity_y: float) -> Optional[SweepHit]:
+        """Overlap resolution against the direction of travel (bodies embedded after a dimension shift)."""
+        contact = None
+        for solid in self.query(rect):
+            if rect.colliderect(solid):
+                if velocity_x > 0:
+                    rect.right = solid.left
+                    contact = SweepHit(0.0, (-1, 0), solid)
+                elif velocity_x < 0:
+                    rect.left = solid.right
+                    contact = SweepHit(0.0, (1, 0), solid)
+                elif velocity_y > 0:
+                    rect.bottom = solid.top
+                    contact = SweepHit(0.0, (0, -1), solid)
+                elif velocity_y < 0:
+                    rect.top = solid.bottom
+                    contact = SweepHit(0.0, (0, 1), solid)
+        return contact
+
+    def any_solid(self, rect: pygame.Rect) -> bool:
+        """True if `rect` overlaps any solid sub-rect (ground probes)."""
+        for solid in self.query(rect):
+            if solid.colliderect(rect):
+                return True
+        return False
+
+
+# Stand-in for bodies updated without a level (menus, tests)
+EMPTY_VIEW = CollisionGrid().view('normal')
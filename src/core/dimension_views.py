@@ -0,0 +1,57 @@
+"""
+Dimension Views - Struktur level yang dipartisi per dimensi sekali saat setup.
+Setiap jenis objek disimpan dalam bucket 'normal', 'gema' dan 'both', plus view
+aktif (dimensi + 'both') yang sudah jadi, sehingga pindah dimensi hanya
+mengganti view yang dipakai tanpa filter per frame.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+DIMENSIONS = ('normal', 'gema')
+BUCKETS = ('normal', 'gema', 'both')
+
+
+def dim_of(item: Any) -> str:
+    """Dimension of a level dict ({'dim': ...}) or object (.dim, default 'both')."""
+    if isinstance(item, dict):
+        return item.get('dim', 'both')
+    return getattr(item, 'dim', 'both')
+
+
+class DimensionViews:
+    """Prebuilt per-dimension lists for each kind of level object."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Dict[str, List]] = {}
+        self._active: Dict[str, Dict[str, List]] = {}
+
+    def build(self, kind: str, items: Iterable, value: Optional[Callable[[Any], Any]] = None):
+        """
+        Partition `items` into normal/gema/both and prebuild the active views.
+
+        Args:
+            kind: Name of the view (e.g. 'platforms')
+            items: Source objects, each with a dimension (see dim_of)
+            value: Optional mapping applied to every stored item (e.g. p -> p['rect'])
+        """
+        buckets = {name: [] for name in BUCKETS}
+        for item in items:
+            buckets[dim_of(item)].append(value(item) if value else item)
+        self._buckets[kind] = buckets
+
+        # Keep scan order inside each view: both-dimension items come last
+        self._active[kind] = {dim: buckets[dim] + buckets['both'] for dim in DIMENSIONS}
+
+    def active(self, kind: str, dim: str) -> List:
+        """Items visible in `dim` (dimension bucket + 'both'). Do not mutate."""
+        views = self._active.get(kind)
+        return views[dim] if views else []
+
+    def bucket(self, kind: str, dim: str) -> List:
+        """Raw bucket ('normal', 'gema' or 'both')."""
+        buckets = self._buckets.get(kind)
+        return buckets[dim] if buckets else []
+
+    def clear(self):
+        self._buckets.clear()
+        self._active.clear()
@@ -0,0 +1,756 @@
+"""
+Enemy Batch - Simulasi enemy patrol/chaser dalam bentuk structure-of-arrays (opsional, NumPy).
+Posisi, velocity, arah, batas patrol, state, frame animasi dan timer semua enemy
+disimpan dalam array; logika patrol/chase, gravitasi dan resolusi tile dijalankan
+sebagai operasi vektor per tick. Objek enemy tetap dipakai sebagai proxy tipis:
+class-nya diganti ke subclass yang field-nya dibaca/ditulis dari array, sehingga
+rect/state/draw dan API lain untuk renderer dan gameplay handler tidak berubah.
+Hasilnya identik dengan PatrollingEnemy.update / ChaserEnemy.update.
+"""
+import pygame
+from typing import Dict, Iterable, List, Tuple
+
+from core.collision_grid import CollisionView
+from core.frame_data import frame_data
+from entity.enemy import PatrollingEnemy, ChaserEnemy
+from utils.settings import GRAVITY, ANIMATION_SPEED, JUMP_STRENGTH
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # NumPy is optional; enemies then update one by one
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+KIND_PATROL = 0
+KIND_CHASER = 1
+
+STATES = ('idle', 'run', 'attack', 'combat_idle', 'hurt', 'death')
+STATE_CODES = {name: code for code, name in enumerate(STATES)}
+IDLE, RUN, ATTACK, COMBAT_IDLE, HURT, DEATH = range(len(STATES))
+
+# Chaser timings (ms), same as ChaserEnemy.update
+DYING_REMOVE_MS = 5000
+DEATH_REMOVE_MS = 1500
+
+GROUND_AHEAD_PX = 6
+
+# attribute -> (column, default); columns hold the runtime state of every adopted enemy
+FIELD_COLUMNS = {
+    'state': ('state', 'idle'),
+    'direction': ('direction', 1),
+    'frame_index': ('frame', 0),
+    'animation_timer': ('timer', 0),
+    'animation_finished': ('finished', False),
+    'is_on_ground': ('on_ground', True),
+    'is_alive': ('alive', True),
+    'is_dying': ('dying', False),
+    'alerted': ('alerted', False),
+    'player_nearby': ('nearby', True),
+    'permanent_idle': ('perm_idle', False),
+    'permanent_combat_idle': ('perm_combat_idle', False),
+    '_idle_locked': ('idle_locked', False),
+    '_idle_until_ms': ('idle_until', 0),
+    '_combat_idle_until_ms': ('combat_idle_until', 0),
+    '_landed_hit_this_attack': ('landed', False),
+    'remove_at_ms': ('remove_at', 0),
+    '_nav_direction': ('nav_dir', 0),
+}
+
+COLUMN_TYPES = {
+    'kind': 'int8', 'state': 'int8', 'direction': 'int64', 'frame': 'int64', 'timer': 'int64',
+    'finished': 'bool', 'on_ground': 'bool', 'alive': 'bool', 'dying': 'bool', 'alerted': 'bool',
+    'nearby': 'bool', 'perm_idle': 'bool', 'perm_combat_idle': 'bool', 'idle_locked': 'bool',
+    'idle_until': 'int64', 'combat_idle_until': 'int64', 'landed': 'bool', 'remove_at': 'int64',
+    'nav_dir': 'int64',
+    'vx': 'float64', 'vy': 'float64', 'img_state': 'int8', 'img_frame': 'int64',
+    # Static per enemy (copied from the object on adopt/reload)
+    'w': 'int64', 'h': 'int64', 'speed': 'float64', 'left_bound': 'float64', 'right_bound': 'float64',
+    'detect_x': 'float64', 'detect_y': 'float64', 'attack_x': 'float64', 'attack_tol': 'float64',
+    'combat_idle_ms': 'int64', 'hit_mask': 'int64',
+}
+
+
+# Proxies
+def _column_property(attribute: str, column: str):
+    def fget(self):
+        return self._batch.columns[column][self._batch_row].item()
+
+    def fset(self, value):
+        self._batch.columns[column][self._batch_row] = value
+
+    return property(fget, fset, doc=f"`{attribute}`, stored in the batch column '{column}'")
+
+
+def _state_property():
+    def fget(self):
+        return STATES[self._batch.columns['state'][self._batch_row]]
+
+    def fset(self, value):
+        self._batch.columns['state'][self._batch_row] = STATE_CODES[value]
+
+    return property(fget, fset, doc="Animation/AI state name, stored as a code in the batch")
+
+
+class _BatchVelocity:
+    """Vector2-like view of one enemy's (vx, vy) columns."""
+    __slots__ = ('_batch', '_row')
+
+    def __init__(self, batch: 'EnemyBatch', row: int):
+        self._batch = batch
+        self._row = row
+
+    @property
+    def x(self) -> float:
+        return self._batch.columns['vx'][self._row].item()
+
+    @x.setter
+    def x(self, value: float):
+        self._batch.columns['vx'][self._row] = value
+
+    @property
+    def y(self) -> float:
+        return self._batch.columns['vy'][self._row].item()
+
+    @y.setter
+    def y(self, value: float):
+        self._batch.columns['vy'][self._row] = value
+
+    def __repr__(self):
+        return f"<BatchVelocity({self.x}, {self.y})>"
+
+
+class BatchedEnemyMixin:
+    """
+    Field runtime enemy dibaca/ditulis dari kolom EnemyBatch.
+    Method bawaan (draw, get_block_rect, on_player_contact, ...) tetap dipakai apa adanya.
+    """
+
+    @property
+    def velocity(self) -> _BatchVelocity:
+        return _BatchVelocity(self._batch, self._batch_row)
+
+    @velocity.setter
+    def velocity(self, value):
+        self._batch.columns['vx'][self._batch_row] = value.x
+        self._batch.columns['vy'][self._batch_row] = value.y
+
+    @property
+    def image(self) -> pygame.Surface:
+        columns = self._batch.columns
+        state = columns['img_state'][self._batch_row]
+        if state < 0:
+            return self._batch_image
+        return self.animations[STATES[state]][columns['img_frame'][self._batch_row]]
+
+    @image.setter
+    def image(self, value: pygame.Surface):
+        self.__dict__['_batch_image'] = value
+        self._batch.columns['img_state'][self._batch_row] = -1
+
+    def update(self, platforms: CollisionView, player=None):
+        self._batch.step([self], platforms, player)
+
+    def catch_up(self, ticks: int):
+        self._batch.catch_up(self._batch_row, ticks)
+
+
+for _attribute, (_column, _) in FIELD_COLUMNS.items():
+    setattr(BatchedEnemyMixin, _attribute,
+            _state_property() if _attribute == 'state' else _column_property(_attribute, _column))
+
+
+class BatchedPatrollingEnemy(BatchedEnemyMixin, PatrollingEnemy):
+    """PatrollingEnemy whose runtime state lives in an EnemyBatch."""
+
+
+class BatchedChaserEnemy(BatchedEnemyMixin, ChaserEnemy):
+    """ChaserEnemy whose runtime state lives in an EnemyBatch."""
+
+
+BATCHED_CLASSES = {PatrollingEnemy: BatchedPatrollingEnemy, ChaserEnemy: BatchedChaserEnemy}
+
+
+# Tile world as dense arrays
+class _TileField:
+    """
+    Solid cells of one CollisionView as dense arrays (solid, top, bottom).
+    `regular` is False when a cell is not a single full-width solid inside its cell;
+    the batch then falls back to CollisionView.move_x/move_y for physics.
+    """
+
+    def __init__(self, view: CollisionView):
+        ts = view.grid.tile_size
+        self.tile_size = ts
+        cells = list(view.solid_cells())
+        self.regular = True
+        if not cells:
+            self.col0 = self.row0 = 0
+            self.solid = np.zeros((1, 1), dtype=bool)
+            self.top = np.zeros((1, 1), dtype=np.int64)
+            self.bottom = np.zeros((1, 1), dtype=np.int64)
+            return
+
+        cols = [c for c, _, _ in cells]
+        rows = [r for _, r, _ in cells]
+        self.col0, self.row0 = min(cols), min(rows)
+        shape = (max(rows) - self.row0 + 1, max(cols) - self.col0 + 1)
+        self.solid = np.zeros(shape, dtype=bool)
+        self.top = np.zeros(shape, dtype=np.int64)
+        self.bottom = np.zeros(shape, dtype=np.int64)
+        for col, row, rect in cells:
+            r, c = row - self.row0, col - self.col0
+            if self.solid[r, c] or rect.left != col * ts or rect.right != (col + 1) * ts \
+                    or rect.top < row * ts or rect.bottom > (row + 1) * ts:
+                self.regular = False
+            self.solid[r, c] = True
+            self.top[r, c] = rect.top
+            self.bottom[r, c] = rect.bottom
+
+    def lookup(self, rows, cols):
+        """(solid, top, bottom) per (row, col); cells outside the level are empty."""
+        n_rows, n_cols = self.solid.shape
+        r = rows - self.row0
+        c = cols - self.col0
+        inside = (r >= 0) & (r < n_rows) & (c >= 0) & (c < n_cols)
+        r = np.clip(r, 0, n_rows - 1)
+        c = np.clip(c, 0, n_cols - 1)
+        return self.solid[r, c] & inside, self.top[r, c], self.bottom[r, c]
+
+    def overlaps(self, x, y, w, h):
+        """True where rect (x, y, w, h) strictly overlaps a solid."""
+        ts = self.tile_size
+        c0, c1 = x // ts, (x + w - 1) // ts
+        r0, r1 = y // ts, (y + h - 1) // ts
+        found = np.zeros(len(x), dtype=bool)
+        if not len(x):
+            return found
+        for dr in range(int((r1 - r0).max()) + 1):
+            for dc in range(int((c1 - c0).max()) + 1):
+                row, col = r0 + dr, c0 + dc
+                solid, top, bottom = self.lookup(row, col)
+                found |= solid & (row <= r1) & (col <= c1) & (top < y + h) & (bottom > y)
+        return found
+
+    def column_hits(self, col, y, h):
+        """True where tile column `col` has a solid overlapping the band [y, y + h)."""
+        ts = self.tile_size
+        r0, r1 = y // ts, (y + h - 1) // ts
+        found = np.zeros(len(col), dtype=bool)
+        for dr in range(int((r1 - r0).max()) + 1):
+            row = r0 + dr
+            solid, top, bottom = self.lookup(row, col)
+            found |= solid & (row <= r1) & (top < y + h) & (bottom > y)
+        return found
+
+
+class EnemyBatch:
+    """
+    Structure-of-arrays engine untuk PatrollingEnemy dan ChaserEnemy.
+
+    adopt(enemies) memindahkan state runtime ke kolom dan mengganti class objek
+    menjadi proxy; step(proxies, platforms, player) menjalankan satu tick untuk
+    semua proxy sekaligus. Field yang di-set lewat proxy (mis. reset respawn
+    oleh RuntimeStateTable) langsung ditulis ke kolom.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.count = 0
+        self.columns: Dict[str, 'np.ndarray'] = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMN_TYPES.items()
+        }
+        self.frame_counts = np.zeros((capacity, len(STATES)), dtype=np.int64)
+        self.non_looping = np.zeros((capacity, len(STATES)), dtype=bool)
+        self._rows: Dict[object, int] = {}
+        self._fields: Dict[Tuple[int, int], _TileField] = {}
+
+        # Chaser contact/hazard boxes per facing (Enemy.get_block_rect, ChaserEnemy.get_hazard_rect);
+        # the attack hitbox is the same on every attack frame
+        chaser = frame_data('chaser')
+        self._block_box = chaser.boxes['block']
+        self._attack_box = chaser.frame('attack', 0).hitbox
+
+        # Stats of the last step (F3 overlay / profiling)
+        self.stepped = 0
+        self.fallbacks = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    # Adoption
+    def _grow(self, needed: int):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        if capacity == self.capacity:
+            return
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+        for attr in ('frame_counts', 'non_looping'):
+            old = getattr(self, attr)
+            grown = np.zeros((capacity, len(STATES)), dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, attr, grown)
+        self.capacity = capacity
+
+    def adopt(self, enemies: Iterable) -> int:
+        """
+        Move plain PatrollingEnemy/ChaserEnemy objects into the batch (in place).
+        Returns how many were adopted; others are left untouched.
+        """
+        new = [e for e in enemies if type(e) in BATCHED_CLASSES]
+        if not new:
+            return 0
+        self._grow(self.count + len(new))
+        for enemy in new:
+            row = self.count
+            self.count += 1
+            self._rows[enemy] = row
+            fields = vars(enemy)
+            fields['_batch'] = self
+            fields['_batch_row'] = row
+            enemy.__class__ = BATCHED_CLASSES[type(enemy)]
+            self.columns['kind'][row] = KIND_CHASER if isinstance(enemy, ChaserEnemy) else KIND_PATROL
+            self.columns['img_state'][row] = -1
+            for attribute, (column, default) in FIELD_COLUMNS.items():
+                if attribute not in fields:
+                    fields[attribute] = default
+            self._load_fields(enemy)
+        return len(new)
+
+    def _load_fields(self, enemy):
+        fields = vars(enemy)
+        row = fields['_batch_row']
+        columns = self.columns
+        for attribute, (column, _) in FIELD_COLUMNS.items():
+            if attribute in fields:
+                value = fields.pop(attribute)
+                columns[column][row] = STATE_CODES[value] if attribute == 'state' else value
+        velocity = fields.pop('velocity', None)
+        if velocity is not None:
+            columns['vx'][row] = velocity.x
+            columns['vy'][row] = velocity.y
+        if 'image' in fields:
+            fields['_batch_image'] = fields.pop('image')
+            columns['img_state'][row] = -1
+
+        columns['w'][row] = enemy.rect.width
+        columns['h'][row] = enemy.rect.height
+        columns['speed'][row] = enemy.speed
+        if columns['kind'][row] == KIND_PATROL:
+            columns['left_bound'][row] = enemy.left_bound_x
+            columns['right_bound'][row] = enemy.right_bound_x
+        else:
+            columns['detect_x'][row] = enemy.detect_range_x
+            columns['detect_y'][row] = enemy.detect_range_y
+            columns['attack_x'][row] = enemy.attack_range_x
+            columns['attack_tol'][row] = max(enemy.attack_vertical_tolerance, enemy.rect.height // 2)
+            columns['combat_idle_ms'][row] = enemy.combat_idle_duration_ms
+            columns['hit_mask'][row] = sum(1 << f for f in enemy.frame_data.active_frames('attack') if 0 <= f < 63)
+        for code, name in enumerate(STATES):
+            self.frame_counts[row, code] = len(enemy.animations.get(name, []))
+            self.non_looping[row, code] = name in enemy.non_looping_states
+
+    def clear(self):
+        self.count = 0
+        self._rows.clear()
+        self._fields.clear()
+
+    # Simulation
+    def _field(self, platforms: CollisionView) -> _TileField:
+        key = (id(platforms), platforms.grid.version)
+        field = self._fields.get(key)
+        if field is None:
+            self._fields = {k: v for k, v in self._fields.items() if k[1] == key[1]}
+            field = self._fields[key] = _TileField(platforms)
+        return field
+
+    def step(self, proxies: List, platforms: CollisionView, player=None):
+        """Advance `proxies` (adopted enemies) by one tick."""
+        n = len(proxies)
+        self.stepped = n
+        self.fallbacks = 0
+        if not n:
+            return
+        now = pygame.time.get_ticks()
+        cols = self.columns
+        rows = np.fromiter((e._batch_row for e in proxies), dtype=np.int64, count=n)
+        x = np.fromiter((e.rect.x for e in proxies), dtype=np.int64, count=n)
+        y = np.fromiter((e.rect.y for e in proxies), dtype=np.int64, count=n)
+
+        g = {name: cols[name][rows] for name in cols}
+        w, h = g['w'], g['h']
+        kind = g['kind']
+        state = g['state']
+        direction = g['direction']
+        frame = g['frame']
+        finished = g['finished']
+        vx = g['vx']
+        alerted = g['alerted']
+        dying = g['dying']
+        remove_at = g['remove_at']
+        cx = x + w // 2
+        cy = y + h // 2
+        field = self._field(platforms)
+
+        patrol = kind == KIND_PATROL
+        chaser = ~patrol
+
+        # Patrol
+        p_dying = patrol & dying
+        p_perm = patrol & ~dying & g['perm_idle']
+        p_rest = patrol & ~dying & ~g['perm_idle']
+        locked = p_rest & g['idle_locked']
+        holding = locked & (now < g['idle_until'])
+        g['idle_locked'][locked & ~holding] = False
+        moving = p_rest & ~holding
+        turn_left = moving & (direction > 0) & (cx >= g['right_bound'])
+        turn_right = moving & (direction <= 0) & (cx <= g['left_bound'])
+        direction[turn_left] = -1
+        direction[turn_right] = 1
+        state[p_dying] = DEATH
+        state[p_perm | holding] = IDLE
+        state[moving] = RUN
+        vx[p_dying | p_perm | holding] = 0
+        vx[moving] = g['speed'][moving] * direction[moving]
+
+        # Chaser
+        c_dying = chaser & dying
+        entering = c_dying & (state != HURT) & (state != DEATH)
+        has_hurt = self.frame_counts[rows, HURT] > 0
+        state[entering] = np.where(has_hurt[entering], HURT, DEATH)
+        frame[entering] = 0
+        finished[entering] = False
+        remove_at[entering] = now + DYING_REMOVE_MS
+        vx[c_dying] = 0
+
+        c_perm = chaser & ~dying & g['perm_combat_idle']
+        state[c_perm] = COMBAT_IDLE
+        vx[c_perm] = 0
+
+        c_rest = chaser & ~dying & ~g['perm_combat_idle']
+        attacking = c_rest & (state == ATTACK)
+        cooling = c_rest & (state == COMBAT_IDLE)
+        roaming = c_rest & ~attacking & ~cooling
+        if player is not None:
+            pr = player.rect
+            toward = np.where(pr.centerx >= cx, 1, -1)
+            # Contact starts an attack (Enemy.get_block_rect)
+            (bx_r, by, bw, bh), (bx_l, _, _, _) = self._block_box
+            touching = _collide(cx + np.where(direction == 1, bx_r, bx_l), cy + by, bw, bh, pr)
+            contact = c_rest & touching & (state != ATTACK) & (state != COMBAT_IDLE)
+            alerted[contact] = True
+            direction[contact] = toward[contact]
+            state[contact] = ATTACK
+            frame[contact] = 0
+            finished[contact] = False
+            vx[contact] = 0
+            roaming &= ~contact
+
+            # Attack hit lands while a hit frame is showing (ChaserEnemy.get_hazard_rect)
+            hit_frame = (frame >= 0) & (frame < 63) & (((g['hit_mask'] >> np.clip(frame, 0, 62)) & 1) == 1)
+            (hx_r, hy, hw, hh), (hx_l, _, _, _) = self._attack_box
+            hx = cx + np.where(direction == 1, hx_r, hx_l)
+            g['landed'][attacking & hit_frame & _collide(hx, cy + hy, hw, hh, pr)] = True
+
+            # Detection
+            nearby = g['nearby']
+            dx = np.abs(pr.centerx - cx)
+            in_proximity = nearby & (dx <= g['detect_x']) & (pr.bottom - y <= g['detect_y'])
+            jumped_over = nearby & (pr.bottom < y) & (dx <= np.maximum(24, w // 2 + 10))
+            noticing = roaming & ~alerted & (in_proximity | jumped_over)
+            alerted[noticing] = True
+            chasing = roaming & alerted
+
+            # Mid-air on a nav link: keep the run-up speed (ChaserEnemy.update)
+            nav_dir = g['nav_dir']
+            flying = chasing & (nav_dir != 0) & ~g['on_ground']
+            vx[flying] = g['speed'][flying] * nav_dir[flying]
+            chasing &= ~flying
+            nav_dir[chasing] = 0
+            direction[chasing] = toward[chasing]
+            links = self._routes(platforms, x, y, w, h, chasing, pr)
+            for i, link in links.items():
+                direction[i] = link.direction
+
+            in_range = chasing & (dx <= g['attack_x']) & (np.abs(pr.centery - cy) <= g['attack_tol'])
+            state[in_range] = ATTACK
+            frame[in_range] = 0
+            finished[in_range] = False
+            vx[in_range] = 0
+            advancing = chasing & ~in_range
+            ground = self._ground_ahead(field, platforms, x, y, w, h, direction, advancing)
+            go = advancing & ground
+            vx[go] = g['speed'][go] * direction[go]
+            stop = advancing & ~ground
+            for i, link in links.items():
+                if stop[i]:
+                    stop[i] = False
+                    vx[i] = g['speed'][i] * direction[i]
+                    nav_dir[i] = direction[i]
+                    if link.kind == 'jump':
+                        g['vy'][i] = -JUMP_STRENGTH
+            vx[stop] = 0
+            state[stop] = IDLE
+            alerted[stop] = False
+            frame[stop] = 0
+            vx[roaming & ~alerted] = 0
+        else:
+            vx[roaming] = 0
+        vx[attacking | cooling] = 0
+
+        # Physics (Entity.update_physics) and animation (Entity.animate)
+        x, y = self._physics(field, platforms, x, y, g)
+        self._animate(g, rows)
+
+        # Transitions after the step
+        to_death = c_dying & (state == HURT) & finished
+        state[to_death] = DEATH
+        frame[to_death] = 0
+        finished[to_death] = False
+        remove_at[to_death] = now + DEATH_REMOVE_MS
+
+        done = attacking & finished
+        landed = g['landed']
+        to_cool = done & landed
+        state[to_cool] = COMBAT_IDLE
+        frame[to_cool] = 0
+        finished[to_cool] = False
+        g['combat_idle_until'][to_cool] = now + g['combat_idle_ms'][to_cool]
+        back = (done & ~landed) | (cooling & (now >= g['combat_idle_until']))
+        state[back] = np.where(alerted[back], RUN, IDLE)
+        landed[done] = False
+
+        for name, values in g.items():
+            cols[name][rows] = values
+        for enemy, new_x, new_y in zip(proxies, x.tolist(), y.tolist()):
+            rect = enemy.rect
+            rect.x = new_x
+            rect.y = new_y
+
+    def _routes(self, platforms: CollisionView, x, y, w, h, mask, target: pygame.Rect) -> Dict[int, object]:
+        """NavLayer.route for the masked chasers: {index: link} where one leads to the player's span."""
+        nav = platforms.nav
+        links = {}
+        if nav is None:
+            return links
+        for i in np.flatnonzero(mask):
+            link = nav.route(pygame.Rect(int(x[i]), int(y[i]), int(w[i]), int(h[i])), target)
+            if link is not None:
+                links[int(i)] = link
+        return links
+
+    def _ground_ahead(self, field: _TileField, platforms: CollisionView, x, y, w, h, direction, mask):
+        """Enemy._has_ground_ahead for the masked enemies (probe just past the front foot)."""
+        ground = np.zeros(len(x), dtype=bool)
+        if not mask.any():
+            return ground
+        nav = platforms.nav
+        if nav is not None:
+            for i in np.flatnonzero(mask):
+                body = pygame.Rect(int(x[i]), int(y[i]), int(w[i]), int(h[i]))
+                ground[i] = nav.ground_ahead(body, int(direction[i]), GROUND_AHEAD_PX)
+            return ground
+        front = x + w // 2 + direction * (w // 2 + GROUND_AHEAD_PX)
+        bottom = y + h
+        if field.regular:
+            ground[mask] = field.overlaps(front[mask], bottom[mask] + 1,
+                                          np.full(int(mask.sum()), 2), np.full(int(mask.sum()), 3))
+        else:
+            for i in np.flatnonzero(mask):
+                ground[i] = platforms.any_solid(pygame.Rect(int(front[i]), int(bottom[i]) + 1, 2, 3))
+        return ground
+
+    def _physics(self, field: _TileField, platforms: CollisionView, x, y, g):
+        """Swept moves as in CollisionView.move_x / move_y; embedded bodies use the scalar path."""
+        w, h = g['w'], g['h']
+        vx, vy = g['vx'], g['vy']
+        alive = g['alive']
+        vx[~alive] = 0
+        vy += GRAVITY
+
+        if not field.regular:
+            for i in range(len(x)):
+                rect = pygame.Rect(int(x[i]), int(y[i]), int(w[i]), int(h[i]))
+                if alive[i]:
+                    platforms.move_x(rect, float(vx[i]))
+                    hit = platforms.move_y(rect, float(vy[i]))
+                    g['on_ground'][i] = bool(hit) and hit.normal[1] < 0
+                    if hit:
+                        vy[i] = 0
+                elif vy[i] > 0:
+                    if platforms.move_y(rect, float(vy[i])):
+                        vy[i] = 0
+                else:
+                    rect.y += float(vy[i])
+                x[i], y[i] = rect.x, rect.y
+            self.fallbacks = len(x)
+            return x, y
+
+        # Horizontal (alive only)
+        new_x = _sweep_x(field, x, y, w, h, np.where(alive, vx, 0.0))
+        stuck = alive & (vx != 0) & field.overlaps(new_x, y, w, h)
+        for i in np.flatnonzero(stuck):
+            rect = pygame.Rect(int(x[i]), int(y[i]), int(w[i]), int(h[i]))
+            platforms.move_x(rect, float(vx[i]))
+            new_x[i] = rect.x
+        x = new_x
+
+        # Vertical (dead bodies only collide while falling)
+        collide = alive | (vy > 0)
+        new_y, down, up = _sweep_y(field, x, y, w, h, vy, collide)
+        stuck_y = collide & (vy != 0) & field.overlaps(x, new_y, w, h)
+        for i in np.flatnonzero(stuck_y):
+            rect = pygame.Rect(int(x[i]), int(y[i]), int(w[i]), int(h[i]))
+            hit = platforms.move_y(rect, float(vy[i]))
+            new_y[i] = rect.y
+            down[i] = bool(hit) and hit.normal[1] < 0
+            up[i] = bool(hit) and hit.normal[1] > 0
+        self.fallbacks = int(stuck.sum() + stuck_y.sum())
+
+        hit = down | up
+        vy[hit] = 0
+        g['on_ground'][alive] = down[alive]
+        return x, new_y
+
+    def _animate(self, g, rows):
+        """Entity.animate for every stepped enemy (ChaserEnemy.compute_state applied first)."""
+        state = g['state']
+        chaser = g['kind'] == KIND_CHASER
+        fading = chaser & (g['dying'] | ~g['alive'])
+        state[fading & (state != HURT) & (state != DEATH)] = DEATH
+        steady = chaser & ~fading & (state != ATTACK) & (state != COMBAT_IDLE)
+        state[steady] = np.where(g['alerted'][steady], RUN, IDLE)
+
+        timer = g['timer']
+        timer += 1
+        advance = timer > ANIMATION_SPEED
+        timer[advance] = 0
+        frame = g['frame']
+        counts = self.frame_counts[rows, state]
+        once = self.non_looping[rows, state]
+        stepping = advance & once & (frame < np.maximum(0, counts - 1))
+        frame[stepping] += 1
+        g['finished'][advance & once & ~stepping] = True
+        looping = advance & ~once & (counts > 0)
+        frame[looping] = (frame[looping] + 1) % counts[looping]
+        shown = advance & (counts > 0)
+        g['img_state'][shown] = state[shown]
+        g['img_frame'][shown] = frame[shown]
+
+    def catch_up(self, row: int, ticks: int):
+        """Entity.catch_up on the columns of one enemy."""
+        cols = self.columns
+        period = ANIMATION_SPEED + 1
+        total = int(cols['timer'][row]) + ticks
+        steps = total // period
+        cols['timer'][row] = total % period
+        state = int(cols['state'][row])
+        count = int(self.frame_counts[row, state])
+        if not steps or not count:
+            return
+        frame = int(cols['frame'][row])
+        if self.non_looping[row, state]:
+            last = count - 1
+            if steps > last - frame:
+                cols['finished'][row] = True
+            frame = min(last, frame + steps)
+        else:
+            frame = (frame + steps) % count
+        cols['frame'][row] = frame
+        cols['img_state'][row] = state
+        cols['img_frame'][row] = frame
+
+
+def _collide(x, y, w, h, rect: pygame.Rect):
+    """pygame.Rect.colliderect of boxes (x, y, w, h) against one rect."""
+    return (x < rect.right) & (rect.left < x + w) & (y < rect.bottom) & (rect.top < y + h)
+
+
+def _rect_round(value):
+    """Rect coordinates round floats like pygame (half up)."""
+    return np.floor(value + 0.5).astype(np.int64)
+
+
+def _sweep_x(field: _TileField, x, y, w, h, vx):
+    """Horizontal swept move against full-width tile solids; stops flush at the first wall."""
+    ts = field.tile_size
+    target = _rect_round(x + vx)
+    dx = target - x
+    result = target.copy()
+    right = x + w
+    forward = dx > 0
+    backward = dx < 0
+    moving = forward | backward
+    if not moving.any():
+        return result
+
+    # Columns between the old and new leading edge, nearest first
+    start = np.where(forward, right // ts, (x - 1) // ts)
+    end = np.where(forward, (target + w - 1) // ts, target // ts)
+    span = np.where(moving, np.abs(end - start), -1)
+    found = np.zeros(len(x), dtype=bool)
+    for k in range(int(span.max()) + 1):
+        col = np.where(forward, start + k, start - k)
+        left_edge = col * ts
+        right_edge = left_edge + ts
+        ahead = np.where(forward,
+                         (left_edge >= right) & (left_edge < target + w),
+                         (right_edge <= x) & (right_edge > target))
+        hit = moving & ~found & (k <= span) & ahead & field.column_hits(col, y, h)
+        result[hit & forward] = left_edge[hit & forward] - w[hit & forward]
+        result[hit & backward] = right_edge[hit & backward]
+        found |= hit
+    return result
+
+
+def _sweep_y(field: _TileField, x, y, w, h, vy, collide):
+    """
+    Vertical swept move. Returns (new y, landed, hit ceiling).
+    Bodies not in `collide` move without collision.
+    """
+    ts = field.tile_size
+    target = _rect_round(y + vy)
+    dy = target - y
+    result = target.copy()
+    down = np.zeros(len(y), dtype=bool)
+    up = np.zeros(len(y), dtype=bool)
+    falling = collide & (dy > 0)
+    rising = collide & (dy < 0)
+    moving = falling | rising
+    if not moving.any():
+        return result, down, up
+
+    bottom = y + h
+    c0, c1 = x // ts, (x + w - 1) // ts
+    start = np.where(falling, (bottom - 1) // ts, (y - 1) // ts)
+    end = np.where(falling, (target + h - 1) // ts, target // ts - 1)
+    span = np.where(moving, np.abs(end - start), -1)
+    found = np.zeros(len(y), dtype=bool)
+    for k in range(int(span.max()) + 1):
+        row = np.where(falling, start + k, start - k)
+        best_top = np.full(len(y), np.iinfo(np.int64).max)
+        best_bottom = np.full(len(y), np.iinfo(np.int64).min)
+        any_hit = np.zeros(len(y), dtype=bool)
+        for dc in range(int((c1 - c0).max()) + 1):
+            col = c0 + dc
+            solid, top, bot = field.lookup(row, col)
+            ahead = np.where(falling,
+                             (top >= bottom) & (top < target + h),
+                             (bot <= y) & (bot > target))
+            hit = moving & ~found & (k <= span) & (col <= c1) & solid & ahead
+            best_top = np.where(hit, np.minimum(best_top, top), best_top)
+            best_bottom = np.where(hit, np.maximum(best_bottom, bot), best_bottom)
+            any_hit |= hit
+        land = any_hit & falling
+        bump = any_hit & rising
+        result[land] = best_top[land] - h[land]
+        result[bump] = best_bottom[bump]
+        down |= land
+        up |= bump
+        found |= any_hit
+    return result, down, up
@@ -5,6 +5,7 @@ Menggunakan Encapsulation dengan protected/private attributes.
 import pygame
 from typing import Dict, List, Optional
 from utils.settings import GRAVITY, ANIMATION_SPEED
+from core.collision_grid import CollisionView, EMPTY_VIEW
 from core.interfaces import (
     IDrawable, IUpdatable, ICollidable, 
     IPhysicsBody, IAnimatable
@@ -142,7 +143,7 @@ class Entity(IDrawable, IUpdatable, ICollidable, IPhysicsBody, IAnimatable):
         """Set velocity vector."""
         self._velocity = velocity
     
-    def apply_physics(self, platforms: List[pygame.Rect]) -> None:
+    def apply_physics(self, platforms: CollisionView) -> None:
         """
         Apply physics (gravity, platform collision).
         Override method untuk custom physics.
@@ -150,36 +151,23 @@ class Entity(IDrawable, IUpdatable, ICollidable, IPhysicsBody, IAnimatable):
         if not self._is_alive:
             self._velocity.x = 0
             self._velocity.y += GRAVITY
-            self._rect.y += self._velocity.y
-            for platform in platforms:
-                if self._rect.colliderect(platform) and self._velocity.y > 0:
-                    self._rect.bottom = platform.top
+            if self._velocity.y > 0:
+                if platforms.move_y(self._rect, self._velocity.y):
                     self._velocity.y = 0
+            else:
+                self._rect.y += self._velocity.y
             return
         
-        # Horizontal movement
-        self._rect.x += self._velocity.x
-        for platform in platforms:
-            if self._rect.colliderect(platform):
-                if self._velocity.x > 0:
-                    self._rect.right = platform.left
-                elif self._velocity.x < 0:
-                    self._rect.left = platform.right
+        # Horizontal movement (swept, stops flush at walls)
+        platforms.move_x(self._rect, self._velocity.x)
         
         # Vertical movement dengan gravity
         self._velocity.y += GRAVITY
-        self._rect.y += self._velocity.y
         self._is_on_ground = False
-        
-        for platform in platforms:
-            if self._rect.colliderect(platform):
-                if self._velocity.y > 0:
-                    self._rect.bottom = platform.top
-                    self._velocity.y = 0
-                    self._is_on_ground = True
-                elif self._velocity.y < 0:
-                    self._rect.top = platform.bottom
-                    self._velocity.y = 0
+        hit = platforms.move_y(self._rect, self._velocity.y)
+        if hit:
+            self._velocity.y = 0
+            self._is_on_ground = hit.normal[1] < 0
     
     # IAnimatable implementation
     def set_animation_state(self, state: str) -> None:
@@ -232,7 +220,7 @@ class Entity(IDrawable, IUpdatable, ICollidable, IPhysicsBody, IAnimatable):
         Update entity state. Default implementation calls physics and animation.
         Override untuk custom update logic.
         """
-        platforms = kwargs.get('platforms', [])
+        platforms = kwargs.get('platforms', EMPTY_VIEW)
         self.apply_physics(platforms)
         self.animate()
     
@@ -240,7 +228,7 @@ class Entity(IDrawable, IUpdatable, ICollidable, IPhysicsBody, IAnimatable):
         """Check if entity masih hidup."""
         return self._is_alive
     
-    def step(self, platforms: List[pygame.Rect]) -> None:
+    def step(self, platforms: CollisionView) -> None:
         """Legacy method untuk backward compatibility."""
         self.apply_physics(platforms)
         self.animate()
@@ -3,12 +3,42 @@ Entity Manager - Mengelola entities (player, enemies, NPCs).
 Centralized management untuk semua game entities.
 """
 import pygame
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
 from entity.player import Player
 from entity.enemy import PatrollingEnemy, ChaserEnemy
 from entity.boss import Boss
 from entity.npc import NPC
 from environment.campfire import Campfire
+from core.snapshot import RuntimeStateTable
+from core.collision_grid import CollisionView
+from core.spatial_hash import SpatialHash
+from core.activation import ActivationRegion
+from core.hazard_registry import HazardRegistry
+from core.enemy_batch import EnemyBatch, BatchedEnemyMixin, NUMPY_AVAILABLE
+from core.dimension_views import dim_of
+from utils.settings import ACTIVATION_MARGIN, ENEMY_BATCH, ENEMY_BATCH_MIN_ENEMIES
+
+
+ENEMY_KINDS = ('patrol', 'chaser', 'boss')
+
+# Hazard, block, wall and melee rects of every enemy stay within this many px of its rect
+ENTITY_REACH = 64
+
+# Widest AI detection (Boss: 200 px horizontally, 100 px vertically between centers)
+AI_DETECT_RANGE_X = 200
+AI_DETECT_RANGE_Y = 100
+
+
+def entity_kind(entity) -> str:
+    """Kind used for spatial queries."""
+    if isinstance(entity, Boss):
+        return 'boss'
+    if isinstance(entity, ChaserEnemy):
+        return 'chaser'
+    if isinstance(entity, NPC):
+        return 'npc'
+    return 'patrol'
 
 
 class EntityManager:
@@ -24,6 +54,30 @@ class EntityManager:
         self.enemy_spawns: List[Dict] = []
         self.start_pos: tuple = (100, 100)
         
+        # Enemies in spawn order and their spawn-time runtime fields, one table per
+        # enemy class (STATE_FIELDS) - respawn resets these instead of rebuilding
+        self.spawned_enemies: List = []
+        self.enemy_snapshots: Dict[type, RuntimeStateTable] = {}
+        
+        # Enemies and NPCs bucketed by position (see refresh_spatial)
+        self.spatial = SpatialHash()
+        self._near_player: set = set()
+        
+        # Only enemies/NPCs near the viewport are updated (see update_activation)
+        self.activation = ActivationRegion(ACTIVATION_MARGIN)
+        self.awake_enemies: List = []
+        self.awake_npcs: set = set()
+        
+        # Patrol/chaser enemies simulated as arrays in crowded levels (see prepare_enemy_batch)
+        self.enemy_batch = EnemyBatch() if ENEMY_BATCH and NUMPY_AVAILABLE else None
+        self.batch_min_enemies = ENEMY_BATCH_MIN_ENEMIES
+        
+        # Typed hazard/block/body providers, registered at spawn (see GameplayHandler)
+        self.hazards = HazardRegistry()
+        
+        # Per-frame submitted/culled counts of draw_all, for the F3 overlay
+        self.cull_counts: Dict[str, Tuple[int, int]] = {}
+        
     def create_player(self, x: float, y: float) -> Player:
         """Create player at position."""
         self.player = Player(x, y)
@@ -56,6 +110,13 @@ class EntityManager:
         
         if enemy:
             self.enemies.append(enemy)
+            self.hazards.register(enemy)
+            self.spawned_enemies.append(enemy)
+            table = self.enemy_snapshots.get(type(enemy))
+            if table is None:
+                self.enemy_snapshots[type(enemy)] = RuntimeStateTable([enemy], enemy.STATE_FIELDS)
+            else:
+                table.add(enemy)
             
             # Store spawn info for respawning
             self.enemy_spawns.append({
@@ -70,9 +131,25 @@ class EntityManager:
         return enemy
     
     def respawn_all_enemies(self):
-        """Respawn all enemies from spawn data."""
+        """Respawn all enemies (reset to their spawn-time state, or rebuild from spawn data)."""
         print(f"[DEBUG] Respawning {len(self.enemy_spawns)} enemies")
+        self.activation.reset()
+        if self.enemy_snapshots:
+            # Same objects, runtime fields reset - no sprite reloading (batched
+            # enemies take the values straight into their columns)
+            for table in self.enemy_snapshots.values():
+                table.restore()
+            self.enemies = list(self.spawned_enemies)
+            self.hazards.reset(self.enemies)
+            self.refresh_spatial()
+            print(f"[DEBUG] Enemies respawned - total: {len(self.enemies)}")
+            return
+        
         self.enemies.clear()
+        self.spawned_enemies.clear()
+        self.hazards.clear()
+        if self.enemy_batch:
+            self.enemy_batch.clear()
         
         # Store enemy_spawns temporarily to avoid duplication during add_enemy
         spawns_copy = list(self.enemy_spawns)
@@ -86,6 +163,7 @@ class EntityManager:
                 spawn_info.get('left_bound'),
                 spawn_info.get('right_bound')
             )
+        self.refresh_spatial()
         print(f"[DEBUG] Enemies respawned - total: {len(self.enemies)}")
     
     def add_npc(self, npc: NPC):
@@ -96,44 +174,110 @@ class EntityManager:
         """Add campfire to manager."""
         self.campfires.append(campfire)
     
-    def update_all(self, active_platforms: List[pygame.Rect], dt: float = 1.0):
+    def update_all(self, active_platforms: CollisionView, dt: float = 1.0):
         """Update all entities."""
         # Update player
         if self.player and self.player.is_alive:
             self.player.update(active_platforms)
         
         # Update enemies
+        self.refresh_spatial()
+        if self.player:
+            self.update_player_proximity()
         for enemy in self.enemies:
             enemy.update(active_platforms, self.player)
+        self.refresh_spatial()
         
         # Update NPCs (filter by dimension)
         if self.player:
-            current_dim = 'gema' if self.player.in_gema_dimension else 'normal'
+            current_dim = self.player.dimension
+            near = set(self.npcs_near(*self.player.rect.center, NPC.WATCH_DISTANCE, current_dim))
             for npc in self.npcs:
                 if getattr(npc, 'dim', 'both') in (current_dim, 'both'):
-                    npc.update(self.player.rect)
+                    npc.update(self.player.rect, npc in near)
+    
+    def prepare_enemy_batch(self):
+        """
+        Move patrol/chaser enemies into the batch engine once the level has at least
+        `batch_min_enemies` of them (below that per-object updates are cheaper).
+        Call after the enemy list changed; already batched enemies are skipped.
+        """
+        batch = self.enemy_batch
+        if batch is None:
+            return
+        if not len(batch):
+            candidates = sum(1 for e in self.enemies if isinstance(e, (PatrollingEnemy, ChaserEnemy)))
+            if candidates < self.batch_min_enemies:
+                return
+        adopted = batch.adopt(self.enemies)
+        if adopted:
+            print(f"[DEBUG] Enemy batch: {adopted} enemies adopted ({len(batch)} total)")
     
-    def draw_all(self, surface: pygame.Surface, offset_x: float, offset_y: float):
-        """Draw all entities."""
+    def update_enemies(self, active_platforms: CollisionView, player: Optional[Player]):
+        """Update awake enemies; batched ones advance together in one vectorised step."""
+        batch = self.enemy_batch
+        if batch is None or not len(batch):
+            for enemy in self.awake_enemies:
+                enemy.update(active_platforms, player)
+            return
+        batched = []
+        for enemy in self.awake_enemies:
+            if isinstance(enemy, BatchedEnemyMixin):
+                batched.append(enemy)
+            else:
+                enemy.update(active_platforms, player)
+        batch.step(batched, active_platforms, player)
+    
+    def draw_all(self, surface: pygame.Surface, offset_x: float, offset_y: float,
+                 npcs: Optional[List[NPC]] = None, view_span: Optional[Tuple[float, float]] = None):
+        """
+        Draw all entities.
+        `npcs` is the prebuilt list for the player's dimension; when omitted
+        NPCs are filtered here. With `view_span` (world x range) only enemies,
+        spells and NPCs overlapping it are drawn; enemy and NPC candidates come
+        from the spatial hash.
+        """
         # Draw campfires first (background)
         for campfire in self.campfires:
             campfire.draw(surface, offset_x, offset_y, [])  # Frames passed separately
         
+        if npcs is None:
+            current_dim = self.player.dimension if self.player else None
+            npcs = [npc for npc in self.npcs
+                    if current_dim and getattr(npc, 'dim', 'both') in (current_dim, 'both')]
+        
+        enemies = self.enemies
+        if view_span is not None:
+            left, right = view_span
+            # Hashed rects lag the drawn (interpolated) ones by at most a tick, well inside ENTITY_REACH
+            area = pygame.Rect(int(left), -(1 << 20), int(right - left) + 1, 1 << 21)
+            enemies = [e for e in self.spatial.query_rect(area, ENEMY_KINDS)
+                       if e.rect.right > left and e.rect.left < right]
+            near_npcs = set(self.spatial.query_rect(area, 'npc'))
+            # View order (both-dimension NPCs last) is the draw order
+            visible_npcs = [npc for npc in npcs
+                            if npc in near_npcs and npc.rect.right > left and npc.rect.left < right]
+            self.cull_counts['enemies'] = (len(enemies), len(self.enemies) - len(enemies))
+            self.cull_counts['npcs'] = (len(visible_npcs), len(npcs) - len(visible_npcs))
+            npcs = visible_npcs
+        
         # Draw enemies
-        for enemy in self.enemies:
+        for enemy in enemies:
             enemy.draw(surface, offset_x, offset_y)
         
-        # Draw boss spells (if any)
-        for enemy in self.enemies:
-            if isinstance(enemy, Boss):
-                enemy.draw_spells(surface, offset_x, offset_y)
+        # Draw boss spells (if any); a spell can be on screen while its boss is not
+        spells = [spell for enemy in self.enemies if isinstance(enemy, Boss) for spell in enemy.active_spells]
+        if view_span is not None:
+            count = len(spells)
+            spells = [spell for spell in spells
+                      if spell.hazard_rect.right > left and spell.hazard_rect.left < right]
+            self.cull_counts['spells'] = (len(spells), count - len(spells))
+        for spell in spells:
+            spell.draw(surface, offset_x, offset_y)
         
-        # Draw NPCs (filter by dimension)
-        if self.player:
-            current_dim = 'gema' if self.player.in_gema_dimension else 'normal'
-            for npc in self.npcs:
-                if getattr(npc, 'dim', 'both') in (current_dim, 'both'):
-                    npc.draw(surface, offset_x, offset_y)
+        # Draw NPCs
+        for npc in npcs:
+            npc.draw(surface, offset_x, offset_y)
         
         # Draw player last (on top)
         if self.player:
@@ -142,19 +286,79 @@ class EntityManager:
     def cleanup_dead_enemies(self):
         """Remove enemies that are done dying."""
         now_ms = pygame.time.get_ticks()
+        count = len(self.enemies)
         self.enemies = [
             e for e in self.enemies 
             if not (getattr(e, 'is_dying', False) and 
                    now_ms >= getattr(e, 'remove_at_ms', 0))
         ]
+        if len(self.enemies) != count:
+            self.hazards.retain(self.enemies)
+            self.refresh_spatial()
     
     def get_active_enemies(self) -> List:
         """Get list of alive enemies."""
         return [e for e in self.enemies if e.is_alive and not getattr(e, 'is_dying', False)]
     
+    # Spatial queries
+    def refresh_spatial(self):
+        """Sync the spatial hash with the current enemy/NPC lists (re-buckets only moved entities)."""
+        self.spatial.sync(chain(self.enemies, self.npcs), entity_kind, dim_of, ENTITY_REACH)
+    
+    def enemies_near(self, rect: pygame.Rect) -> List:
+        """Enemies whose rects (or hazard/block rects) may touch `rect`, in list order."""
+        return self.spatial.query_rect(rect, ENEMY_KINDS)
+    
+    def npcs_near(self, x: float, y: float, radius: float, dim: Optional[str] = None) -> List[NPC]:
+        """NPCs within `radius` of a point, optionally only those visible in `dim`."""
+        return self.spatial.query_radius(x, y, radius, 'npc', dim)
+    
+    def update_player_proximity(self):
+        """
+        Set `player_nearby` on enemies so AI detection can skip far enemies.
+        Enemies can only notice a player below/above them inside the detect band;
+        only enemies entering or leaving the band are touched.
+        """
+        r = self.player.rect
+        band = pygame.Rect(r.centerx - AI_DETECT_RANGE_X, r.top - AI_DETECT_RANGE_Y,
+                           2 * AI_DETECT_RANGE_X, 1 << 20)
+        near = set(self.spatial.query_rect(band, ('chaser', 'boss')))
+        for enemy in self._near_player - near:
+            enemy.player_nearby = False
+        for enemy in near - self._near_player:
+            enemy.player_nearby = True
+        self._near_player = near
+    
+    # Activation
+    def update_activation(self, view_rect: pygame.Rect):
+        """
+        Wake enemies/NPCs within ACTIVATION_MARGIN of the viewport and park the rest.
+        Call after refresh_spatial; fills awake_enemies (list order) and awake_npcs.
+        """
+        awake = self.activation.update(view_rect, self.spatial, ENEMY_KINDS + ('npc',))
+        self.awake_enemies = [e for e in awake if not isinstance(e, NPC)]
+        self.awake_npcs = {e for e in awake if isinstance(e, NPC)}
+    
+    def activation_counts(self) -> Dict[str, tuple]:
+        """(awake, total) per group, for the F3 overlay."""
+        return {
+            'enemies': (len(self.awake_enemies), len(self.enemies)),
+            'npcs': (len(self.awake_npcs), len(self.npcs)),
+        }
+    
     def clear_all(self):
         """Clear all entities."""
         self.enemies.clear()
         self.npcs.clear()
         self.campfires.clear()
         self.enemy_spawns.clear()
+        self.spawned_enemies.clear()
+        self.enemy_snapshots.clear()
+        self.spatial.clear()
+        self.hazards.clear()
+        self._near_player = set()
+        self.activation.reset()
+        self.awake_enemies = []
+        self.awake_npcs = set()
+        if self.enemy_batch:
+            self.enemy_batch.clear()
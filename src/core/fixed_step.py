@@ -0,0 +1,92 @@
+"""
+Fixed Step - Loop simulasi fixed-timestep dengan accumulator dan interpolasi render.
+Simulasi selalu maju per tick tetap (konstanta gerak tetap per tick), render
+berjalan di refresh rate layar dan menggambar posisi entity di antara dua
+state simulasi terakhir.
+"""
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Tuple
+
+
+class FixedStepClock:
+    """
+    Accumulator untuk fixed-timestep.
+
+    Tiap frame: ticks = clock.advance(elapsed_ms); jalankan update() sebanyak
+    ticks; gambar dengan clock.alpha. Catch-up dibatasi max_catch_up tick per
+    frame; sisa waktu yang tidak terkejar dibuang (tidak ada spiral of death).
+    """
+
+    def __init__(self, tick_rate: int = 60, max_catch_up: int = 5):
+        self.tick_rate = tick_rate
+        self.tick_ms = 1000.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.accumulator = 0.0
+        self.dropped_ms = 0.0  # total simulation time skipped because of catch-up limit
+
+    def advance(self, elapsed_ms: float) -> int:
+        """Add real time and return how many simulation ticks to run now."""
+        self.accumulator += elapsed_ms
+        ticks = int(self.accumulator // self.tick_ms)
+        if ticks > self.max_catch_up:
+            dropped = (ticks - self.max_catch_up) * self.tick_ms
+            self.dropped_ms += dropped
+            self.accumulator -= dropped
+            ticks = self.max_catch_up
+        self.accumulator -= ticks * self.tick_ms
+        return ticks
+
+    def reset(self):
+        """Forget pending time (pause, menus, level loads)."""
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick between the last two simulation states (0..1)."""
+        return min(1.0, self.accumulator / self.tick_ms)
+
+
+class Interpolator:
+    """
+    Posisi rect sebelumnya untuk interpolasi render.
+    capture() dipanggil sebelum tiap tick; applied(alpha) memindahkan rect
+    sementara ke posisi interpolasi selama draw, lalu mengembalikannya.
+    """
+
+    def __init__(self, snap_distance: int = 80):
+        # Jumps larger than this (respawn, teleports, level changes) are not blended
+        self.snap_distance = snap_distance
+        self._previous: Dict[int, Tuple[object, int, int]] = {}
+
+    def capture(self, entities: Iterable):
+        """Remember the current positions as the previous simulation state."""
+        self._previous = {id(e): (e, e.rect.x, e.rect.y) for e in entities}
+
+    def clear(self):
+        self._previous.clear()
+
+    @contextmanager
+    def applied(self, entities: Iterable, alpha: float) -> Iterator[None]:
+        """Blend rects toward the previous state for drawing; restored on exit."""
+        moved = []
+        if alpha < 1.0:
+            snap = self.snap_distance
+            previous = self._previous
+            for e in entities:
+                prev = previous.get(id(e))
+                if prev is None or prev[0] is not e:
+                    continue
+                rect = e.rect
+                x, y = rect.x, rect.y
+                px, py = prev[1], prev[2]
+                if (px, py) == (x, y) or abs(x - px) > snap or abs(y - py) > snap:
+                    continue
+                moved.append((rect, x, y))
+                rect.x = round(px + (x - px) * alpha)
+                rect.y = round(py + (y - py) * alpha)
+        try:
+            yield
+        finally:
+            for rect, x, y in moved:
+                rect.x = x
+                rect.y = y
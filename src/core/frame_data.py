@@ -0,0 +1,155 @@
+"""
+Frame Data - Tabel hitbox, hurtbox dan frame aktif per animasi entity,
+dibaca dari data/frame_data.json.
+
+Offset kotak [x, y, w, h] relatif ke titik tengah rect entity dan ditulis
+menghadap kanan. Versi menghadap kiri dicerminkan saat load terhadap sumbu
+`mirror_x` (px dari centerx; 0.5 = kolom piksel tengah), per entity atau per
+kotak. Query runtime hanya lookup tabel + translasi ke Rect milik pemanggil,
+tanpa alokasi.
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+import pygame
+
+from utils.exception import FrameDataError
+
+
+FRAME_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               'data', 'frame_data.json')
+
+Box = Tuple[int, int, int, int]
+Facings = Tuple[Box, Box]  # (facing right, facing left)
+
+
+class FrameInfo(NamedTuple):
+    """Data of one animation frame."""
+    active: bool
+    hitbox: Optional[Facings]
+    hurtbox: Optional[Facings]
+
+
+def _facings(spec: Any, mirror_x: float) -> Facings:
+    """[x, y, w, h] or {"box": [...], "mirror_x": m} -> both facings."""
+    if isinstance(spec, dict):
+        mirror_x = spec.get('mirror_x', mirror_x)
+        spec = spec['box']
+    x, y, w, h = (int(v) for v in spec)
+    axis2 = int(round(2 * mirror_x))
+    return (x, y, w, h), (axis2 - (x + w), y, w, h)
+
+
+class FrameData:
+    """
+    Frame data satu jenis entity.
+
+    Per animasi: hitbox/hurtbox default, "active" (semua frame) atau
+    "active_frames", dan override per frame di "frames": {"4": {...}}.
+    Frame di luar tabel memakai default animasi; animasi yang tidak
+    terdaftar tidak aktif dan memakai hurtbox entity.
+    """
+
+    def __init__(self, name: str, entry: Dict[str, Any]):
+        self.name = name
+        mirror_x = entry.get('mirror_x', 0)
+        hurtbox = _facings(entry['hurtbox'], mirror_x) if 'hurtbox' in entry else None
+        self.boxes: Dict[str, Facings] = {
+            key: _facings(spec, mirror_x) for key, spec in entry.get('boxes', {}).items()
+        }
+        self._idle = FrameInfo(False, None, hurtbox)
+        # state -> (per-frame infos, default info for frames past the table)
+        self._animations: Dict[str, Tuple[Tuple[FrameInfo, ...], FrameInfo]] = {}
+        self._active_frames: Dict[str, FrozenSet[int]] = {}
+
+        for state, anim in entry.get('animations', {}).items():
+            default = FrameInfo(
+                bool(anim.get('active', False)),
+                _facings(anim['hitbox'], mirror_x) if 'hitbox' in anim else None,
+                _facings(anim['hurtbox'], mirror_x) if 'hurtbox' in anim else hurtbox,
+            )
+            overrides = {int(i): spec for i, spec in anim.get('frames', {}).items()}
+            active_frames = set(int(i) for i in anim.get('active_frames', ()))
+            length = max(list(overrides) + list(active_frames), default=-1) + 1
+            frames = []
+            for i in range(length):
+                spec = overrides.get(i, {})
+                frames.append(FrameInfo(
+                    bool(spec.get('active', default.active or i in active_frames)),
+                    _facings(spec['hitbox'], mirror_x) if 'hitbox' in spec else default.hitbox,
+                    _facings(spec['hurtbox'], mirror_x) if 'hurtbox' in spec else default.hurtbox,
+                ))
+            self._animations[state] = (tuple(frames), default)
+            self._active_frames[state] = frozenset(i for i, info in enumerate(frames) if info.active)
+
+    def frame(self, state: str, frame_index: float) -> FrameInfo:
+        table = self._animations.get(state)
+        if table is None:
+            return self._idle
+        frames, default = table
+        i = int(frame_index)
+        return frames[i] if 0 <= i < len(frames) else default
+
+    def active(self, state: str, frame_index: float) -> bool:
+        """True while `frame_index` of `state` is an active (damaging) frame."""
+        return self.frame(state, frame_index).active
+
+    def active_frames(self, state: str) -> FrozenSet[int]:
+        """Frames listed as active in the table (animations active throughout are not listed)."""
+        return self._active_frames.get(state, frozenset())
+
+    def hitbox(self, state: str, frame_index: float, direction: int, anchor: pygame.Rect,
+               out: pygame.Rect) -> Optional[pygame.Rect]:
+        """Hitbox of a frame placed around `anchor`'s centre, written into `out` (None if undefined)."""
+        boxes = self.frame(state, frame_index).hitbox
+        if boxes is None:
+            return None
+        x, y, w, h = boxes[direction < 0]
+        out.update(anchor.centerx + x, anchor.centery + y, w, h)
+        return out
+
+    def hurtbox(self, state: str, frame_index: float, direction: int, anchor: pygame.Rect,
+                out: pygame.Rect) -> pygame.Rect:
+        """Hurtbox of a frame written into `out`; the anchor rect itself if none is defined."""
+        boxes = self.frame(state, frame_index).hurtbox
+        if boxes is None:
+            return anchor
+        x, y, w, h = boxes[direction < 0]
+        out.update(anchor.centerx + x, anchor.centery + y, w, h)
+        return out
+
+    def box(self, name: str, direction: int, anchor: pygame.Rect, out: pygame.Rect) -> pygame.Rect:
+        """Named animation-independent box (block, wall, ...) written into `out`."""
+        x, y, w, h = self.boxes[name][direction < 0]
+        out.update(anchor.centerx + x, anchor.centery + y, w, h)
+        return out
+
+
+_tables: Dict[str, Dict[str, FrameData]] = {}
+_lock = threading.Lock()
+
+
+def load_frame_data(path: str = FRAME_DATA_PATH) -> Dict[str, FrameData]:
+    """Parse and precompute every entity in `path` (cached per path)."""
+    with _lock:
+        tables = _tables.get(path)
+        if tables is None:
+            try:
+                with open(path, 'r') as f:
+                    raw = json.load(f)
+                tables = {name: FrameData(name, entry) for name, entry in raw.items()}
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                raise FrameDataError(path, e)
+            _tables[path] = tables
+        return tables
+
+
+def frame_data(name: str, path: str = FRAME_DATA_PATH) -> FrameData:
+    """Frame data of one entity kind ('player', 'patrol', 'chaser', 'boss', 'boss_spell')."""
+    tables = load_frame_data(path)
+    data = tables.get(name)
+    if data is None:
+        raise FrameDataError(path, f"entity '{name}' tidak ada")
+    return data
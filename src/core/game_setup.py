@@ -13,6 +13,7 @@ from core.entity_manager import EntityManager
 from core.camera_controller import CameraController
 from core.asset_loader import AssetLoader
 from core.gameplay_handler import GameplayHandler
+from core.snapshot import LevelSnapshot
 
 # Game systems
 from environment.trap import TriggerTrap
@@ -138,22 +139,61 @@ class GameSetup:
         """
         platforms = []
         
-        for p in normal_data['platforms']:
-            platforms.append({
-                'rect': p['rect'].copy(), 
-                'dim': 'normal', 
-                'char': p['char']
-            })
-        
-        for p in gema_data['platforms']:
-            platforms.append({
-                'rect': p['rect'].copy(), 
-                'dim': 'gema', 
-                'char': p['char']
-            })
+        for dim, items in GameSetup._platform_layers(normal_data, gema_data, 'platforms'):
+            for p in items:
+                platforms.append({
+                    'rect': p['rect'].copy(), 
+                    'dim': dim, 
+                    'char': p['char']
+                })
         
         return platforms
     
+    @staticmethod
+    def _platform_layers(normal_data: Dict, gema_data: Dict, key: str) -> List[Tuple[str, List[Dict]]]:
+        """
+        (dim, items) layers for 'platforms' or 'collision_platforms'.
+        When the level pair was diffed (LevelController.dedupe_dimensions) the
+        shared tiles come once as 'both' and only the differences stay per
+        dimension; otherwise each map's full list is used.
+        """
+        if 'shared_' + key in normal_data:
+            return [
+                ('both', normal_data['shared_' + key]),
+                ('normal', normal_data['own_' + key]),
+                ('gema', gema_data['own_' + key])
+            ]
+        return [('normal', normal_data[key]), ('gema', gema_data[key])]
+    
+    @staticmethod
+    def setup_collision_platforms(normal_data: Dict, gema_data: Dict, platforms: List[Dict]) -> List[Dict]:
+        """
+        Setup the solids CollisionGrid is built from.
+        Uses merged spans when the level was loaded with span merge enabled
+        (LevelController.merge_spans), otherwise the tile platforms themselves.
+        
+        Args:
+            normal_data: Parsed normal dimension data
+            gema_data: Parsed gema dimension data
+            platforms: Output of setup_platforms for the same data
+            
+        Returns:
+            List of collision platform dictionaries
+        """
+        if 'span_stats' not in normal_data:
+            return platforms
+        
+        collision_platforms = []
+        for dim, items in GameSetup._platform_layers(normal_data, gema_data, 'collision_platforms'):
+            for p in items:
+                collision_platforms.append({
+                    'rect': p['rect'].copy(),
+                    'dim': dim,
+                    'char': p['char']
+                })
+        
+        return collision_platforms
+    
     @staticmethod
     def setup_trigger_traps(normal_data: Dict, gema_data: Dict) -> List[TriggerTrap]:
         """
@@ -240,7 +280,7 @@ class GameSetup:
     
     @staticmethod
     def setup_npcs(entity_manager: EntityManager, normal_spawns: List, 
-                   gema_spawns: List, snap_func) -> List:
+                   gema_spawns: List, snap_func, append: bool = False) -> List:
         """
         Setup NPCs from level data.
         
@@ -249,12 +289,16 @@ class GameSetup:
             normal_spawns: Normal dimension NPC spawns
             gema_spawns: Gema dimension NPC spawns
             snap_func: Function to snap actors to ground
+            append: Add to existing NPCs instead of replacing them
             
         Returns:
             List of NPC instances
         """
         npcs = NPC.spawn_from_maps(normal_spawns, gema_spawns)
-        entity_manager.npcs = npcs
+        if append:
+            entity_manager.npcs.extend(npcs)
+        else:
+            entity_manager.npcs = npcs
         
         # Snap NPCs to ground
         for npc in npcs:
@@ -280,6 +324,53 @@ class GameSetup:
         for rect in gema_campfires:
             entity_manager.add_campfire(Campfire(rect))
     
+    @staticmethod
+    def setup_stream_chunk(chunk: Dict[str, Dict]) -> Dict[str, List]:
+        """
+        Build static level structures for one streamed chunk.
+        
+        Args:
+            chunk: {'normal': level_data, 'gema': level_data} for the chunk
+            
+        Returns:
+            Dict with 'platforms', 'collision_platforms', 'trigger_traps', 'end_triggers'
+        """
+        return GameSetup.build_level_structures(chunk['normal'], chunk['gema'])
+    
+    @staticmethod
+    def build_level_structures(normal_data: Dict, gema_data: Dict) -> Dict[str, List]:
+        """
+        Build all static level structures (no entities) from level data.
+        
+        Args:
+            normal_data: Parsed normal dimension data
+            gema_data: Parsed gema dimension data
+            
+        Returns:
+            Dict with 'platforms', 'collision_platforms', 'trigger_traps', 'end_triggers'
+        """
+        platforms = GameSetup.setup_platforms(normal_data, gema_data)
+        return {
+            'platforms': platforms,
+            'collision_platforms': GameSetup.setup_collision_platforms(normal_data, gema_data, platforms),
+            'trigger_traps': GameSetup.setup_trigger_traps(normal_data, gema_data),
+            'end_triggers': GameSetup.setup_end_triggers(normal_data, gema_data)
+        }
+    
+    @staticmethod
+    def build_level_snapshot(normal_data: Dict, gema_data: Dict) -> LevelSnapshot:
+        """
+        Build static structures once and wrap them in a restartable snapshot.
+        
+        Args:
+            normal_data: Parsed normal dimension data
+            gema_data: Parsed gema dimension data
+            
+        Returns:
+            LevelSnapshot sharing its lists with whoever uses it
+        """
+        return LevelSnapshot(GameSetup.build_level_structures(normal_data, gema_data))
+    
     @staticmethod
     def setup_parallax(asset_loader: AssetLoader) -> Tuple[List[ParallaxLayer], ParallaxObject, ParallaxObject]:
         """
@@ -314,10 +405,11 @@ class GameSetup:
             cached_gema_data: Cached gema dimension data
             
         Returns:
-            Dict with 'platforms', 'trigger_traps', 'end_triggers'
+            Dict with 'platforms', 'collision_platforms', 'trigger_traps', 'end_triggers'
         """
         result = {
             'platforms': [],
+            'collision_platforms': [],
             'trigger_traps': [],
             'end_triggers': []
         }
@@ -326,18 +418,11 @@ class GameSetup:
             return result
         
         # Setup platforms from cache
-        for p in cached_normal_data['platforms']:
-            result['platforms'].append({
-                'rect': p['rect'].copy(), 
-                'dim': 'normal', 
-                'char': p['char']
-            })
-        for p in cached_gema_data['platforms']:
-            result['platforms'].append({
-                'rect': p['rect'].copy(), 
-                'dim': 'gema', 
-                'char': p['char']
-            })
+        result['platforms'] = GameSetup.setup_platforms(cached_normal_data, cached_gema_data)
+        
+        result['collision_platforms'] = GameSetup.setup_collision_platforms(
+            cached_normal_data, cached_gema_data, result['platforms']
+        )
         
         # Setup trigger traps from cache
         for trigger_rect, trap_rect in zip(
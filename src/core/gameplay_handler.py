@@ -5,10 +5,23 @@ Memisahkan gameplay logic dari main game class.
 import pygame
 from typing import List, Dict, Optional, Any, TYPE_CHECKING
 from utils.settings import SCREEN_HEIGHT
+from core.broadphase import SweepAndPrune
 
 if TYPE_CHECKING:
     from entity.player import Player
     from core.entity_manager import EntityManager
+    from core.collision_grid import CollisionView
+
+
+# Category pairs the handlers consume
+BROADPHASE_PAIRS = (
+    ('player', 'hazard'),        # handle_damage
+    ('player_reach', 'block'),   # handle_enemy_blocking
+    ('attack_reach', 'enemy'),   # handle_combat
+)
+
+# Blocking pushes move the player (and its attack hitbox) by less than this
+PUSH_REACH = 80
 
 
 class GameplayHandler:
@@ -34,6 +47,9 @@ class GameplayHandler:
         self.end_sequence_mode = None
         self.end_sequence_dir = 1
         self.end_jump_started = False
+        
+        # Dynamic AABB pairs, rebuilt once per tick by update_broadphase
+        self.broadphase = SweepAndPrune(BROADPHASE_PAIRS)
     
     def reset_state(self):
         """Reset all gameplay state."""
@@ -59,12 +75,13 @@ class GameplayHandler:
     def handle_triggers(self, player: 'Player', trigger_traps: List, end_triggers: List) -> Optional[str]:
         """
         Handle trigger activation.
+        `trigger_traps` and `end_triggers` are the views for the player's dimension.
         Returns end sequence mode if triggered, None otherwise.
         """
         if not player.is_alive:
             return None
         
-        current_dim = 'gema' if player.in_gema_dimension else 'normal'
+        current_dim = player.dimension
         
         # Activate traps
         for trap in trigger_traps:
@@ -73,65 +90,75 @@ class GameplayHandler:
         # Check end triggers
         if not self.end_sequence_active:
             for end_t in end_triggers:
-                if end_t['dim'] in [current_dim, 'both'] and player.collides(end_t['rect']):
+                if player.collides(end_t['rect']):
                     return end_t['mode']
         
         return None
     
-    def handle_damage(self, player: 'Player', trigger_traps: List) -> Optional[Dict]:
+    def update_broadphase(self, player: 'Player', trigger_traps: List):
         """
-        Handle player damage from hazards.
-        Returns damage result dict if damaged, None otherwise.
+        Register this tick's dynamic AABBs and collect overlapping pairs.
+        Call after handle_triggers and before handle_damage/blocking/combat.
+        `trigger_traps` is the view for the player's dimension.
         """
-        from entity.enemy import PatrollingEnemy, ChaserEnemy
-        from entity.boss import Boss
+        bp = self.broadphase
+        bp.begin()
+        bp.add(player, 'player', player.rect)
+        
+        # Blocking and the attack hitbox are evaluated after pushes, so they
+        # get a wider candidate box and keep their exact test
+        reach = player.rect.inflate(PUSH_REACH, 0)
+        bp.add(player, 'player_reach', reach)
+        attack_rect = player.get_attack_hitbox() if hasattr(player, 'get_attack_hitbox') else None
+        if attack_rect:
+            attack_reach = attack_rect.inflate(PUSH_REACH, 0)
+            bp.add(player, 'attack_reach', attack_reach)
+            reach = reach.union(attack_reach)
+        
+        for trap in trigger_traps:
+            if trap.is_active:
+                bp.add(trap, 'hazard', trap.get_hazard_rect(), 'trap')
         
+        # Spells live away from their caster; every other provider pairs with a
+        # player box, so only enemies near the player are asked
+        registry = self.entity_manager.hazards
+        for item, emitter in registry.emitted():
+            bp.add(item, emitter.category, emitter.rect(item), emitter.tag)
+        for enemy, provider in registry.open_providers(self.entity_manager.enemies_near(reach)):
+            bp.add(enemy, provider.category, provider.rect(enemy), provider.tag)
+        
+        bp.end()
+    
+    def handle_damage(self, player: 'Player') -> Optional[Dict]:
+        """
+        Handle player damage from hazards (uses this tick's broadphase pairs).
+        Touched providers get on_hit; if damage is applied, the last touched
+        provider with on_damage gets it.
+        Returns damage result dict if damaged, None otherwise.
+        """
         if self.is_invincible or not player.is_alive or self.is_in_death_delay:
             return None
         
-        current_dim = 'gema' if player.in_gema_dimension else 'normal'
-        active_hazards = []
-        chaser_that_hit = None
-        
-        # Collect trap hazards
-        for trap in trigger_traps:
-            if trap.is_active and trap.dim in [current_dim, 'both']:
-                active_hazards.append(trap.get_hazard_rect())
+        registry = self.entity_manager.hazards
+        hits = self.broadphase.pairs('player', 'hazard')
+        damaged_by = None
         
-        # Collect enemy hazards
-        for enemy in self.entity_manager.enemies:
-            if getattr(enemy, 'is_dying', False):
+        for _, hazard in hits:
+            provider = registry.provider(hazard.owner, 'hazard', hazard.tag)
+            if provider is None:
                 continue
-            
-            if hasattr(enemy, 'is_hazard_active') and enemy.is_hazard_active():
-                hazard_rect = enemy.get_hazard_rect() if hasattr(enemy, 'get_hazard_rect') else enemy.rect
-                active_hazards.append(hazard_rect)
-                
-                # Handle enemy contact
-                if isinstance(enemy, PatrollingEnemy) and hazard_rect.colliderect(player.rect):
-                    if hasattr(enemy, 'on_player_contact') and enemy.is_alive:
-                        enemy.on_player_contact()
-                    setattr(enemy, 'permanent_idle', True)
-                
-                if isinstance(enemy, ChaserEnemy) and hazard_rect.colliderect(player.rect):
-                    chaser_that_hit = enemy
-            
-            # Boss special attacks
-            if isinstance(enemy, Boss):
-                active_hazards.extend(enemy.get_spell_hazards())
-                if hasattr(enemy, 'is_melee_active') and enemy.is_melee_active():
-                    active_hazards.append(enemy.get_melee_hazard_rect())
+            if provider.on_hit is not None:
+                provider.on_hit(hazard.owner)
+            if provider.on_damage is not None:
+                damaged_by = (provider, hazard.owner)
         
         # Apply damage
-        result = player.apply_hazards(active_hazards, SCREEN_HEIGHT, is_invincible=False)
+        result = player.apply_hazards([hazard.rect for _, hazard in hits], SCREEN_HEIGHT, is_invincible=False)
         
         if result:
-            # Handle chaser behavior on hit
-            if chaser_that_hit:
-                setattr(chaser_that_hit, 'permanent_combat_idle', True)
-                chaser_that_hit.state = 'combat_idle'
-                chaser_that_hit.frame_index = 0
-                chaser_that_hit.velocity.x = 0
+            if damaged_by is not None:
+                provider, owner = damaged_by
+                provider.on_damage(owner)
             
             # Handle temporary death
             if result.get('temporary_death'):
@@ -146,43 +173,30 @@ class GameplayHandler:
         Handle player attacks on enemies.
         Returns list of enemies that were hit.
         """
-        from entity.boss import Boss
-        
         attack_rect = player.get_attack_hitbox() if hasattr(player, 'get_attack_hitbox') else None
         
         if not attack_rect:
             return []
         
+        registry = self.entity_manager.hazards
         enemies_hit = []
         
-        for enemy in self.entity_manager.get_active_enemies():
-            if attack_rect.colliderect(enemy.rect):
+        for _, body in self.broadphase.pairs('attack_reach', 'enemy'):
+            enemy = body.owner
+            if enemy.is_dying:
+                continue
+            if attack_rect.colliderect(body.rect):
                 enemies_hit.append(enemy)
-                
-                if isinstance(enemy, Boss):
-                    if hasattr(enemy, 'take_damage'):
-                        enemy.take_damage(1)
-                elif hasattr(enemy, 'on_killed_by_player'):
-                    enemy.on_killed_by_player()
+                provider = registry.provider(enemy, 'enemy')
+                if provider is not None and provider.on_hit is not None:
+                    provider.on_hit(enemy)
         
         return enemies_hit
     
     def handle_enemy_blocking(self, player: 'Player'):
-        """Handle enemy blocking player movement."""
-        for enemy in self.entity_manager.enemies:
-            if getattr(enemy, 'is_dying', False):
-                continue
-            
-            if not getattr(enemy, 'blocks_player', True):
-                continue
-            
-            # Get blocking rect
-            if hasattr(enemy, 'get_invisible_wall_rect'):
-                block_rect = enemy.get_invisible_wall_rect()
-            elif hasattr(enemy, 'get_block_rect'):
-                block_rect = enemy.get_block_rect()
-            else:
-                block_rect = enemy.rect
+        """Handle enemy blocking player movement (block providers open this tick)."""
+        for _, block in self.broadphase.pairs('player_reach', 'block'):
+            block_rect = block.rect
             
             # Check collision and push player
             if player.rect.colliderect(block_rect):
@@ -204,7 +218,7 @@ class GameplayHandler:
         self.end_sequence_dir = 1
         self.end_jump_started = False
     
-    def update_end_sequence(self, player: 'Player', active_platforms: List, 
+    def update_end_sequence(self, player: 'Player', active_platforms: 'CollisionView', 
                            player_speed: float, jump_strength: float):
         """
         Update end sequence animation.
@@ -0,0 +1,110 @@
+"""
+Hazard Registry - Provider hazard, blocker dan body bertipe per class entity.
+Tiap class enemy mendeklarasikan provider-nya sekali (kategori broadphase, tag,
+jendela aktif, rect, callback on_hit/on_damage); entity didaftarkan saat spawn.
+Per tick hanya entity di dekat player yang dicek, dan hanya provider yang
+jendelanya terbuka yang masuk broadphase, tanpa isinstance/hasattr per enemy.
+Emitter (spell boss) menghasilkan hazard dinamis milik owner yang terdaftar,
+di mana pun owner-nya berada.
+"""
+import pygame
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+
+class HazardProvider(NamedTuple):
+    """One AABB an entity class contributes to the broadphase."""
+    category: str                                  # 'hazard', 'block' or 'enemy' (attackable body)
+    tag: Optional[str]
+    active: Callable[[Any], bool]                  # window: registered this tick only while True
+    rect: Callable[[Any], pygame.Rect]
+    on_hit: Optional[Callable[[Any], None]] = None     # hazard touched by the player / body struck by an attack
+    on_damage: Optional[Callable[[Any], None]] = None  # the player took damage while touching this hazard
+
+
+class HazardEmitter(NamedTuple):
+    """Short-lived hazard objects spawned by an owner (boss spells)."""
+    category: str
+    tag: Optional[str]
+    items: Callable[[Any], Iterable[Any]]          # owner -> objects whose window is open
+    rect: Callable[[Any], pygame.Rect]             # object -> rect
+
+
+class HazardRegistry:
+    """
+    Registry provider per tipe entity.
+
+    Class entity menyediakan hazard_providers() (dan opsional hazard_emitters());
+    tabel dibaca sekali per class. register(owner) dipanggil saat spawn,
+    open_providers(owners) dan emitted() dipakai tiap tick oleh GameplayHandler.
+    Owner yang sedang mati (is_dying) tidak punya provider terbuka.
+    """
+
+    def __init__(self):
+        self._tables: Dict[type, Tuple[HazardProvider, ...]] = {}
+        self._emitter_tables: Dict[type, Tuple[HazardEmitter, ...]] = {}
+        self._by_key: Dict[Tuple[type, str, Optional[str]], HazardProvider] = {}
+        # Owners with emitters, in spawn order
+        self._emitting: Dict[Any, Tuple[HazardEmitter, ...]] = {}
+
+    def _table(self, cls: type) -> Tuple[HazardProvider, ...]:
+        table = self._tables.get(cls)
+        if table is None:
+            table = tuple(cls.hazard_providers())
+            self._tables[cls] = table
+            for provider in table:
+                self._by_key[(cls, provider.category, provider.tag)] = provider
+            emitters = getattr(cls, 'hazard_emitters', None)
+            self._emitter_tables[cls] = tuple(emitters()) if emitters is not None else ()
+        return table
+
+    def register(self, owner: Any):
+        """Register a spawned entity (resolves its class table once)."""
+        self._table(type(owner))
+        emitters = self._emitter_tables[type(owner)]
+        if emitters:
+            self._emitting[owner] = emitters
+
+    def reset(self, owners: Iterable[Any]):
+        """Track exactly `owners` (level swap, respawn)."""
+        self._emitting.clear()
+        for owner in owners:
+            self.register(owner)
+
+    def retain(self, owners: Iterable[Any]):
+        """Forget owners that are no longer in `owners` (removed after dying)."""
+        keep = set(owners)
+        self._emitting = {o: e for o, e in self._emitting.items() if o in keep}
+
+    def clear(self):
+        self._emitting.clear()
+
+    # Per tick
+    def open_providers(self, owners: Iterable[Any]) -> Iterator[Tuple[Any, HazardProvider]]:
+        """(owner, provider) for every provider of `owners` whose window is open, in order."""
+        tables = self._tables
+        for owner in owners:
+            if owner.is_dying:
+                continue
+            table = tables.get(type(owner))
+            if table is None:
+                table = self._table(type(owner))
+            for provider in table:
+                if provider.active(owner):
+                    yield owner, provider
+
+    def emitted(self) -> Iterator[Tuple[Any, HazardEmitter]]:
+        """(object, emitter) for the open hazards of every registered emitting owner."""
+        for owner, emitters in self._emitting.items():
+            if owner.is_dying:
+                continue
+            for emitter in emitters:
+                for item in emitter.items(owner):
+                    yield item, emitter
+
+    def provider(self, owner: Any, category: str, tag: Optional[str] = None) -> Optional[HazardProvider]:
+        """Provider of `owner` that registered an AABB under (category, tag)."""
+        return self._by_key.get((type(owner), category, tag))
+
+    @property
+    def emitting_count(self) -> int:
+        return len(self._emitting)
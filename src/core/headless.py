@@ -0,0 +1,380 @@
+"""
+Headless - Simulasi deterministik tanpa window untuk build box dan profiling.
+SDL memakai driver video/audio dummy, waktu game berasal dari jam simulasi
+(maju tepat satu tick per update) dan input berasal dari skrip, jadi dua run
+dengan level, jumlah tick dan skrip yang sama menghasilkan state yang sama.
+Loop berjalan secepat CPU (tanpa frame cap); render ke surface off-screen
+opsional. Waktu tiap sistem di Game.update dicatat oleh SystemTimer.
+"""
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import pygame
+
+
+def use_dummy_drivers():
+    """Select SDL's dummy video/audio drivers (call before pygame.init)."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+class SystemTimer:
+    """
+    Total waktu per sistem dalam satu tick.
+    start() di awal update, mark(name) setelah tiap sistem: waktu sejak mark
+    sebelumnya ditambahkan ke totals[name].
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self._last = 0.0
+
+    def start(self):
+        self._last = time.perf_counter()
+
+    def mark(self, name: str):
+        now = time.perf_counter()
+        self.totals[name] = self.totals.get(name, 0.0) + (now - self._last)
+        self._last = now
+
+    def reset(self):
+        self.totals.clear()
+
+
+class _NullTimer:
+    """Timer used outside profiling runs; marks cost one no-op call."""
+
+    def start(self):
+        pass
+
+    def mark(self, name: str):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class SimulatedClock:
+    """Game time that only moves when advance() is called (one fixed tick per update)."""
+
+    def __init__(self, tick_rate: int = 60):
+        self.tick_ms = 1000.0 / tick_rate
+        self.elapsed_ms = 0.0
+
+    def get_ticks(self) -> int:
+        return int(self.elapsed_ms)
+
+    def advance(self):
+        self.elapsed_ms += self.tick_ms
+
+
+class _KeyState:
+    """pygame.key.get_pressed() stand-in backed by a set of held keys."""
+
+    def __init__(self, held: set):
+        self._held = held
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._held
+
+
+class ScriptedInput:
+    """
+    Input dari skrip: daftar langkah {"tick", "hold", "release", "press", "click"}.
+
+    hold/release mengubah tombol yang ditahan (dibaca lewat get_pressed), press
+    mengirim KEYDOWN, click mengirim klik kiri mouse (serangan). Nama tombol
+    memakai nama pygame ("right", "space", "left shift", "e"). Dengan "repeat"
+    skrip diulang tiap sekian tick.
+    """
+
+    def __init__(self, steps: List[Dict[str, Any]], repeat: int = 0):
+        self.repeat = repeat
+        self._steps: Dict[int, List[Dict[str, Any]]] = {}
+        for step in steps:
+            self._steps.setdefault(int(step.get('tick', 0)), []).append(step)
+        self.held: set = set()
+        self._keys = _KeyState(self.held)
+
+    @classmethod
+    def load(cls, path: str) -> 'ScriptedInput':
+        """Script from a JSON file: a list of steps or {"repeat": n, "steps": [...]}."""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            return cls(data)
+        return cls(data.get('steps', []), data.get('repeat', 0))
+
+    @classmethod
+    def default(cls) -> 'ScriptedInput':
+        """Run right with periodic jumps, attacks, dimension shifts and a turn back."""
+        steps = [{'tick': 0, 'hold': ['right']}]
+        steps += [{'tick': t, 'press': ['space']} for t in range(0, 600, 37)]
+        steps += [{'tick': t, 'click': 1} for t in range(11, 600, 23)]
+        steps += [{'tick': t, 'press': ['left shift']} for t in (150, 240, 420, 510)]
+        steps += [{'tick': 450, 'release': ['right'], 'hold': ['left']},
+                  {'tick': 540, 'release': ['left'], 'hold': ['right']}]
+        return cls(steps, repeat=600)
+
+    def get_pressed(self) -> _KeyState:
+        return self._keys
+
+    def events(self, tick: int) -> List[pygame.event.Event]:
+        """Apply this tick's hold/release steps and return its KEYDOWN/click events."""
+        if self.repeat:
+            tick %= self.repeat
+        events = []
+        for step in self._steps.get(tick, ()):
+            for name in step.get('release', ()):
+                self.held.discard(pygame.key.key_code(name))
+            for name in step.get('hold', ()):
+                self.held.add(pygame.key.key_code(name))
+            for name in step.get('press', ()):
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code(name)))
+            for _ in range(int(step.get('click', 0))):
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0)))
+        return events
+
+
+@contextmanager
+def simulated(clock: SimulatedClock, script: ScriptedInput) -> Iterator[None]:
+    """Route pygame's clock and keyboard state to the simulation for the duration."""
+    get_ticks, get_pressed = pygame.time.get_ticks, pygame.key.get_pressed
+    pygame.time.get_ticks = clock.get_ticks
+    pygame.key.get_pressed = script.get_pressed
+    try:
+        yield
+    finally:
+        pygame.time.get_ticks = get_ticks
+        pygame.key.get_pressed = get_pressed
+
+
+class HeadlessRunner:
+    """
+    Jalankan satu level selama N tick dan kumpulkan laporan.
+
+    Game harus dibuat dengan headless=True (tanpa simpan progres) di dalam
+    simulated(); runner menangani game over dengan mengulang level yang sama.
+    """
+
+    def __init__(self, game, clock: SimulatedClock, script: ScriptedInput, render: bool = False):
+        self.game = game
+        self.clock = clock
+        self.script = script
+        self.render = render
+        self.timer = SystemTimer()
+        self.game_overs = 0
+        self.respawns = 0
+        self.batched_peak = 0
+        # When a list, tick_state() is appended after every update (--compare-batch)
+        self.trace: Optional[List[tuple]] = None
+
+    def run(self, level: int, ticks: int) -> Dict[str, Any]:
+        from core.game_state import GameStateEnum
+        from utils.settings import PLAYER_START_HEARTS
+
+        game = self.game
+        game.level_controller.set_level(level)
+        game.setup_level(new_game=True)
+        game.state_controller.change_state(GameStateEnum.PLAYING)
+        game.system_timer = self.timer
+        timer = self.timer
+        timer.reset()
+
+        ran = 0
+        start = time.perf_counter()
+        for tick in range(ticks):
+            self.clock.advance()
+            for event in self.script.events(tick):
+                game.dispatch_input(event)
+            was_alive = game.entity_manager.player.is_alive
+            game.update()
+            if not was_alive and game.entity_manager.player.is_alive:
+                self.respawns += 1
+            self.batched_peak = max(self.batched_peak, len(game.entity_manager.enemy_batch or ()))
+            if self.trace is not None:
+                self.trace.append(self.tick_state())
+            if self.render:
+                timer.start()
+                game.draw()
+                timer.mark('render')
+            ran += 1
+
+            if game.state_controller.is_state(GameStateEnum.GAME_OVER):
+                self.game_overs += 1
+                game.setup_level(new_game=True)
+                game.entity_manager.player.hearts = PLAYER_START_HEARTS
+                game.state_controller.change_state(GameStateEnum.PLAYING)
+            elif not game.state_controller.is_state(GameStateEnum.PLAYING):
+                break  # all levels won
+        elapsed = time.perf_counter() - start
+        game.system_timer = NULL_TIMER
+
+        return self.report(level, ran, elapsed)
+
+    def report(self, level: int, ticks: int, elapsed: float) -> Dict[str, Any]:
+        game = self.game
+        player = game.entity_manager.player
+        systems = {
+            name: {'total_ms': round(total * 1000, 3),
+                   'per_tick_us': round(total * 1e6 / ticks, 3) if ticks else 0.0}
+            for name, total in sorted(self.timer.totals.items(), key=lambda item: -item[1])
+        }
+        return {
+            'level': level,
+            'final_level': game.level_controller.current_level,
+            'ticks': ticks,
+            'elapsed_s': round(elapsed, 4),
+            'ticks_per_second': round(ticks / elapsed, 1) if elapsed else 0.0,
+            'render': self.render,
+            'systems': systems,
+            'respawns': self.respawns,
+            'game_overs': self.game_overs,
+            'player': {'rect': list(player.rect), 'hearts': player.hearts, 'dimension': player.dimension},
+            'enemies': len(game.entity_manager.enemies),
+            'batched_enemies': self.batched_peak,
+            'checksum': self.checksum(),
+        }
+
+    def checksum(self) -> str:
+        """Digest of the simulation state; equal for equal runs."""
+        manager = self.game.entity_manager
+        player = manager.player
+        state = (tuple(player.rect), player.hearts, player.is_alive, player.dimension,
+                 self.game.level_controller.current_level,
+                 tuple((tuple(e.rect), e.state) for e in manager.enemies),
+                 tuple(tuple(n.rect) for n in manager.npcs))
+        return hashlib.md5(repr(state).encode()).hexdigest()
+
+    def tick_state(self) -> tuple:
+        """
+        Player state plus every enemy's rect, velocity and batch-tracked runtime fields
+        (unset fields read as their FIELD_COLUMNS default, like the per-object code does).
+        """
+        from core.enemy_batch import FIELD_COLUMNS
+
+        manager = self.game.entity_manager
+        player = manager.player
+        enemies = tuple(
+            (tuple(e.rect), e.velocity.x, e.velocity.y)
+            + tuple(getattr(e, name, default) for name, (_, default) in FIELD_COLUMNS.items())
+            for e in manager.enemies
+        )
+        return (tuple(player.rect), player.hearts, player.is_alive, player.dimension, enemies)
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"[HEADLESS] Level {report['level']}: {report['ticks']} ticks in {report['elapsed_s']:.3f}s "
+          f"({report['ticks_per_second']:.0f} ticks/s)")
+    for name, timing in report['systems'].items():
+        print(f"[HEADLESS]   {name:<14} {timing['total_ms']:>10.1f} ms  {timing['per_tick_us']:>9.1f} us/tick")
+    print(f"[HEADLESS] Respawns {report['respawns']}, game overs {report['game_overs']}, "
+          f"checksum {report['checksum']}")
+
+
+def configure_enemy_batch(game, mode: str):
+    """auto: settings threshold; on: batch every patrol/chaser enemy; off: per-object updates only."""
+    manager = game.entity_manager
+    if mode == 'on':
+        manager.batch_min_enemies = 0
+    elif mode == 'off':
+        manager.enemy_batch = None
+
+
+def run_level(game_class, args, enemy_batch: str, trace: Optional[List[tuple]] = None) -> Dict[str, Any]:
+    """One headless run of args.level with a fresh clock and script."""
+    from utils.settings import SIM_TICK_RATE
+
+    clock = SimulatedClock(SIM_TICK_RATE)
+    script = ScriptedInput.load(args.script) if args.script else ScriptedInput.default()
+    with simulated(clock, script):
+        game = game_class(headless=True)
+        if args.stream:
+            game.level_controller.stream_min_columns = 0
+        game.level_controller.merge_spans = args.merge_spans
+        configure_enemy_batch(game, enemy_batch)
+        runner = HeadlessRunner(game, clock, script, render=args.render)
+        runner.trace = trace
+        report = runner.run(args.level, args.ticks)
+        game.level_prefetcher.shutdown()
+    return report
+
+
+def compare_enemy_batch(game_class, args) -> int:
+    """
+    Run the level with per-object enemy updates, then with every patrol/chaser
+    enemy batched, and compare the state after each tick. Exit code 1 on the
+    first difference.
+    """
+    from core.enemy_batch import NUMPY_AVAILABLE, FIELD_COLUMNS
+    from utils.settings import ENEMY_BATCH
+
+    if not (ENEMY_BATCH and NUMPY_AVAILABLE):
+        print("[HEADLESS] Enemy batch unavailable (ENEMY_BATCH off or NumPy missing), nothing to compare")
+        return 1
+    scalar, batched = [], []
+    run_level(game_class, args, 'off', scalar)
+    report = run_level(game_class, args, 'on', batched)
+    if not report['batched_enemies']:
+        print(f"[HEADLESS] Level {args.level} has no patrol/chaser enemies to batch")
+        return 1
+
+    fields = ('rect', 'velocity.x', 'velocity.y') + tuple(FIELD_COLUMNS)
+    for tick, (expected, actual) in enumerate(zip(scalar, batched)):
+        if expected == actual:
+            continue
+        print(f"[HEADLESS] Enemy batch diverges from per-object updates at tick {tick}")
+        if expected[:4] != actual[:4]:
+            print(f"[HEADLESS]   player {expected[:4]} != {actual[:4]}")
+        if len(expected[4]) != len(actual[4]):
+            print(f"[HEADLESS]   enemy count {len(expected[4])} != {len(actual[4])}")
+        for index, (want, got) in enumerate(zip(expected[4], actual[4])):
+            for name, a, b in zip(fields, want, got):
+                if a != b:
+                    print(f"[HEADLESS]   enemy {index} {name}: {a!r} != {b!r}")
+        return 1
+    if len(scalar) != len(batched):
+        print(f"[HEADLESS] Runs ended after {len(scalar)} and {len(batched)} ticks")
+        return 1
+    print(f"[HEADLESS] Enemy batch matches per-object updates: level {args.level}, {len(batched)} ticks, "
+          f"up to {report['batched_enemies']} enemies batched")
+    return 0
+
+
+def main(game_class, argv: Optional[List[str]] = None) -> int:
+    """python -m main --headless --level 3 --ticks 20000 [--stream] [--enemy-batch on] --report out.json"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Dual Dimension headless simulation')
+    parser.add_argument('--headless', action='store_true', help='run without a window')
+    parser.add_argument('--level', type=int, default=1)
+    parser.add_argument('--ticks', type=int, default=3600)
+    parser.add_argument('--render', action='store_true', help='also draw every tick to the off-screen surface')
+    parser.add_argument('--stream', action='store_true',
+                        help='load the level in chunks even if it is narrower than LEVEL_STREAM_MIN_COLUMNS')
+    parser.add_argument('--merge-spans', action='store_true',
+                        help='build collision from merged G/P spans instead of single tiles')
+    parser.add_argument('--enemy-batch', choices=('auto', 'on', 'off'), default='auto',
+                        help='on: batch patrol/chaser enemies regardless of ENEMY_BATCH_MIN_ENEMIES; '
+                             'off: never batch')
+    parser.add_argument('--compare-batch', action='store_true',
+                        help='check the enemy batch against per-object updates tick by tick')
+    parser.add_argument('--script', help='JSON input script (default: built-in run/jump/attack loop)')
+    parser.add_argument('--report', help='write the report as JSON to this path')
+    args = parser.parse_args(argv)
+
+    use_dummy_drivers()
+    if args.compare_batch:
+        return compare_enemy_batch(game_class, args)
+
+    report = run_level(game_class, args, args.enemy_batch)
+    print_report(report)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"[HEADLESS] Report written to {args.report}")
+    return 0
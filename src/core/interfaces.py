@@ -4,7 +4,10 @@ Menggunakan ABC (Abstract Base Class) untuk mendefinisikan contract yang harus d
 """
 from abc import ABC, abstractmethod
 import pygame
-from typing import Tuple, List
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.collision_grid import CollisionView
 
 
 class IDrawable(ABC):
@@ -43,7 +46,7 @@ class IPhysicsBody(ABC):
     """Interface untuk objek yang dipengaruhi physics."""
     
     @abstractmethod
-    def apply_physics(self, platforms: List[pygame.Rect]) -> None:
+    def apply_physics(self, platforms: 'CollisionView') -> None:
         """Apply physics (gravity, collision) ke objek."""
         pass
     
@@ -0,0 +1,66 @@
+"""
+Interval Index - Index 1D objek berdasarkan rentang x dunia [left, right).
+Entry diurutkan menurut left; query(left, right) mencari kandidat dengan
+bisect (dibatasi lebar objek terlebar) dan mengembalikan objek yang beririsan
+dalam urutan list sumber, jadi urutan gambar tidak berubah. Hanya untuk
+objek statis (trap, campfire); objek yang bergerak dicari lewat SpatialHash.
+"""
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+Span = Tuple[int, int]
+
+_first = itemgetter(0)
+
+
+def rect_span(obj: Any) -> Span:
+    """Horizontal extent of `obj.rect`."""
+    rect = obj.rect
+    return rect.left, rect.right
+
+
+class IntervalIndex:
+    """
+    Index rentang x untuk satu list objek.
+
+    sync(items) membangun ulang index saat list sumber berganti (identitas
+    atau panjang); rentang objek dianggap tidak berubah.
+    """
+
+    def __init__(self, span: Callable[[Any], Span] = rect_span):
+        self.span = span
+        self.source: Optional[Sequence] = None
+        self._entries: List[tuple] = []  # (left, right, order, item)
+        self._lefts: List[int] = []
+        self._max_width = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def build(self, items: Sequence):
+        """Index `items` from scratch."""
+        span = self.span
+        self.source = items
+        entries = [(*span(item), order, item) for order, item in enumerate(items)]
+        entries.sort(key=_first)
+        self._entries = entries
+        self._lefts = [entry[0] for entry in entries]
+        self._max_width = max((entry[1] - entry[0] for entry in entries), default=0)
+
+    def sync(self, items: Sequence):
+        """Track `items`, rebuilding the index when the list changed."""
+        if items is not self.source or len(items) != len(self._entries):
+            self.build(items)
+
+    def query(self, left: float, right: float) -> List[Any]:
+        """Objects whose span overlaps [left, right), in source order."""
+        lefts = self._lefts
+        lo = bisect_left(lefts, left - self._max_width)
+        hi = bisect_left(lefts, right)
+        if lo >= hi:
+            return []
+        hits = [(entry[2], entry[3]) for entry in self._entries[lo:hi] if entry[1] > left]
+        hits.sort(key=_first)
+        return [item for _, item in hits]
@@ -0,0 +1,319 @@
+"""
+Level Cache - Format level biner (.ddlvl) dengan cache otomatis berbasis mtime/hash.
+Menyimpan hasil parse kedua dimensi sebagai packed integer arrays agar load level
+tidak perlu membaca ASCII map karakter per karakter.
+"""
+import pygame
+import os
+import sys
+import struct
+import hashlib
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+
+# File layout:
+#   header  : magic, version, tile_size, 2x source descriptor (mtime_ns, size, sha1)
+#   lengths : per dimension, number of int32 values in each section
+#   body    : all sections of normal then gema, int32 little-endian
+CACHE_MAGIC = b'DDLV'
+CACHE_VERSION = 2  # 2: no merged collision span section
+CACHE_EXTENSION = '.ddlvl'
+
+_HEADER = struct.Struct('<4sHH' + 'qq20s' * 2)
+
+# Section order and record width (ints per record)
+_SECTIONS = (
+    ('platforms', 5),            # x, y, w, h, char
+    ('triggers', 4),             # x, y, w, h
+    ('trap_zones', 4),           # x, y, w, h
+    ('enemy_spawns', 6),         # x, y, w, h, type, facing
+    ('npc_spawns', 6),           # kind, x, y, w, h, facing
+    ('campfires', 4),            # x, y, w, h
+    ('end_triggers', 5),         # x, y, w, h, mode
+    ('left_markers', 2),         # row, x
+    ('right_markers', 2),        # row, x
+    ('scalars', 1),              # see _SCALARS
+)
+_LENGTHS = struct.Struct('<' + 'I' * len(_SECTIONS))
+
+# has_start, start_x, start_y, has_limit, limit, max_width
+_SCALARS = 6
+
+PLATFORM_CHARS = ('G', 'P')
+ENEMY_TYPES = ('patrol', 'chaser', 'chaser_heavy', 'boss')
+FACINGS = ('left', 'right')
+END_MODES = ('jump_walk', 'walk')
+NPC_KINDS = ('A', 'Q', 'W')
+
+
+class CompiledLevelCache:
+    """
+    Cache untuk level yang sudah di-compile ke format biner.
+    Satu file .ddlvl menyimpan data normal dan gema untuk satu level.
+    """
+
+    def __init__(self, tile_size: int = 40):
+        self.tile_size = tile_size
+
+    @staticmethod
+    def cache_path_for(normal_path: str) -> str:
+        """Get compiled file path for a level (level_3_normal.txt -> level_3.ddlvl)."""
+        folder, name = os.path.split(normal_path)
+        stem = os.path.splitext(name)[0]
+        if stem.endswith('_normal'):
+            stem = stem[:-len('_normal')]
+        return os.path.join(folder, stem + CACHE_EXTENSION)
+
+    # Source fingerprint
+    @staticmethod
+    def _fingerprint(path: str, with_hash: bool = True) -> Tuple[int, int, bytes]:
+        """Return (mtime_ns, size, sha1) for a source file."""
+        st = os.stat(path)
+        digest = b''
+        if with_hash:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).digest()
+        return st.st_mtime_ns, st.st_size, digest
+
+    def load(self, normal_path: str, gema_path: str) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Load compiled level if it is still valid for both source files.
+
+        Returns:
+            (normal_data, gema_data) or None if missing/stale
+        """
+        cache_path = self.cache_path_for(normal_path)
+        try:
+            with open(cache_path, 'rb') as f:
+                blob = f.read()
+        except OSError:
+            return None
+
+        if len(blob) < _HEADER.size + 2 * _LENGTHS.size:
+            return None
+
+        refresh = self._check_header(blob, normal_path, gema_path)
+        if refresh is None:
+            return None
+
+        try:
+            normal_data, gema_data = self._decode(blob)
+        except (struct.error, IndexError, ValueError) as e:
+            print(f"[LEVEL] Compiled level {cache_path} unreadable ({e}), rebuilding")
+            return None
+
+        if refresh:
+            # Source was touched but content is identical: just update the header
+            self._rewrite_header(cache_path, normal_path, gema_path)
+
+        return normal_data, gema_data
+
+    def _check_header(self, blob: bytes, normal_path: str, gema_path: str) -> Optional[bool]:
+        """
+        Compare a compiled header with both source files.
+
+        Returns:
+            None if stale, otherwise whether the header needs a refresh
+            (sources touched but content identical)
+        """
+        magic, version, tile_size, n_mtime, n_size, n_hash, g_mtime, g_size, g_hash = \
+            _HEADER.unpack_from(blob, 0)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION or tile_size != self.tile_size:
+            return None
+
+        # Cheap check first (mtime + size), fall back to content hash
+        refresh = False
+        for path, mtime, size, digest in ((normal_path, n_mtime, n_size, n_hash),
+                                          (gema_path, g_mtime, g_size, g_hash)):
+            try:
+                cur_mtime, cur_size, _ = self._fingerprint(path, with_hash=False)
+            except OSError:
+                return None
+            if cur_mtime == mtime and cur_size == size:
+                continue
+            if cur_size != size or self._fingerprint(path)[2] != digest:
+                return None
+            refresh = True
+        return refresh
+
+    def is_fresh(self, normal_path: str, gema_path: str) -> bool:
+        """Check whether the compiled file is valid by reading its header only."""
+        try:
+            with open(self.cache_path_for(normal_path), 'rb') as f:
+                blob = f.read(_HEADER.size)
+        except OSError:
+            return False
+        return len(blob) == _HEADER.size and self._check_header(blob, normal_path, gema_path) is not None
+
+    def save(self, normal_path: str, gema_path: str, normal_data: Dict, gema_data: Dict) -> bool:
+        """
+        Compile parsed level data to disk.
+        Returns True if the file was written.
+        """
+        cache_path = self.cache_path_for(normal_path)
+        try:
+            header = self._build_header(normal_path, gema_path)
+            parts = [header]
+            bodies = []
+            for data in (normal_data, gema_data):
+                lengths, body = self._encode(data)
+                parts.append(_LENGTHS.pack(*lengths))
+                bodies.append(body)
+            for body in bodies:
+                if sys.byteorder != 'little':
+                    body.byteswap()
+                parts.append(body.tobytes())
+
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(parts))
+            os.replace(tmp_path, cache_path)
+            return True
+        except OSError as e:
+            print(f"[LEVEL] Could not write compiled level {cache_path}: {e}")
+            return False
+
+    def _build_header(self, normal_path: str, gema_path: str) -> bytes:
+        n_mtime, n_size, n_hash = self._fingerprint(normal_path)
+        g_mtime, g_size, g_hash = self._fingerprint(gema_path)
+        return _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, self.tile_size,
+                            n_mtime, n_size, n_hash, g_mtime, g_size, g_hash)
+
+    def _rewrite_header(self, cache_path: str, normal_path: str, gema_path: str):
+        try:
+            header = self._build_header(normal_path, gema_path)
+            with open(cache_path, 'r+b') as f:
+                f.write(header)
+        except OSError:
+            pass
+
+    # Encoding
+    def _encode(self, data: Dict) -> Tuple[List[int], array]:
+        """Pack one dimension's level data into an int32 array."""
+        sections: Dict[str, List[int]] = {name: [] for name, _ in _SECTIONS}
+
+        for p in data['platforms']:
+            r = p['rect']
+            sections['platforms'] += (r.x, r.y, r.w, r.h, PLATFORM_CHARS.index(p['char']))
+        for r in data['triggers']:
+            sections['triggers'] += (r.x, r.y, r.w, r.h)
+        for r in data['trap_zones']:
+            sections['trap_zones'] += (r.x, r.y, r.w, r.h)
+        for spawn in data['enemy_spawns']:
+            r = spawn['rect']
+            sections['enemy_spawns'] += (r.x, r.y, r.w, r.h,
+                                         ENEMY_TYPES.index(spawn['type']),
+                                         FACINGS.index(spawn['facing']))
+        for kind, spawns in data['npc_spawns'].items():
+            for spawn in spawns:
+                r = spawn['rect']
+                sections['npc_spawns'] += (NPC_KINDS.index(kind), r.x, r.y, r.w, r.h,
+                                           FACINGS.index(spawn['facing']))
+        for r in data['campfires']:
+            sections['campfires'] += (r.x, r.y, r.w, r.h)
+        for et in data['end_triggers']:
+            r = et['rect']
+            sections['end_triggers'] += (r.x, r.y, r.w, r.h, END_MODES.index(et['mode']))
+        for key in ('left_markers', 'right_markers'):
+            for row, xs in data[key].items():
+                for x in xs:
+                    sections[key] += (row, x)
+
+        start = data['start_pos']
+        limit = data['camera_right_limit']
+        sections['scalars'] = [
+            1 if start else 0, start[0] if start else 0, start[1] if start else 0,
+            1 if limit is not None else 0, limit if limit is not None else 0,
+            data['max_width']
+        ]
+
+        body = array('i')
+        lengths = []
+        for name, _ in _SECTIONS:
+            values = sections[name]
+            lengths.append(len(values))
+            body.extend(values)
+        return lengths, body
+
+    def _decode(self, blob: bytes) -> Tuple[Dict, Dict]:
+        """Unpack both dimensions from a compiled blob."""
+        offset = _HEADER.size
+        all_lengths = []
+        for _ in range(2):
+            all_lengths.append(_LENGTHS.unpack_from(blob, offset))
+            offset += _LENGTHS.size
+
+        body = array('i')
+        body.frombytes(blob[offset:])
+        if sys.byteorder != 'little':
+            body.byteswap()
+
+        results = []
+        pos = 0
+        for lengths in all_lengths:
+            views = {}
+            for (name, width), length in zip(_SECTIONS, lengths):
+                if length % width:
+                    raise ValueError(f"section {name} has bad length {length}")
+                views[name] = body[pos:pos + length]
+                pos += length
+            results.append(self._build_level_data(views))
+        if pos != len(body):
+            raise ValueError("trailing data")
+        return results[0], results[1]
+
+    def _build_level_data(self, v: Dict[str, array]) -> Dict:
+        Rect = pygame.Rect
+        scalars = v['scalars']
+        if len(scalars) != _SCALARS:
+            raise ValueError("bad scalar block")
+
+        level_data = {
+            'platforms': [],
+            'triggers': [],
+            'trap_zones': [],
+            'enemy_spawns': [],
+            'npc_spawns': {kind: [] for kind in NPC_KINDS},
+            'campfires': [],
+            'end_triggers': [],
+            'start_pos': (scalars[1], scalars[2]) if scalars[0] else None,
+            'left_markers': {},
+            'right_markers': {},
+            'camera_right_limit': scalars[4] if scalars[3] else None,
+            'max_width': scalars[5]
+        }
+
+        a = v['platforms']
+        level_data['platforms'] = [
+            {'rect': Rect(a[i], a[i + 1], a[i + 2], a[i + 3]), 'char': PLATFORM_CHARS[a[i + 4]]}
+            for i in range(0, len(a), 5)
+        ]
+        for key in ('triggers', 'trap_zones', 'campfires'):
+            a = v[key]
+            level_data[key] = [Rect(a[i], a[i + 1], a[i + 2], a[i + 3]) for i in range(0, len(a), 4)]
+
+        a = v['enemy_spawns']
+        level_data['enemy_spawns'] = [
+            {'rect': Rect(a[i], a[i + 1], a[i + 2], a[i + 3]),
+             'type': ENEMY_TYPES[a[i + 4]], 'facing': FACINGS[a[i + 5]]}
+            for i in range(0, len(a), 6)
+        ]
+        a = v['npc_spawns']
+        for i in range(0, len(a), 6):
+            level_data['npc_spawns'][NPC_KINDS[a[i]]].append({
+                'rect': Rect(a[i + 1], a[i + 2], a[i + 3], a[i + 4]),
+                'facing': FACINGS[a[i + 5]]
+            })
+        a = v['end_triggers']
+        level_data['end_triggers'] = [
+            {'rect': Rect(a[i], a[i + 1], a[i + 2], a[i + 3]), 'mode': END_MODES[a[i + 4]]}
+            for i in range(0, len(a), 5)
+        ]
+        for key in ('left_markers', 'right_markers'):
+            a = v[key]
+            markers = level_data[key]
+            for i in range(0, len(a), 2):
+                markers.setdefault(a[i], []).append(a[i + 1])
+
+        return level_data
@@ -2,28 +2,75 @@
 Level Controller - Mengelola level loading, setup, dan progression.
 Memisahkan logic level dari main game class.
 """
-import pygame
 import os
 from typing import List, Tuple, Dict, Optional
 from utils.exception import LevelFileNotFound
+from core.span_merge import merge_platform_spans
+from core.level_cache import CompiledLevelCache
+from core.level_diff import apply_dimension_diff
+from core.level_index import LevelIndex
+from core.level_stream import ChunkedLevel
+from core.level_parser import LevelParser
+from core.nav_graph import NavGraph
+from core.vector_parser import NUMPY_AVAILABLE, parse_level_array
+from utils.settings import LEVEL_STREAM_MIN_COLUMNS, LEVEL_CHUNK_COLUMNS
 
 
 class LevelController:
     """Controller untuk mengelola level progression dan loading."""
     
-    def __init__(self, levels_dir: str, tile_size: int = 40):
+    MAX_LEVEL_LINES = 1000
+    
+    def __init__(self, levels_dir: str, tile_size: int = 40, merge_spans: bool = False,
+                 use_compiled_cache: bool = True, use_vector_parser: bool = False,
+                 dedupe_dimensions: bool = True):
         self.levels_dir = levels_dir
         self.tile_size = tile_size
         self.current_level_index = 0
         
-        # Level definitions (normal, gema pairs)
-        self.level_files = [
-            ("level_1_normal.txt", "level_1_gema.txt"),
-            ("level_2_normal.txt", "level_2_gema.txt"),
-            ("level_3_normal.txt", "level_3_gema.txt"),
-            ("level_4_normal.txt", "level_4_gema.txt")
-        ]
+        # Optional span merge stage: adjacent G/P tiles folded into one collision rect
+        self.merge_spans = merge_spans
+        
+        # Tiles identical in both maps become one shared 'both' layer
+        self.dedupe_dimensions = dedupe_dimensions
+        
+        # Compiled binary levels (.ddlvl), rebuilt when the source .txt changes
+        self.compiled_cache = CompiledLevelCache(tile_size) if use_compiled_cache else None
+        
+        # Symbol-table parser shared with LevelManager and level streaming
+        self.parser = LevelParser(tile_size)
+        
+        # NumPy parse path, opt-in: only pays off on maps thousands of columns wide
+        # (see tools/bench_level_parser.py); needs NumPy installed
+        self.use_vector_parser = use_vector_parser and NUMPY_AVAILABLE
+        
+        # Levels wider than this are streamed in chunks instead of parsed up front
+        self.stream_min_columns = LEVEL_STREAM_MIN_COLUMNS
+        self.chunk_columns = LEVEL_CHUNK_COLUMNS
+        
+        # Walkable spans of the last platform list snapped against (platforms, count, graph)
+        self._ground_nav = None
+        
+        # Level definitions (normal, gema pairs) come from the persisted index,
+        # refreshed once on first use
+        self.level_index = LevelIndex(levels_dir, tile_size)
+        self._level_entries: Optional[List[Dict]] = None
         
+    @property
+    def level_entries(self) -> List[Dict]:
+        """Index entries of all levels, in order (see LevelIndex)."""
+        if self._level_entries is None:
+            changed = self.level_index.refresh()
+            if changed:
+                print(f"[LEVEL] Level index updated: {len(changed)} level(s) changed")
+            self._level_entries = self.level_index.levels
+        return self._level_entries
+    
+    @property
+    def level_files(self) -> List[Tuple[str, str]]:
+        """(normal, gema) file names in level order."""
+        return [(e['normal']['file'], e['gema']['file']) for e in self.level_entries]
+    
     @property
     def total_levels(self) -> int:
         """Get total number of levels."""
@@ -68,12 +115,95 @@ class LevelController:
         else:
             self.current_level_index = 0
     
-    def parse_level_file(self, filepath: str) -> Dict:
+    def load_level_pair(self, level_index: Optional[int] = None) -> Tuple[Dict, Dict]:
         """
-        Parse a level file and return level data.
-        Returns dict with platforms, enemy_spawns, triggers, etc.
+        Load normal and gema data for a level.
+        Uses the compiled .ddlvl file when it is still valid, otherwise parses
+        both ASCII maps and recompiles.
+        
+        Returns:
+            (normal_data, gema_data)
+        """
+        normal_path, gema_path = self.get_level_paths(level_index)
+        
+        cached = None
+        if self.compiled_cache:
+            cached = self.compiled_cache.load(normal_path, gema_path)
+        
+        if cached is not None:
+            normal_data, gema_data = cached
+        else:
+            normal_data = self.parse_level_file(normal_path)
+            gema_data = self.parse_level_file(gema_path)
+            
+            if self.compiled_cache:
+                if self.compiled_cache.save(normal_path, gema_path, normal_data, gema_data):
+                    print(f"[LEVEL] Compiled {os.path.basename(self.compiled_cache.cache_path_for(normal_path))}")
+                    self._mark_compiled(level_index)
+        
+        if self.dedupe_dimensions:
+            counts = apply_dimension_diff(normal_data, gema_data)
+            print(f"[LEVEL] Dimension diff {os.path.basename(normal_path)}: {counts['shared']} shared tiles, "
+                  f"{counts['normal']} normal-only, {counts['gema']} gema-only")
+        
+        if self.merge_spans:
+            stats = self.apply_span_merge(normal_data, gema_data)
+            print(f"[LEVEL] Span merge {os.path.basename(normal_path)}: "
+                  f"{stats['tiles']} tiles -> {stats['spans']} rects")
+        
+        return normal_data, gema_data
+    
+    def should_stream(self, level_index: Optional[int] = None) -> bool:
+        """Check if a level is wide enough to be loaded in chunks (from the index)."""
+        number = self._entry(level_index)['number']
+        return self.level_index.max_columns(number) >= self.stream_min_columns
+    
+    def _entry(self, level_index: Optional[int] = None) -> Dict:
+        if level_index is None:
+            level_index = self.current_level_index
+        if level_index >= len(self.level_entries):
+            raise IndexError(f"Level index {level_index} out of range")
+        return self.level_entries[level_index]
+    
+    def _mark_compiled(self, level_index: Optional[int] = None):
+        if self._level_entries is not None:
+            self.level_index.mark_compiled(self._entry(level_index)['number'])
+    
+    def open_level_stream(self, level_index: Optional[int] = None) -> ChunkedLevel:
+        """Open a chunked, streaming view of a level."""
+        normal_path, gema_path = self.get_level_paths(level_index)
+        return ChunkedLevel(
+            normal_path, gema_path, self.parse_level_chunk,
+            tile_size=self.tile_size, chunk_columns=self.chunk_columns,
+            pair_hook=self._prepare_chunk_pair if self.dedupe_dimensions or self.merge_spans else None
+        )
+    
+    def _prepare_chunk_pair(self, normal_data: Dict, gema_data: Dict):
+        """Same post-load stages as load_level_pair, per streamed chunk."""
+        if self.dedupe_dimensions:
+            apply_dimension_diff(normal_data, gema_data)
+        if self.merge_spans:
+            self.apply_span_merge(normal_data, gema_data)
+    
+    def parse_level_chunk(self, rows: List[Tuple[int, str]], col_offset: int) -> Dict:
+        """
+        Parse a column range of a level (see LevelStreamReader.read_columns).
+        
+        Args:
+            rows: List of (row, text) where text starts at column col_offset
+            col_offset: First column of the chunk
+        
+        Returns:
+            Level data dict for the chunk only
         """
-        level_data = {
+        level_data = self._new_level_data()
+        self.parser.parse_lines(rows, level_data, col_offset)
+        return level_data
+    
+    @staticmethod
+    def _new_level_data() -> Dict:
+        """Empty level data dict."""
+        return {
             'platforms': [],
             'triggers': [],
             'trap_zones': [],
@@ -87,112 +217,62 @@ class LevelController:
             'camera_right_limit': None,
             'max_width': 0
         }
-        
+    
+    def parse_level_file(self, filepath: str) -> Dict:
+        """
+        Parse a level file and return level data.
+        Returns dict with platforms, enemy_spawns, triggers, etc.
+        """
+        if not self.use_vector_parser:
+            return self.parse_level_file_scalar(filepath)
         try:
-            line_count = 0
-            max_lines = 1000  # Safety limit to prevent infinite loops
-            
-            with open(filepath, 'r') as file:
-                for y, line in enumerate(file):
-                    line_count += 1
-                    if line_count > max_lines:
-                        print(f"Warning: Level file {filepath} exceeded {max_lines} lines, stopping parse")
-                        break
-                    
-                    for x, char in enumerate(line):
-                        world_x = x * self.tile_size
-                        world_y = y * self.tile_size
-                        rect = pygame.Rect(world_x, world_y, self.tile_size, self.tile_size)
-                        
-                        if world_x > level_data['max_width']:
-                            level_data['max_width'] = world_x
-                        
-                        # Parse different tile types
-                        self._parse_tile(char, rect, world_x, world_y, y, level_data)
-                        
+            return parse_level_array(filepath, self.parser, self._new_level_data(), self.MAX_LEVEL_LINES)
+        except FileNotFoundError:
+            raise LevelFileNotFound(filepath)
+    
+    def parse_level_file_scalar(self, filepath: str) -> Dict:
+        """Parse a level file with the symbol-table parser (no NumPy)."""
+        try:
+            return self.parser.parse_file(filepath, self._new_level_data(), self.MAX_LEVEL_LINES)
         except FileNotFoundError:
             raise LevelFileNotFound(filepath)
         except Exception as e:
             print(f"Error parsing level file {filepath}: {e}")
             raise
-        
-        return level_data
     
-    def _parse_tile(self, char: str, rect: pygame.Rect, world_x: int, world_y: int, row: int, level_data: Dict):
-        """Parse individual tile character and update level_data."""
-        # Ground tiles
-        if char in 'Gg':
-            level_data['platforms'].append({'rect': rect, 'char': 'G'})
-        
-        # Platform tiles
-        elif char in 'Pp':
-            plat_rect = pygame.Rect(world_x, world_y, self.tile_size, 20)
-            level_data['platforms'].append({'rect': plat_rect, 'char': 'P'})
-        
-        # Enemies
-        elif char in 'Hh':
-            facing = 'right' if char == 'H' else 'left'
-            level_data['enemy_spawns'].append({
-                'rect': rect, 'type': 'patrol', 'facing': facing
-            })
-        elif char in 'Nn':
-            facing = 'right' if char == 'N' else 'left'
-            level_data['enemy_spawns'].append({
-                'rect': rect, 'type': 'chaser_heavy', 'facing': facing
-            })
-        elif char in 'Ff':
-            facing = 'right' if char == 'F' else 'left'
-            level_data['enemy_spawns'].append({
-                'rect': rect, 'type': 'chaser', 'facing': facing
-            })
-        elif char in 'Bb':
-            facing = 'right' if char == 'B' else 'left'
-            level_data['enemy_spawns'].append({
-                'rect': rect, 'type': 'boss', 'facing': facing
-            })
-        
-        # Triggers and traps
-        elif char in 'Tt':
-            level_data['triggers'].append(rect)
-        elif char in 'jJyY':
-            level_data['trap_zones'].append(rect)
-        
-        # Start position
-        elif char in 'Ss':
-            level_data['start_pos'] = (world_x, world_y + self.tile_size)
-        
-        # End triggers
-        elif char == 'D':
-            level_data['end_triggers'].append({'rect': rect, 'mode': 'jump_walk'})
-        elif char == 'd':
-            level_data['end_triggers'].append({'rect': rect, 'mode': 'walk'})
-        
-        # Campfires
-        elif char in 'Cc':
-            level_data['campfires'].append(rect)
-        
-        # Patrol markers
-        elif char in 'lL':
-            level_data['left_markers'].setdefault(row, []).append(world_x + self.tile_size // 2)
-        elif char in 'rR':
-            level_data['right_markers'].setdefault(row, []).append(world_x + self.tile_size // 2)
-        
-        # NPCs
-        elif char in 'Aa':
-            facing = 'left' if char == 'A' else 'right'
-            level_data['npc_spawns']['A'].append({'rect': rect, 'facing': facing})
-        elif char in 'Qq':
-            facing = 'left' if char == 'Q' else 'right'
-            level_data['npc_spawns']['Q'].append({'rect': rect, 'facing': facing})
-        elif char in 'Ww':
-            facing = 'left' if char == 'W' else 'right'
-            level_data['npc_spawns']['W'].append({'rect': rect, 'facing': facing})
-        
-        # Camera limit
-        elif char == 'K':
-            level_data['camera_right_limit'] = world_x + self.tile_size // 2
+    @staticmethod
+    def apply_span_merge(normal_data: Dict, gema_data: Dict) -> Dict[str, int]:
+        """
+        Add merged collision spans for each platform layer of a level pair.
+        
+        Runs after the dimension diff, so each layer ('platforms', or the
+        'shared_'/'own_' lists) gets a matching '..collision_platforms' list that
+        GameSetup feeds to CollisionGrid. The tile lists stay untouched for
+        rendering; the before/after count is stored in 'span_stats'.
+        """
+        prefixes = ('shared_', 'own_') if 'shared_platforms' in normal_data else ('',)
+        merged = {}  # id(tile list) -> spans; the shared layer is one list in both dicts
+        stats = {'tiles': 0, 'spans': 0}
+        for data in (normal_data, gema_data):
+            for prefix in prefixes:
+                tiles = data[prefix + 'platforms']
+                if id(tiles) not in merged:
+                    merged[id(tiles)] = merge_platform_spans(tiles)
+                    stats['tiles'] += len(tiles)
+                    stats['spans'] += len(merged[id(tiles)])
+                data[prefix + 'collision_platforms'] = merged[id(tiles)]
+            data['span_stats'] = stats
+        return stats
     
     # Platform utility methods
+    def ground_nav(self, platforms: list) -> NavGraph:
+        """Span-only NavGraph of `platforms`, built once per platform list."""
+        cached = self._ground_nav
+        if cached is None or cached[0] is not platforms or cached[1] != len(platforms):
+            cached = (platforms, len(platforms), NavGraph.from_platforms(platforms, self.tile_size))
+            self._ground_nav = cached
+        return cached[2]
+    
     def ground_rect_at_or_near(self, platforms: list, x: float, dim: str = 'normal', max_dx: int = 160):
         """
         Find ground rect at or near x position.
@@ -204,22 +284,28 @@ class LevelController:
             max_dx: Maximum distance to search
         
         Returns:
-            pygame.Rect or None
+            pygame.Rect of the walkable span (1 px tall) or None
         """
-        # Find exact matches (x is within platform bounds)
-        exact = [p['rect'] for p in platforms
-                if p['dim'] in [dim, 'both'] and p['rect'].left <= x <= p['rect'].right]
-        if exact:
-            return min(exact, key=lambda r: r.top)
-        
-        # Find nearby platforms
-        near = [(abs(x - r.centerx), r) for r in
-                (p['rect'] for p in platforms if p['dim'] in [dim, 'both'])]
-        near = [t for t in near if t[0] <= max_dx]
-        if near:
-            return min(near, key=lambda t: (t[0], t[1].top))[1]
-        
-        return None
+        layer = self.ground_nav(platforms).layer(dim)
+        x = int(x)
+        
+        # Highest span under x
+        span = layer.topmost(x)
+        if span:
+            return span.rect
+        
+        # Nearest span within max_dx, checked column by column outwards
+        ts = self.tile_size
+        best = None
+        for col in range((x - max_dx) // ts, (x + max_dx) // ts + 1):
+            probe = min(max(x, col * ts), col * ts + ts - 1)
+            candidate = layer.topmost(probe)
+            if candidate is None:
+                continue
+            key = (abs(x - probe), candidate.top)
+            if key[0] <= max_dx and (best is None or key < best[0]):
+                best = (key, candidate)
+        return best[1].rect if best else None
     
     def snap_actor_to_ground(self, platforms: list, actor_rect, dim: str = 'normal', max_dx: int = 160) -> bool:
         """
@@ -0,0 +1,47 @@
+"""
+Level Diff - Memisahkan tile yang sama persis di kedua dimensi.
+Tile yang identik di map normal dan gema cukup disimpan sekali sebagai
+layer 'both'; hanya selisihnya yang tetap per dimensi.
+"""
+from typing import Dict, List, Tuple
+
+
+def _tile_key(p: Dict) -> Tuple[int, int, int, int, str]:
+    r = p['rect']
+    return r.x, r.y, r.w, r.h, p['char']
+
+
+def diff_dimension_tiles(normal_tiles: List[Dict], gema_tiles: List[Dict]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """
+    Split two platform lists into (shared, normal_only, gema_only).
+    Each list keeps the scan order of its source.
+    """
+    normal_keys = {_tile_key(p) for p in normal_tiles}
+    gema_keys = {_tile_key(p) for p in gema_tiles}
+
+    shared = [p for p in normal_tiles if _tile_key(p) in gema_keys]
+    normal_only = [p for p in normal_tiles if _tile_key(p) not in gema_keys]
+    gema_only = [p for p in gema_tiles if _tile_key(p) not in normal_keys]
+    return shared, normal_only, gema_only
+
+
+def apply_dimension_diff(normal_data: Dict, gema_data: Dict) -> Dict[str, int]:
+    """
+    Add shared/own platform layers to a level pair (in place).
+
+    Sets on both dicts:
+        'shared_platforms' : tiles identical in both maps (same list object)
+        'own_platforms'    : tiles only in this map
+
+    The full 'platforms' lists are left untouched.
+
+    Returns:
+        Counts {'shared', 'normal', 'gema'} of tiles per layer
+    """
+    shared, normal_only, gema_only = diff_dimension_tiles(normal_data['platforms'], gema_data['platforms'])
+
+    for data, own in ((normal_data, normal_only), (gema_data, gema_only)):
+        data['shared_platforms'] = shared
+        data['own_platforms'] = own
+
+    return {'shared': len(shared), 'normal': len(normal_only), 'gema': len(gema_only)}
@@ -0,0 +1,195 @@
+"""
+Level Index - Daftar level yang di-cache ke disk (levels/level_index.json).
+Menyimpan nomor level, file tiap dimensi, ukuran, histogram simbol, mtime dan
+status compiled cache. Saat startup hanya folder yang di-scan (stat); file map
+hanya dibaca ulang kalau mtime/ukurannya berubah.
+"""
+import json
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from core.level_cache import CompiledLevelCache
+
+
+INDEX_FILENAME = 'level_index.json'
+INDEX_VERSION = 1
+
+# level_<number>_<dimension>.txt
+LEVEL_FILE_PATTERN = re.compile(r'^level_(\d+)_(normal|gema)\.txt$')
+
+
+class LevelIndex:
+    """
+    Index level yang persisten dan di-update secara incremental.
+
+    Entry per level:
+        {'number': 3,
+         'normal': {'file', 'mtime_ns', 'size', 'rows', 'columns', 'symbols'},
+         'gema':   {...},
+         'compiled': {'mtime_ns', 'valid'}}
+    """
+
+    def __init__(self, levels_dir: str, tile_size: int = 40):
+        self.levels_dir = levels_dir
+        self.tile_size = tile_size
+        self.path = os.path.join(levels_dir, INDEX_FILENAME)
+        self._levels: Dict[int, Dict] = {}
+        self._loaded = False
+        self._dirty = False
+        # mark_compiled may be called from the prefetch thread
+        self._lock = threading.Lock()
+
+    # Persistence
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != INDEX_VERSION or data.get('tile_size') != self.tile_size:
+            return
+        self._levels = {entry['number']: entry for entry in data.get('levels', [])}
+
+    def save(self) -> bool:
+        """Write the index if it changed. Returns True if the file was written."""
+        with self._lock:
+            return self._save_locked()
+
+    def _save_locked(self) -> bool:
+        if not self._dirty:
+            return False
+        data = {
+            'version': INDEX_VERSION,
+            'tile_size': self.tile_size,
+            'levels': [self._levels[n] for n in sorted(self._levels)],
+        }
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[LEVEL] Could not write level index {self.path}: {e}")
+            return False
+        self._dirty = False
+        return True
+
+    # Scanning
+    @staticmethod
+    def _describe_map(path: str, st: os.stat_result) -> Dict:
+        """Read one map file: size, dimensions and symbol histogram."""
+        with open(path, 'r') as f:
+            lines = f.read().split('\n')
+        symbols = Counter(c for line in lines for c in line if not c.isspace())
+        return {
+            'file': os.path.basename(path),
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'rows': len(lines),
+            'columns': max((len(line.rstrip('\r')) for line in lines), default=0),
+            'symbols': dict(sorted(symbols.items())),
+        }
+
+    def refresh(self) -> List[int]:
+        """
+        Bring the index up to date with the levels folder.
+        Only stats files; maps are re-read when their mtime or size changed.
+
+        Returns:
+            Level numbers whose entry was added, changed or removed
+        """
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+        found: Dict[int, Dict[str, os.DirEntry]] = {}
+        compiled: Dict[str, os.DirEntry] = {}
+        try:
+            entries = list(os.scandir(self.levels_dir))
+        except OSError:
+            print(f"[WARNING] Levels folder not found: {self.levels_dir}")
+            entries = []
+        for entry in entries:
+            match = LEVEL_FILE_PATTERN.match(entry.name)
+            if match:
+                found.setdefault(int(match.group(1)), {})[match.group(2)] = entry
+            elif entry.name.endswith('.ddlvl'):
+                compiled[entry.name] = entry
+
+        changed = [n for n in self._levels if set(found.get(n, ())) != {'normal', 'gema'}]
+        for number in changed:
+            del self._levels[number]
+
+        for number, files in found.items():
+            if set(files) != {'normal', 'gema'}:
+                continue
+            old = self._levels.get(number)
+            entry = {'number': number}
+            for dim in ('normal', 'gema'):
+                st = files[dim].stat()
+                prev = old.get(dim) if old else None
+                if prev and prev['file'] == files[dim].name and \
+                        prev['mtime_ns'] == st.st_mtime_ns and prev['size'] == st.st_size:
+                    entry[dim] = prev
+                else:
+                    entry[dim] = self._describe_map(files[dim].path, st)
+
+            entry['compiled'] = self._compiled_state(entry, compiled, old)
+            if entry != old:
+                self._levels[number] = entry
+                changed.append(number)
+
+        if changed:
+            self._dirty = True
+            self.save()
+        return sorted(changed)
+
+    def _compiled_state(self, entry: Dict, compiled: Dict[str, os.DirEntry], old: Optional[Dict]) -> Dict:
+        """Compiled cache status; the .ddlvl header is only read when something changed."""
+        normal_path, gema_path = self._paths(entry)
+        name = os.path.basename(CompiledLevelCache.cache_path_for(normal_path))
+        cache_entry = compiled.get(name)
+        if cache_entry is None:
+            return {'mtime_ns': None, 'valid': False}
+        mtime = cache_entry.stat().st_mtime_ns
+        if old and old['compiled']['mtime_ns'] == mtime and \
+                old['normal'] is entry['normal'] and old['gema'] is entry['gema']:
+            return old['compiled']
+        valid = CompiledLevelCache(self.tile_size).is_fresh(normal_path, gema_path)
+        return {'mtime_ns': mtime, 'valid': valid}
+
+    def mark_compiled(self, number: int):
+        """Record that the compiled cache of a level was just (re)written."""
+        entry = self._levels.get(number)
+        if entry is None:
+            return
+        normal_path, _ = self._paths(entry)
+        try:
+            mtime = os.stat(CompiledLevelCache.cache_path_for(normal_path)).st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            entry['compiled'] = {'mtime_ns': mtime, 'valid': True}
+            self._dirty = True
+            self._save_locked()
+
+    # Queries
+    def _paths(self, entry: Dict) -> Tuple[str, str]:
+        return (os.path.join(self.levels_dir, entry['normal']['file']),
+                os.path.join(self.levels_dir, entry['gema']['file']))
+
+    @property
+    def levels(self) -> List[Dict]:
+        """All complete levels, ordered by number."""
+        return [self._levels[n] for n in sorted(self._levels)]
+
+    def get(self, number: int) -> Optional[Dict]:
+        return self._levels.get(number)
+
+    def max_columns(self, number: int) -> int:
+        """Widest row over both dimension maps."""
+        entry = self._levels[number]
+        return max(entry['normal']['columns'], entry['gema']['columns'])
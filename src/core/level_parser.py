@@ -0,0 +1,219 @@
+"""
+Level Parser - Satu parser berbasis tabel simbol untuk semua map ASCII.
+Dipakai oleh LevelController, LevelManager, level streaming dan vector_parser.
+Simbol baru cukup didaftarkan di SYMBOL_TABLE tanpa mengubah loop parsing.
+"""
+import re
+import pygame
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+
+class TileSymbol(NamedTuple):
+    """
+    Deskripsi satu karakter map.
+
+    category: jenis objek ('platform', 'enemy', 'npc', 'trigger', 'trap',
+              'campfire', 'end', 'start', 'left_marker', 'right_marker',
+              'camera_limit')
+    kind: sub-jenis (char platform, tipe enemy, jenis NPC, mode end trigger)
+    facing: arah hadap untuk enemy/NPC
+    height: tinggi rect dalam pixel (None = satu tile)
+    offset: titik hasil relatif ke pojok kiri-atas tile, dalam satuan tile
+    """
+    category: str
+    kind: Optional[str] = None
+    facing: Optional[str] = None
+    height: Optional[int] = None
+    offset: Tuple[float, float] = (0, 0)
+
+
+def _pair(upper: str, lower: str, category: str, kind: str,
+          upper_facing: str, lower_facing: str) -> Dict[str, TileSymbol]:
+    return {
+        upper: TileSymbol(category, kind, upper_facing),
+        lower: TileSymbol(category, kind, lower_facing),
+    }
+
+
+# Symbol set from levels/SOP Level.md
+SYMBOL_TABLE: Dict[str, TileSymbol] = {
+    # Solid tiles
+    'G': TileSymbol('platform', 'G'), 'g': TileSymbol('platform', 'G'),
+    'P': TileSymbol('platform', 'P', height=20), 'p': TileSymbol('platform', 'P', height=20),
+
+    # Enemies (uppercase faces right)
+    **_pair('H', 'h', 'enemy', 'patrol', 'right', 'left'),
+    **_pair('N', 'n', 'enemy', 'chaser_heavy', 'right', 'left'),
+    **_pair('F', 'f', 'enemy', 'chaser', 'right', 'left'),
+    **_pair('B', 'b', 'enemy', 'boss', 'right', 'left'),
+
+    # NPCs (uppercase faces left)
+    **_pair('A', 'a', 'npc', 'A', 'left', 'right'),
+    **_pair('Q', 'q', 'npc', 'Q', 'left', 'right'),
+    **_pair('W', 'w', 'npc', 'W', 'left', 'right'),
+
+    # Triggers, traps, campfires
+    'T': TileSymbol('trigger'), 't': TileSymbol('trigger'),
+    'j': TileSymbol('trap'), 'J': TileSymbol('trap'),
+    'y': TileSymbol('trap'), 'Y': TileSymbol('trap'),
+    'C': TileSymbol('campfire'), 'c': TileSymbol('campfire'),
+
+    # Level flow
+    'S': TileSymbol('start', offset=(0, 1)), 's': TileSymbol('start', offset=(0, 1)),
+    'D': TileSymbol('end', 'jump_walk'), 'd': TileSymbol('end', 'walk'),
+    'K': TileSymbol('camera_limit', offset=(0.5, 0)),
+
+    # Patrol markers
+    'l': TileSymbol('left_marker', offset=(0.5, 0)), 'L': TileSymbol('left_marker', offset=(0.5, 0)),
+    'r': TileSymbol('right_marker', offset=(0.5, 0)), 'R': TileSymbol('right_marker', offset=(0.5, 0)),
+}
+
+# Output key per category
+CONTROLLER_LAYOUT: Dict[str, str] = {
+    'platform': 'platforms',
+    'enemy': 'enemy_spawns',
+    'npc': 'npc_spawns',
+    'trigger': 'triggers',
+    'trap': 'trap_zones',
+    'campfire': 'campfires',
+    'end': 'end_triggers',
+    'start': 'start_pos',
+    'camera_limit': 'camera_right_limit',
+    'left_marker': 'left_markers',
+    'right_marker': 'right_markers',
+}
+
+MANAGER_LAYOUT: Dict[str, str] = dict(
+    CONTROLLER_LAYOUT,
+    enemy='enemies', npc='npcs', trap='traps', camera_limit='camera_limit'
+)
+
+# Categories that describe the whole level rather than a placed object
+GLOBAL_CATEGORIES = ('start', 'camera_limit', 'left_marker', 'right_marker')
+
+_NON_BLANK = re.compile(r'[^ \n]+')
+
+
+def register_symbol(char: str, symbol: TileSymbol):
+    """Add or replace a map symbol (takes effect for parsers created afterwards)."""
+    if len(char) != 1:
+        raise ValueError(f"Map symbol must be a single character, got {char!r}")
+    SYMBOL_TABLE[char] = symbol
+
+
+def symbols_in(categories: Iterable[str]) -> str:
+    """All characters whose category is in `categories`."""
+    wanted = set(categories)
+    return ''.join(c for c, s in SYMBOL_TABLE.items() if s.category in wanted)
+
+
+Handler = Callable[[int, int], None]
+
+
+class LevelParser:
+    """
+    Parser map ASCII yang di-compile dari SYMBOL_TABLE.
+    Untuk tiap parse, setiap simbol di-bind ke satu handler sehingga loop
+    hanya melakukan satu dict lookup per karakter non-spasi.
+    """
+
+    def __init__(self, tile_size: int = 40, layout: Optional[Dict[str, str]] = None,
+                 symbols: Optional[Dict[str, TileSymbol]] = None):
+        self.tile_size = tile_size
+        self.layout = layout or CONTROLLER_LAYOUT
+        self.symbols = dict(symbols if symbols is not None else SYMBOL_TABLE)
+
+    def bind(self, level_data: Dict) -> Dict[str, Handler]:
+        """Build char -> handler(col, row) writing into `level_data`."""
+        return {char: self._make_handler(symbol, level_data) for char, symbol in self.symbols.items()}
+
+    def _make_handler(self, symbol: TileSymbol, level_data: Dict) -> Handler:
+        ts = self.tile_size
+        Rect = pygame.Rect
+        height = symbol.height or ts
+        ox, oy = int(symbol.offset[0] * ts), int(symbol.offset[1] * ts)
+        key = self.layout[symbol.category]
+        category, kind, facing = symbol.category, symbol.kind, symbol.facing
+
+        if category == 'platform':
+            out = level_data[key]
+            return lambda col, row: out.append({'rect': Rect(col * ts, row * ts, ts, height), 'char': kind})
+
+        if category == 'enemy':
+            out = level_data[key]
+            return lambda col, row: out.append(
+                {'rect': Rect(col * ts, row * ts, ts, height), 'type': kind, 'facing': facing})
+
+        if category == 'npc':
+            if isinstance(level_data[key], dict):
+                # Grouped by kind: {'A': [...], 'Q': [...], ...}
+                out = level_data[key].setdefault(kind, [])
+                return lambda col, row: out.append(
+                    {'rect': Rect(col * ts, row * ts, ts, height), 'facing': facing})
+            out = level_data[key]
+            return lambda col, row: out.append(
+                {'rect': Rect(col * ts, row * ts, ts, height), 'type': kind, 'facing': facing})
+
+        if category == 'end':
+            out = level_data[key]
+            return lambda col, row: out.append({'rect': Rect(col * ts, row * ts, ts, height), 'mode': kind})
+
+        if category in ('trigger', 'trap', 'campfire'):
+            out = level_data[key]
+            return lambda col, row: out.append(Rect(col * ts, row * ts, ts, height))
+
+        if category in ('left_marker', 'right_marker'):
+            markers = level_data[key]
+            return lambda col, row: markers.setdefault(row, []).append(col * ts + ox)
+
+        if category == 'start':
+            def set_start(col, row):
+                level_data[key] = (col * ts + ox, row * ts + oy)
+            return set_start
+
+        if category == 'camera_limit':
+            def set_limit(col, row):
+                level_data[key] = col * ts + ox
+            return set_limit
+
+        raise ValueError(f"Unknown map symbol category: {category}")
+
+    def parse_lines(self, lines: Iterable[Tuple[int, str]], level_data: Dict,
+                    col_offset: int = 0) -> int:
+        """
+        Parse (row, text) lines into `level_data`.
+        Runs of blanks are skipped in bulk with a regex; characters without a
+        symbol are ignored.
+
+        Returns:
+            Highest column index visited (newline included), like the old per-char loop
+        """
+        handlers = self.bind(level_data)
+        get = handlers.get
+        max_col = 0
+        for row, line in lines:
+            if line:
+                max_col = max(max_col, col_offset + len(line) - 1)
+            for m in _NON_BLANK.finditer(line):
+                col = col_offset + m.start()
+                for char in m.group():
+                    handler = get(char)
+                    if handler is not None:
+                        handler(col, row)
+                    col += 1
+        return max_col
+
+    def parse_file(self, filepath: str, level_data: Dict, max_lines: Optional[int] = None) -> Dict:
+        """
+        Parse a whole map file into `level_data` and set 'max_width'.
+        Raises FileNotFoundError if the file is missing.
+        """
+        with open(filepath, 'r') as file:
+            lines = file.readlines()
+        if max_lines is not None and len(lines) > max_lines:
+            print(f"Warning: Level file {filepath} exceeded {max_lines} lines, stopping parse")
+            lines = lines[:max_lines]
+
+        max_col = self.parse_lines(enumerate(lines), level_data)
+        level_data['max_width'] = max_col * self.tile_size
+        return level_data
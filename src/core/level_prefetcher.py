@@ -0,0 +1,88 @@
+"""
+Level Prefetcher - Menyiapkan level berikutnya di background thread.
+Parsing file level dan pembuatan struktur statis (platform, span collision,
+trap, end trigger) dilakukan sebelum pemain sampai di akhir level, sehingga
+transisi hanya menukar struktur yang sudah jadi. Entity (enemy/NPC/campfire)
+memuat sprite dan font lewat pygame, jadi tetap dibuat di main thread.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from core.game_setup import GameSetup
+from core.level_controller import LevelController
+
+
+class LevelPrefetcher:
+    """
+    Satu worker thread yang membangun data level berikutnya.
+    Hanya menyimpan satu request aktif; request untuk level lain menggantikannya.
+    """
+
+    def __init__(self, level_controller: LevelController):
+        self.level_controller = level_controller
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='level-prefetch')
+        self._future: Optional[Future] = None
+        self._level_index: Optional[int] = None
+
+    def request(self, level_index: int) -> bool:
+        """
+        Start prefetching a level if it is not already queued.
+        Returns True if a new job was submitted.
+        """
+        if self._future is not None and self._level_index == level_index:
+            return False
+        if not 0 <= level_index < self.level_controller.total_levels:
+            return False
+
+        self._level_index = level_index
+        self._future = self._executor.submit(self._build, level_index)
+        print(f"[LEVEL] Prefetching level {level_index + 1}")
+        return True
+
+    def is_requested(self, level_index: int) -> bool:
+        return self._future is not None and self._level_index == level_index
+
+    def take(self, level_index: int) -> Optional[Dict]:
+        """
+        Get the prefetched level, waiting for the worker if it is still running.
+        Returns None if nothing was prefetched for this level or the job failed.
+        """
+        if not self.is_requested(level_index):
+            return None
+
+        future = self._future
+        self._future = None
+        self._level_index = None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"[LEVEL] Prefetch of level {level_index + 1} failed: {e}")
+            return None
+
+    def discard(self):
+        """Forget the pending job (its result is dropped when it finishes)."""
+        if self._future is not None:
+            self._future.cancel()
+        self._future = None
+        self._level_index = None
+
+    def shutdown(self):
+        self.discard()
+        self._executor.shutdown(wait=False)
+
+    def _build(self, level_index: int) -> Optional[Dict]:
+        """Worker: load level data and build the static structures (no pygame asset calls)."""
+        controller = self.level_controller
+
+        # Streamed levels only build chunks near the camera, nothing to prefetch
+        if controller.should_stream(level_index):
+            return None
+
+        normal_data, gema_data = controller.load_level_pair(level_index)
+        structures = GameSetup.build_level_structures(normal_data, gema_data)
+        structures.update({
+            'level_index': level_index,
+            'normal_data': normal_data,
+            'gema_data': gema_data,
+        })
+        return structures
@@ -0,0 +1,209 @@
+"""
+Level Stream - Loading level per chunk (sektor kolom) sesuai posisi kamera.
+Map yang sangat lebar tidak perlu di-parse seluruhnya saat load; chunk di-parse
+saat kamera mendekat dan dibuang lagi setelah tertinggal di belakang pemain.
+"""
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.level_parser import GLOBAL_CATEGORIES, SYMBOL_TABLE, LevelParser, symbols_in
+from utils.exception import LevelFileNotFound
+
+
+class LevelStreamReader:
+    """
+    Streaming reader untuk satu file level ASCII.
+    Membangun index offset per baris sekali, lalu bisa membaca rentang kolom
+    tertentu dengan seek tanpa membaca ulang seluruh file.
+    """
+
+    def __init__(self, filepath: str, tile_size: int = 40):
+        self.filepath = filepath
+        self.tile_size = tile_size
+
+        # Per-row byte offset and length (without newline)
+        self.line_offsets: List[int] = []
+        self.line_lengths: List[int] = []
+
+        # Level-wide data found during the index pass
+        self.start_pos: Optional[Tuple[int, int]] = None
+        self.camera_right_limit: Optional[int] = None
+        self.left_markers: Dict[int, List[int]] = {}
+        self.right_markers: Dict[int, List[int]] = {}
+        self.max_width = 0
+
+        self._file = None
+        self._build_index()
+
+    @property
+    def columns(self) -> int:
+        """Widest row in tiles."""
+        return max(self.line_lengths, default=0)
+
+    def _build_index(self):
+        """Scan the file line by line (C-level splitting, no per-char Python loop)."""
+        # Symbols that affect the whole level (start, camera limit, markers)
+        global_chars = symbols_in(GLOBAL_CATEGORIES)
+        finder = re.compile(b'[' + re.escape(global_chars.encode('ascii')) + b']')
+        parser = LevelParser(self.tile_size, symbols={c: SYMBOL_TABLE[c] for c in global_chars})
+        found = {'start_pos': None, 'camera_right_limit': None,
+                 'left_markers': self.left_markers, 'right_markers': self.right_markers}
+        handlers = parser.bind(found)
+
+        offset = 0
+        max_chars = 0
+        try:
+            with open(self.filepath, 'rb') as f:
+                for row, raw in enumerate(f):
+                    # Same bound as parse_level_file: newline counts as a column
+                    max_chars = max(max_chars, len(raw))
+                    line = raw.rstrip(b'\r\n')
+                    self.line_offsets.append(offset)
+                    self.line_lengths.append(len(line))
+                    offset += len(raw)
+
+                    for m in finder.finditer(line):
+                        handlers[m.group().decode('ascii')](m.start(), row)
+        except FileNotFoundError:
+            raise LevelFileNotFound(self.filepath)
+
+        self.start_pos = found['start_pos']
+        self.camera_right_limit = found['camera_right_limit']
+        self.max_width = max(0, max_chars - 1) * self.tile_size
+
+    def read_columns(self, col_start: int, col_end: int) -> List[Tuple[int, str]]:
+        """
+        Read columns [col_start, col_end) of every row.
+
+        Returns:
+            List of (row, text) for rows that have content in the range
+        """
+        if self._file is None:
+            self._file = open(self.filepath, 'rb')
+
+        rows = []
+        f = self._file
+        for row, (offset, length) in enumerate(zip(self.line_offsets, self.line_lengths)):
+            if length <= col_start:
+                continue
+            f.seek(offset + col_start)
+            text = f.read(min(length, col_end) - col_start).decode('utf-8', errors='replace')
+            if text.strip():
+                rows.append((row, text))
+        return rows
+
+    def close(self):
+        """Close the underlying file handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ChunkedLevel:
+    """
+    Representasi level dalam chunk kolom berukuran tetap (default 32 kolom).
+    Chunk di-load saat masuk jangkauan kamera + margin, dan di-evict saat
+    sudah jauh tertinggal.
+    """
+
+    def __init__(self, normal_path: str, gema_path: str,
+                 parse_chunk: Callable[[List[Tuple[int, str]], int], Dict],
+                 tile_size: int = 40, chunk_columns: int = 32,
+                 load_margin_px: int = 320, evict_margin_px: int = 640,
+                 pair_hook: Optional[Callable[[Dict, Dict], object]] = None):
+        """
+        Args:
+            normal_path: Normal dimension map file
+            gema_path: Gema dimension map file
+            parse_chunk: Function (rows, col_offset) -> level_data for one chunk
+            tile_size: Size of each tile
+            chunk_columns: Width of one chunk in tiles
+            load_margin_px: Load chunks this far beyond the viewport
+            evict_margin_px: Evict chunks once they are this far outside the viewport
+            pair_hook: Optional post-process run on (normal, gema) data of each chunk
+        """
+        self.readers = {
+            'normal': LevelStreamReader(normal_path, tile_size),
+            'gema': LevelStreamReader(gema_path, tile_size),
+        }
+        self.parse_chunk = parse_chunk
+        self.pair_hook = pair_hook
+        self.tile_size = tile_size
+        self.chunk_columns = chunk_columns
+        self.chunk_px = chunk_columns * tile_size
+        self.load_margin_px = load_margin_px
+        self.evict_margin_px = evict_margin_px
+
+        columns = max(r.columns for r in self.readers.values())
+        self.chunk_count = max(1, -(-columns // chunk_columns))
+
+        # chunk index -> {'normal': level_data, 'gema': level_data}
+        self.loaded: Dict[int, Dict[str, Dict]] = {}
+        # Chunks loaded at least once (entities spawn only on first load)
+        self.seen: set = set()
+
+    @property
+    def max_width(self) -> int:
+        return max(r.max_width for r in self.readers.values())
+
+    def global_data(self, dim: str) -> Dict:
+        """Level-wide values (start, camera limit, markers, width) for a dimension."""
+        reader = self.readers[dim]
+        return {
+            'start_pos': reader.start_pos,
+            'camera_right_limit': reader.camera_right_limit,
+            'left_markers': reader.left_markers,
+            'right_markers': reader.right_markers,
+            'max_width': reader.max_width,
+        }
+
+    def _wanted_range(self, camera_x: float, viewport_width: int, margin: int) -> Tuple[int, int]:
+        first = int((camera_x - margin) // self.chunk_px)
+        last = int((camera_x + viewport_width + margin) // self.chunk_px)
+        return max(0, first), min(self.chunk_count - 1, last)
+
+    def _load_chunk(self, index: int) -> Dict[str, Dict]:
+        col_start = index * self.chunk_columns
+        col_end = col_start + self.chunk_columns
+        chunk = {}
+        for dim, reader in self.readers.items():
+            data = self.parse_chunk(reader.read_columns(col_start, col_end), col_start)
+            # Markers may sit in a neighbouring chunk; always use the level-wide ones
+            data['left_markers'] = reader.left_markers
+            data['right_markers'] = reader.right_markers
+            chunk[dim] = data
+        if self.pair_hook:
+            self.pair_hook(chunk['normal'], chunk['gema'])
+        return chunk
+
+    def update(self, camera_x: float, viewport_width: int) -> Tuple[List[int], List[int]]:
+        """
+        Load/evict chunks around the camera.
+
+        Returns:
+            (loaded_indices, evicted_indices) for this call
+        """
+        first, last = self._wanted_range(camera_x, viewport_width, self.load_margin_px)
+        keep_first, keep_last = self._wanted_range(camera_x, viewport_width, self.evict_margin_px)
+
+        loaded = []
+        for index in range(first, last + 1):
+            if index not in self.loaded:
+                self.loaded[index] = self._load_chunk(index)
+                loaded.append(index)
+
+        evicted = [i for i in self.loaded if i < keep_first or i > keep_last]
+        for index in evicted:
+            del self.loaded[index]
+
+        return loaded, evicted
+
+    def first_load(self, indices: List[int]) -> List[int]:
+        """Return chunks from `indices` that were never loaded before (and mark them)."""
+        fresh = [i for i in indices if i not in self.seen]
+        self.seen.update(fresh)
+        return fresh
+
+    def close(self):
+        for reader in self.readers.values():
+            reader.close()
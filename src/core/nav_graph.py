@@ -0,0 +1,329 @@
+"""
+Nav Graph - Graph navigasi per dimensi yang dihitung sekali saat level dimuat.
+Node adalah span jalan (permukaan atas solid yang tidak tertutup solid lain,
+digabung selama tingginya sama dan bersambung), edge adalah link jatuh/lompat
+dari tepi span. Link didapat dengan mensimulasikan body agent memakai
+GRAVITY/JUMP_STRENGTH dan resolusi tile yang sama dengan entity, jadi link
+yang ada memang bisa dilalui chaser.
+
+Pada level stream, update(grid, dirty) membangun ulang span tetapi memakai
+ulang hasil simulasi link dari tepi span yang jauh dari chunk yang berubah.
+
+Query per tick tanpa scan platform:
+    ground_ahead(rect, direction)   -> masih ada lantai di depan kaki?
+    floor_below(x, y)               -> span lantai terdekat di bawah titik (O(log n))
+    route(body, target)             -> link berikutnya menuju span target
+"""
+import pygame
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from core.collision_grid import CollisionGrid, CollisionView
+from utils.settings import GRAVITY, JUMP_STRENGTH
+
+
+# Same probe offset as Enemy._has_ground_ahead; links start where it first fails
+GROUND_AHEAD_PX = 6
+# Ground probe depth below the feet (Enemy._has_ground_ahead uses a 3 px probe at bottom + 1)
+GROUND_PROBE_DEPTH = 4
+# Simulated air time before a jump/drop counts as falling out of the level
+MAX_AIR_TICKS = 180
+
+SpanKey = Tuple[int, int, int]  # (left, right, top): identifies a span across rebuilds
+_MISSING = object()
+
+
+class NavSpan(NamedTuple):
+    """Walkable surface [left, right) at height `top`."""
+    index: int
+    left: int
+    right: int
+    top: int
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The surface as a 1 px tall rect (ground snapping)."""
+        return pygame.Rect(self.left, self.top, self.right - self.left, 1)
+
+
+class NavLink(NamedTuple):
+    """Leaving span `source` over its edge in `direction` lands on span `target`."""
+    kind: str       # 'drop' (walk off) or 'jump'
+    direction: int  # -1 left edge, 1 right edge
+    source: int
+    target: int
+
+
+class NavLayer:
+    """Span dan link satu dimensi (normal atau gema)."""
+
+    def __init__(self, tile_size: int):
+        self.tile_size = tile_size
+        self.spans: List[NavSpan] = []
+        self.links: List[List[NavLink]] = []
+        # column -> (tops, spans) sorted by top, for bisect lookups
+        self._columns: Dict[int, Tuple[List[int], List[NavSpan]]] = {}
+        self._incoming: List[List[NavLink]] = []
+        # target span -> {source span: next link}, filled on demand
+        self._routes: Dict[int, Dict[int, NavLink]] = {}
+        self._lowest = 0
+        # (span key, direction, jump) -> (landing span key, swept left, swept right),
+        # reused by incremental rebuilds
+        self._outcomes: Dict[Tuple[SpanKey, int, bool], Tuple[Optional[SpanKey], int, int]] = {}
+
+    # Build
+    def build_spans(self, view: CollisionView):
+        """Collect the exposed top edges of every solid and merge them into spans."""
+        solids = {}
+        for _, _, solid in view.solid_cells():
+            solids.setdefault(tuple(solid), solid)
+
+        pieces = []
+        for solid in solids.values():
+            above = pygame.Rect(solid.left, solid.top - 1, solid.width, 1)
+            segments = [(solid.left, solid.right)]
+            for blocker in view.query(above):
+                if blocker is solid or not blocker.colliderect(above):
+                    continue
+                segments = [part for left, right in segments
+                            for part in ((left, min(right, blocker.left)), (max(left, blocker.right), right))
+                            if part[0] < part[1]]
+            pieces.extend((solid.top, left, right) for left, right in segments)
+
+        pieces.sort()
+        merged: List[List[int]] = []
+        for top, left, right in pieces:
+            last = merged[-1] if merged else None
+            if last is not None and last[0] == top and left <= last[2]:
+                last[2] = max(last[2], right)
+            else:
+                merged.append([top, left, right])
+
+        ts = self.tile_size
+        self.spans = [NavSpan(i, left, right, top) for i, (top, left, right) in enumerate(merged)]
+        columns: Dict[int, List[NavSpan]] = {}
+        for span in self.spans:
+            for col in range(span.left // ts, (span.right - 1) // ts + 1):
+                columns.setdefault(col, []).append(span)
+        self._columns = {}
+        for col, spans in columns.items():
+            spans.sort(key=lambda s: s.top)
+            self._columns[col] = ([s.top for s in spans], spans)
+        self.links = [[] for _ in self.spans]
+        self._incoming = [[] for _ in self.spans]
+        self._routes = {}
+        self._lowest = max((span.top for span in self.spans), default=0)
+
+    def build_links(self, view: CollisionView, agent_size: Tuple[int, int], agent_speed: float,
+                    previous: Optional['NavLayer'] = None, dirty: Sequence[Tuple[int, int]] = ()):
+        """
+        Simulate a drop and a jump off both edges of every span.
+
+        With `previous`, an edge whose earlier simulation swept no dirty x range
+        [left, right) reuses that outcome instead of being simulated again.
+        """
+        reusable = previous is not None and previous._lowest == self._lowest
+        # Tile queries around the swept body reach into the neighbouring column
+        slack = self.tile_size
+        by_key = {(span.left, span.right, span.top): span for span in self.spans}
+        outcomes = self._outcomes
+        for span in self.spans:
+            links = self.links[span.index]
+            key = (span.left, span.right, span.top)
+            for direction in (-1, 1):
+                landed = []
+                for jump in (False, True):
+                    target = _MISSING
+                    cached = previous._outcomes.get((key, direction, jump)) if reusable else None
+                    if cached is not None:
+                        target_key, left, right = cached
+                        if not any(lo < right + slack and left - slack < hi for lo, hi in dirty):
+                            target = None if target_key is None else by_key.get(target_key, _MISSING)
+                    if target is _MISSING:
+                        target, left, right = self._simulate(view, span, direction, jump, agent_size, agent_speed)
+                        target_key = None if target is None else (target.left, target.right, target.top)
+                    outcomes[(key, direction, jump)] = (target_key, left, right)
+                    landed.append(target)
+                drop, jump = landed
+                if drop is not None:
+                    links.append(NavLink('drop', direction, span.index, drop.index))
+                if jump is not None and (drop is None or jump.index != drop.index):
+                    links.append(NavLink('jump', direction, span.index, jump.index))
+            for link in links:
+                self._incoming[link.target].append(link)
+
+    def _simulate(self, view: CollisionView, span: NavSpan, direction: int, jump: bool,
+                  agent_size: Tuple[int, int], agent_speed: float) -> Tuple[Optional[NavSpan], int, int]:
+        """
+        Span the agent lands on after leaving `span` at its edge, if any, and
+        the x range [left, right) its body swept while getting there.
+        """
+        width, height = agent_size
+        body = pygame.Rect(0, 0, width, height)
+        if direction > 0:
+            body.centerx = span.right - (width // 2 + GROUND_AHEAD_PX)
+        else:
+            body.centerx = span.left + width // 2 + GROUND_AHEAD_PX - 2
+        body.bottom = span.top
+        left, right = body.left, body.right
+        if view.any_solid(body):
+            return None, left, right  # no headroom where the move would start
+
+        vx = agent_speed * direction
+        vy = -float(JUMP_STRENGTH) if jump else 0.0
+        airborne = jump
+        lowest = self._lowest
+        for _ in range(MAX_AIR_TICKS):
+            if body.bottom > lowest:
+                return None, left, right  # below every floor: fell out of the level
+            last_x = body.x
+            view.move_x(body, vx)
+            if body.left < left:
+                left = body.left
+            elif body.right > right:
+                right = body.right
+            vy += GRAVITY
+            hit = view.move_y(body, vy)
+            if hit:
+                vy = 0.0
+                if hit.normal[1] < 0:
+                    if airborne:
+                        landed = self.span_under(body)
+                        if landed is not None and landed.index != span.index:
+                            return landed, left, right
+                        return None, left, right
+                    if body.x == last_x:
+                        return None, left, right  # walked into a wall, nothing to drop from
+                    continue
+            airborne = True
+        return None, left, right
+
+    # Queries
+    def floor_below(self, x: int, y: int) -> Optional[NavSpan]:
+        """Highest span containing `x` whose surface is at or below `y`."""
+        column = self._columns.get(x // self.tile_size)
+        if column is None:
+            return None
+        tops, spans = column
+        for i in range(bisect_left(tops, y), len(tops)):
+            span = spans[i]
+            if span.left <= x < span.right:
+                return span
+        return None
+
+    def topmost(self, x: int) -> Optional[NavSpan]:
+        """Highest span containing `x` at any height."""
+        column = self._columns.get(x // self.tile_size)
+        if column is None:
+            return None
+        for span in column[1]:
+            if span.left <= x < span.right:
+                return span
+        return None
+
+    def span_under(self, rect: pygame.Rect) -> Optional[NavSpan]:
+        """Span `rect` stands on (feet exactly on the surface), centre first."""
+        for x in (rect.centerx, rect.left, rect.right - 1):
+            span = self.floor_below(x, rect.bottom)
+            if span is not None and span.top == rect.bottom:
+                return span
+        return None
+
+    def ground_ahead(self, rect: pygame.Rect, direction: int, ahead_px: int = GROUND_AHEAD_PX) -> bool:
+        """
+        True if a floor continues just past the front foot (Enemy._has_ground_ahead).
+        Walls ahead are not ground: a step up is taken through a jump link.
+        """
+        front_x = rect.centerx + direction * (rect.width // 2 + max(1, ahead_px))
+        bottom = rect.bottom
+        for x in (front_x, front_x + 1):
+            span = self.floor_below(x, bottom)
+            if span is not None and span.top < bottom + GROUND_PROBE_DEPTH:
+                return True
+        return False
+
+    def route(self, body: pygame.Rect, target: pygame.Rect) -> Optional[NavLink]:
+        """
+        Next link for a body standing on a span to reach the floor under `target`.
+        None when already on that span, not standing, or the target is unreachable.
+        """
+        source = self.span_under(body)
+        if source is None:
+            return None
+        goal = self.floor_below(target.centerx, target.bottom)
+        if goal is None or goal.index == source.index:
+            return None
+        routes = self._routes.get(goal.index)
+        if routes is None:
+            routes = self._routes[goal.index] = self._routes_to(goal.index)
+        return routes.get(source.index)
+
+    def _routes_to(self, goal: int) -> Dict[int, NavLink]:
+        """Breadth-first search backwards from `goal`: fewest links from every span."""
+        next_link: Dict[int, NavLink] = {}
+        queue = deque([goal])
+        seen = {goal}
+        while queue:
+            node = queue.popleft()
+            for link in self._incoming[node]:
+                if link.source not in seen:
+                    seen.add(link.source)
+                    next_link[link.source] = link
+                    queue.append(link.source)
+        return next_link
+
+    @property
+    def link_count(self) -> int:
+        return sum(len(links) for links in self.links)
+
+
+class NavGraph:
+    """
+    NavLayer untuk dimensi normal dan gema dari satu CollisionGrid.
+
+    build(grid) juga memasang layer ke grid.view(dim).nav, sehingga entity yang
+    menerima `platforms` (CollisionView) bisa langsung memakai navigasi.
+    """
+
+    def __init__(self, agent_size: Tuple[int, int] = (50, 50), agent_speed: float = 2.2):
+        self.agent_size = agent_size
+        self.agent_speed = agent_speed
+        self.layers: Dict[str, NavLayer] = {}
+
+    def build(self, grid: CollisionGrid, links: bool = True):
+        """Rebuild both layers from `grid`; links=False only collects spans (ground snapping)."""
+        self._build(grid, links, {}, ())
+
+    def update(self, grid: CollisionGrid, dirty: Sequence[Tuple[int, int]]):
+        """Rebuild after the geometry changed only inside the x ranges `dirty` (streamed chunks)."""
+        self._build(grid, True, self.layers, dirty)
+
+    def _build(self, grid: CollisionGrid, links: bool, previous: Dict[str, NavLayer],
+               dirty: Sequence[Tuple[int, int]]):
+        layers = {}
+        for dim in ('normal', 'gema'):
+            view = grid.view(dim)
+            layer = NavLayer(grid.tile_size)
+            layer.build_spans(view)
+            if links:
+                layer.build_links(view, self.agent_size, self.agent_speed, previous.get(dim), dirty)
+            layers[dim] = layer
+            view.nav = layer
+        self.layers = layers
+
+    @classmethod
+    def from_platforms(cls, platforms: Iterable[Dict], tile_size: int, links: bool = False) -> 'NavGraph':
+        """Graph for a platform list that has no CollisionGrid yet (level setup, prefetch worker)."""
+        grid = CollisionGrid(tile_size)
+        grid.build(platforms)
+        graph = cls()
+        graph.build(grid, links)
+        return graph
+
+    def layer(self, dim: str) -> Optional[NavLayer]:
+        return self.layers.get('normal' if dim == 'both' else dim)
+
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        """dim -> (spans, links)."""
+        return {dim: (len(layer.spans), layer.link_count) for dim, layer in self.layers.items()}
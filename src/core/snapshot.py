@@ -0,0 +1,91 @@
+"""
+Snapshot - Level snapshot yang immutable untuk restart instan.
+Geometri statis (platform, collision span, end trigger, rect trap) dibagi
+by reference; hanya state runtime yang disalin dan di-reset saat restart.
+"""
+import pygame
+from array import array
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def _clone(value: Any) -> Any:
+    """Copy mutable containers/rects, share everything else (surfaces, strings, numbers)."""
+    if isinstance(value, (pygame.Rect, pygame.math.Vector2)):
+        return value.copy()
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+class RuntimeStateTable:
+    """
+    Salinan kolom (satu array per field) dari state runtime sekumpulan objek.
+    Dipakai untuk field yang di-reset saat restart: state trap, state enemy.
+    Typecode 'O' menyimpan nilai apa adanya di list (rect/vector/list disalin).
+    """
+
+    def __init__(self, objects: Iterable, fields: Dict[str, str]):
+        """
+        Args:
+            objects: Objects to track
+            fields: field name -> array typecode ('b' is restored as bool, 'O' any value)
+        """
+        self.objects: List = []
+        self.columns: Dict[str, Tuple[Any, str]] = {
+            name: ([] if code == 'O' else array(code), code) for name, code in fields.items()
+        }
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj: Any):
+        """Track one more object, capturing its current values."""
+        self.objects.append(obj)
+        for name, (column, code) in self.columns.items():
+            value = getattr(obj, name)
+            column.append(_clone(value) if code == 'O' else value)
+
+    def restore(self):
+        """Write the captured values back into the objects."""
+        for name, (column, code) in self.columns.items():
+            if code == 'O':
+                for obj, value in zip(self.objects, column):
+                    setattr(obj, name, _clone(value))
+            elif code == 'b':
+                for obj, value in zip(self.objects, column):
+                    setattr(obj, name, bool(value))
+            else:
+                for obj, value in zip(self.objects, column):
+                    setattr(obj, name, value)
+
+
+TRAP_STATE_FIELDS = {
+    'is_active': 'b',
+    'frame_index': 'd',
+    'animation_finished': 'b',
+}
+
+
+class LevelSnapshot:
+    """
+    Struktur level yang sudah jadi untuk satu level.
+    List statis tidak boleh dimodifikasi; restart cukup memanggil restore().
+    """
+
+    def __init__(self, structures: Dict[str, List]):
+        """
+        Args:
+            structures: Output of GameSetup.build_level_structures
+        """
+        self.platforms: List[Dict] = structures['platforms']
+        self.collision_platforms: List[Dict] = structures['collision_platforms']
+        self.trigger_traps: List = structures['trigger_traps']
+        self.end_triggers: List[Dict] = structures['end_triggers']
+        self._trap_state = RuntimeStateTable(self.trigger_traps, TRAP_STATE_FIELDS)
+
+    def restore(self):
+        """Reset runtime state (traps) to the state at snapshot time."""
+        self._trap_state.restore()
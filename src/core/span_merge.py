@@ -0,0 +1,66 @@
+"""
+Span Merge - Menggabungkan tile solid yang berdampingan menjadi span rectangle.
+Tahap opsional setelah parsing (LevelController.merge_spans): span dipakai untuk
+membangun CollisionGrid. tools/lint_levels.py memakainya untuk estimasi biaya level.
+"""
+import pygame
+from typing import Dict, List, Tuple
+
+
+def merge_platform_spans(platforms: List[Dict]) -> List[Dict]:
+    """
+    Fold runs of identical solid tiles into larger rectangles.
+
+    Tiles are first joined horizontally (same row, same height, same char,
+    touching edges), then the resulting runs are stacked vertically when
+    they share the same x, width and char and touch top-to-bottom. `P` tiles
+    are only 20 px tall on a 40 px grid, so they never stack vertically.
+
+    Args:
+        platforms: List of platform dicts with 'rect' and 'char' keys
+
+    Returns:
+        New list of platform dicts ({'rect', 'char'}) covering the same area
+    """
+    # Pass 1: horizontal runs per (row top, height, char)
+    rows: Dict[Tuple[int, int, str], List[pygame.Rect]] = {}
+    for p in platforms:
+        r = p['rect']
+        rows.setdefault((r.y, r.height, p['char']), []).append(r)
+
+    runs: List[Tuple[str, List[int]]] = []
+    for (y, h, char), rects in rows.items():
+        rects.sort(key=lambda r: r.x)
+        current = None
+        for r in rects:
+            if current is not None and r.x <= current[0] + current[2]:
+                current[2] = max(current[2], r.right - current[0])
+            else:
+                if current is not None:
+                    runs.append((char, current))
+                current = [r.x, y, r.width, h]
+        if current is not None:
+            runs.append((char, current))
+
+    # Pass 2: stack identical runs vertically per (x, width, char)
+    columns: Dict[Tuple[int, int, str], List[List[int]]] = {}
+    for char, run in runs:
+        columns.setdefault((run[0], run[2], char), []).append(run)
+
+    merged: List[Dict] = []
+    for (x, w, char), stack in columns.items():
+        stack.sort(key=lambda run: run[1])
+        current = None
+        for run in stack:
+            if current is not None and run[1] == current[1] + current[3]:
+                current[3] += run[3]
+            else:
+                if current is not None:
+                    merged.append({'rect': pygame.Rect(*current), 'char': char})
+                current = list(run)
+        if current is not None:
+            merged.append({'rect': pygame.Rect(*current), 'char': char})
+
+    # Keep a stable, row-major order (matches how tiles were parsed)
+    merged.sort(key=lambda p: (p['rect'].y, p['rect'].x))
+    return merged
@@ -0,0 +1,175 @@
+"""
+Spatial Hash - Index grid dinamis untuk entity yang bergerak (enemy, NPC).
+Entity di-bucket per sel berdasarkan rect-nya; bucket hanya dipindah kalau
+rentang sel berubah. Query rect/radius bisa difilter per dimensi dan jenis,
+sehingga combat, blocking, prompt NPC dan deteksi AI hanya mengecek kandidat
+yang dekat.
+"""
+import pygame
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+Cells = Tuple[int, int, int, int]
+
+
+class _Entry:
+    __slots__ = ('obj', 'kind', 'dim', 'margin', 'cells', 'order')
+
+    def __init__(self, obj: Any, kind: str, dim: str, margin: int, order: int):
+        self.obj = obj
+        self.kind = kind
+        self.dim = dim
+        self.margin = margin
+        self.cells: Optional[Cells] = None
+        self.order = order
+
+
+class SpatialHash:
+    """
+    Hash grid untuk objek dengan atribut `rect`.
+    Tiap objek di-index dengan rect yang di-inflate `margin` px di semua sisi,
+    agar rect turunan (hazard, tembok tak terlihat, hitbox) tetap tertangkap.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = cell_size
+        self._buckets: Dict[Tuple[int, int], Set[_Entry]] = {}
+        self._entries: Dict[Any, _Entry] = {}
+        self._by_kind: Dict[str, Dict[Any, _Entry]] = {}
+        self._min_row = 0
+        self._max_row = -1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, obj: Any) -> bool:
+        return obj in self._entries
+
+    # Maintenance
+    def _cells_of(self, rect: pygame.Rect, margin: int) -> Cells:
+        cs = self.cell_size
+        return ((rect.left - margin) // cs, (rect.top - margin) // cs,
+                (rect.right + margin - 1) // cs, (rect.bottom + margin - 1) // cs)
+
+    def _place(self, entry: _Entry, cells: Optional[Cells]):
+        buckets = self._buckets
+        if entry.cells is not None:
+            c0, r0, c1, r1 = entry.cells
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    bucket = buckets.get((col, row))
+                    if bucket is not None:
+                        bucket.discard(entry)
+                        if not bucket:
+                            del buckets[(col, row)]
+        entry.cells = cells
+        if cells is not None:
+            c0, r0, c1, r1 = cells
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    buckets.setdefault((col, row), set()).add(entry)
+            self._min_row = min(self._min_row, r0)
+            self._max_row = max(self._max_row, r1)
+
+    def insert(self, obj: Any, kind: str, dim: str = 'both', margin: int = 0):
+        """Track `obj` (re-inserting replaces its kind/dim/margin)."""
+        self.remove(obj)
+        entry = _Entry(obj, kind, dim, margin, len(self._entries))
+        self._entries[obj] = entry
+        self._by_kind.setdefault(kind, {})[obj] = entry
+        self._place(entry, self._cells_of(obj.rect, margin))
+
+    def remove(self, obj: Any):
+        entry = self._entries.pop(obj, None)
+        if entry is not None:
+            del self._by_kind[entry.kind][obj]
+            self._place(entry, None)
+
+    def update(self, obj: Any) -> bool:
+        """Re-bucket `obj` after its rect moved. Returns True if its cells changed."""
+        entry = self._entries[obj]
+        cells = self._cells_of(obj.rect, entry.margin)
+        if cells == entry.cells:
+            return False
+        self._place(entry, cells)
+        return True
+
+    def sync(self, objects: Iterable[Any], kind_of, dim_of, margin: int = 0):
+        """
+        Make the hash track exactly `objects`: new ones are inserted, moved ones
+        re-bucketed, missing ones removed. Query order follows `objects`.
+        """
+        seen = set()
+        entries = self._entries
+        for order, obj in enumerate(objects):
+            seen.add(obj)
+            entry = entries.get(obj)
+            if entry is None:
+                self.insert(obj, kind_of(obj), dim_of(obj), margin)
+                entry = entries[obj]
+            else:
+                self.update(obj)
+            entry.order = order
+        for obj in [o for o in entries if o not in seen]:
+            self.remove(obj)
+
+    def clear(self):
+        self._buckets.clear()
+        self._entries.clear()
+        self._by_kind.clear()
+        self._min_row = 0
+        self._max_row = -1
+
+    # Queries
+    def tracked(self, kind: str) -> List[Any]:
+        """All tracked objects of one kind, in tracking order (no position filter)."""
+        entries = self._by_kind.get(kind)
+        if not entries:
+            return []
+        return [e.obj for e in sorted(entries.values(), key=lambda e: e.order)]
+
+    def _collect(self, rect: pygame.Rect, kinds: Optional[Iterable[str]], dim: Optional[str]) -> List[_Entry]:
+        cs = self.cell_size
+        buckets = self._buckets
+        if isinstance(kinds, str):
+            kinds = (kinds,)
+        wanted = set(kinds) if kinds is not None else None
+        r0 = max(rect.top // cs, self._min_row)
+        r1 = min((rect.bottom - 1) // cs, self._max_row)
+        found = set()
+        for row in range(r0, r1 + 1):
+            for col in range(rect.left // cs, (rect.right - 1) // cs + 1):
+                bucket = buckets.get((col, row))
+                if bucket:
+                    found.update(bucket)
+        return sorted(
+            (e for e in found
+             if (wanted is None or e.kind in wanted)
+             and (dim is None or e.dim in (dim, 'both'))),
+            key=lambda e: e.order
+        )
+
+    def query_rect(self, rect: pygame.Rect, kinds: Optional[Iterable[str]] = None,
+                   dim: Optional[str] = None) -> List[Any]:
+        """
+        Candidates whose (inflated) rect may overlap `rect`, in tracking order.
+        Callers still do the exact test; rows outside the occupied range are skipped,
+        so very tall query rects are cheap.
+        """
+        return [e.obj for e in self._collect(rect, kinds, dim)]
+
+    def query_radius(self, x: float, y: float, radius: float, kinds: Optional[Iterable[str]] = None,
+                     dim: Optional[str] = None) -> List[Any]:
+        """Objects whose (inflated) rect comes within `radius` of (x, y)."""
+        r = int(radius) + 1
+        area = pygame.Rect(int(x) - r, int(y) - r, 2 * r, 2 * r)
+        result = []
+        limit = radius * radius
+        for e in self._collect(area, kinds, dim):
+            rect = e.obj.rect
+            m = e.margin
+            dx = max(rect.left - m - x, 0, x - rect.right - m)
+            dy = max(rect.top - m - y, 0, y - rect.bottom - m)
+            if dx * dx + dy * dy <= limit:
+                result.append(e.obj)
+        return result
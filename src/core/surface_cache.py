@@ -0,0 +1,76 @@
+"""
+Surface Cache - Cache varian surface (skala + flip horizontal) dengan batas
+jumlah entry. Key: (surface sumber, ukuran target, flip). Varian dibuat sekali,
+saat prewarm di setup level atau saat pertama dipakai; entry yang paling lama
+tidak dipakai dibuang kalau cache penuh. Counter hit/miss untuk overlay F3.
+"""
+import pygame
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from utils.settings import SURFACE_CACHE_MAX_ENTRIES
+
+
+Size = Optional[Tuple[int, int]]
+
+
+class SurfaceVariantCache:
+    """
+    LRU cache varian surface.
+
+    get(surface, size, flip) mengembalikan varian yang sudah jadi (hit) atau
+    membuatnya sekali (miss). size=None berarti ukuran sumber.
+    """
+
+    def __init__(self, max_entries: int = SURFACE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._variants: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    def get(self, surface: pygame.Surface, size: Size = None, flip: bool = False) -> pygame.Surface:
+        """Variant of `surface` scaled to `size` and optionally mirrored horizontally."""
+        key = (surface, size, flip)
+        variant = self._variants.get(key)
+        if variant is not None:
+            self.hits += 1
+            self._variants.move_to_end(key)
+            return variant
+        self.misses += 1
+        return self._store(key)
+
+    def prewarm(self, surface: pygame.Surface, size: Size = None, flip: bool = False):
+        """Build a variant ahead of use (not counted as hit or miss)."""
+        key = (surface, size, flip)
+        if key not in self._variants:
+            self._store(key)
+
+    def _store(self, key: tuple) -> pygame.Surface:
+        surface, size, flip = key
+        variant = surface
+        if size is not None and size != surface.get_size():
+            variant = pygame.transform.scale(variant, size)
+        if flip:
+            variant = pygame.transform.flip(variant, True, False)
+        variants = self._variants
+        variants[key] = variant
+        while len(variants) > self.max_entries:
+            variants.popitem(last=False)
+            self.evictions += 1
+        return variant
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        self._variants.clear()
+
+
+# Shared by AssetLoader (tiles, traps, campfires) and entity draw() (mirrored frames)
+SURFACE_VARIANTS = SurfaceVariantCache()
@@ -0,0 +1,205 @@
+"""
+Vector Parser - Parsing ASCII map dengan NumPy (opsional).
+Map di-load sebagai array 2D uint8 dan diklasifikasi lewat lookup table yang
+dibangun dari SYMBOL_TABLE parser. Posisi semua simbol diambil sekali dengan
+np.nonzero, lalu tiap kategori diekstrak sekaligus; tile platform dikelompokkan
+per run (baris, simbol sama, kolom berurutan) sehingga satu run cukup satu
+rect prototipe. Output identik dengan LevelController.parse_level_file_scalar.
+"""
+import pygame
+from typing import Callable, Dict, List, Tuple
+
+from core.level_parser import LevelParser, TileSymbol
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # NumPy is optional; LevelController falls back to the per-char parser
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def symbol_lut(symbols: Dict[str, TileSymbol]) -> Tuple[List[str], "np.ndarray"]:
+    """
+    Code every map symbol: returns (chars, lut) where lut[byte] is the 1-based
+    index of the byte's char in `chars`, 0 for bytes that are not symbols.
+    """
+    chars = [char for char in symbols if ord(char) < 128]
+    lut = np.zeros(256, dtype=np.uint8)
+    for code, char in enumerate(chars, 1):
+        lut[ord(char)] = code
+    return chars, lut
+
+
+def load_map_array(filepath: str, max_lines: int = 1000):
+    """
+    Load a map file as a 2D uint8 array (rows padded with spaces).
+
+    Returns:
+        (grid, max_width_columns) where max_width_columns matches the
+        highest column index the per-char parser would visit
+    """
+    with open(filepath, 'r') as file:
+        text = file.read()
+
+    lines = text.split('\n')
+    ends_with_newline = lines[-1] == ''
+    if ends_with_newline:
+        lines.pop()
+    # Each line but the last still has its '\n' in the per-char parser
+    has_newline = [True] * len(lines)
+    if lines and not ends_with_newline:
+        has_newline[-1] = False
+
+    if len(lines) > max_lines:
+        print(f"Warning: Level file {filepath} exceeded {max_lines} lines, stopping parse")
+        lines = lines[:max_lines]
+        has_newline = has_newline[:max_lines]
+
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8), 0
+
+    # Run lengths per row (newline counts as a visited column)
+    lengths = np.fromiter((len(line) for line in lines), dtype=np.int64, count=len(lines))
+    visited = lengths + np.asarray(has_newline, dtype=np.int64)
+    max_column = int(visited.max()) - 1 if visited.max() > 0 else 0
+
+    width = int(lengths.max())
+    # Non-ASCII chars become '?' so columns stay aligned with the text
+    raw = ''.join(line.ljust(width) for line in lines).encode('ascii', errors='replace')
+    grid = np.frombuffer(raw, dtype=np.uint8).reshape(len(lines), width)
+    return grid, max(0, max_column)
+
+
+# Per-category extraction. Each emitter gets the category's tiles in scan order
+# as row/col/code arrays, with `symbols[code]` the TileSymbol of each code.
+Emitter = Callable[[Dict, str, List, "np.ndarray", "np.ndarray", "np.ndarray", int], None]
+
+
+def _emit_platforms(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    """Platform tiles, one prototype rect per horizontal run of the same symbol."""
+    if not len(rows):
+        return
+    breaks = np.ones(len(rows), dtype=bool)
+    breaks[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1] + 1) | (codes[1:] != codes[:-1])
+    starts = np.flatnonzero(breaks)
+    widths = np.diff(np.append(starts, len(rows))) * ts
+    out = level_data[key]
+    for row, col, width, code in zip(rows[starts].tolist(), cols[starts].tolist(),
+                                     widths.tolist(), codes[starts].tolist()):
+        symbol = symbols[code]
+        move = pygame.Rect(col * ts, row * ts, ts, symbol.height or ts).move
+        kind = symbol.kind
+        out += [{'rect': move(dx, 0), 'char': kind} for dx in range(0, width, ts)]
+
+
+def _tiles(symbols: List, rows, cols, codes, ts: int):
+    """(rect, symbol) of each tile."""
+    Rect = pygame.Rect
+    return [(Rect(col * ts, row * ts, ts, symbol.height or ts), symbol)
+            for row, col, symbol in zip(rows.tolist(), cols.tolist(), map(symbols.__getitem__, codes.tolist()))]
+
+
+def _emit_enemies(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    level_data[key] += [{'rect': rect, 'type': s.kind, 'facing': s.facing}
+                        for rect, s in _tiles(symbols, rows, cols, codes, ts)]
+
+
+def _emit_npcs(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    out = level_data[key]
+    if not isinstance(out, dict):
+        out += [{'rect': rect, 'type': s.kind, 'facing': s.facing}
+                for rect, s in _tiles(symbols, rows, cols, codes, ts)]
+        return
+    # Grouped by kind; every NPC kind gets its list, in table order, like LevelParser.bind
+    for symbol in symbols[1:]:
+        if symbol.category == 'npc':
+            out.setdefault(symbol.kind, [])
+    for rect, s in _tiles(symbols, rows, cols, codes, ts):
+        out[s.kind].append({'rect': rect, 'facing': s.facing})
+
+
+def _emit_ends(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    level_data[key] += [{'rect': rect, 'mode': s.kind} for rect, s in _tiles(symbols, rows, cols, codes, ts)]
+
+
+def _emit_rects(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    level_data[key] += [rect for rect, _ in _tiles(symbols, rows, cols, codes, ts)]
+
+
+def _emit_markers(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    markers = level_data[key]
+    for row, col, code in zip(rows.tolist(), cols.tolist(), codes.tolist()):
+        markers.setdefault(row, []).append(col * ts + int(symbols[code].offset[0] * ts))
+
+
+def _emit_start(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    # Last occurrence wins, like the sequential parser
+    if len(rows):
+        ox, oy = symbols[int(codes[-1])].offset
+        level_data[key] = (int(cols[-1]) * ts + int(ox * ts), int(rows[-1]) * ts + int(oy * ts))
+
+
+def _emit_camera_limit(level_data: Dict, key: str, symbols: List, rows, cols, codes, ts: int):
+    if len(rows):
+        level_data[key] = int(cols[-1]) * ts + int(symbols[int(codes[-1])].offset[0] * ts)
+
+
+EMITTERS: Dict[str, Emitter] = {
+    'platform': _emit_platforms,
+    'enemy': _emit_enemies,
+    'npc': _emit_npcs,
+    'end': _emit_ends,
+    'trigger': _emit_rects,
+    'trap': _emit_rects,
+    'campfire': _emit_rects,
+    'left_marker': _emit_markers,
+    'right_marker': _emit_markers,
+    'start': _emit_start,
+    'camera_limit': _emit_camera_limit,
+}
+
+
+def parse_level_array(filepath: str, parser: LevelParser, level_data: Dict,
+                      max_lines: int = 1000) -> Dict:
+    """
+    Vectorised equivalent of LevelParser.parse_file: classify the map with one
+    lookup, locate every symbol with np.nonzero and extract each category in bulk.
+
+    Args:
+        filepath: Path to ASCII map
+        parser: Compiled symbol-table parser (symbols, layout and tile size)
+        level_data: Empty level data dict to fill
+        max_lines: Same safety limit as the per-char parser
+
+    Returns:
+        level_data, identical to LevelParser.parse_file on the same file
+    """
+    chars, lut = symbol_lut(parser.symbols)
+    symbols = [None] + [parser.symbols[char] for char in chars]
+    categories = list(dict.fromkeys(symbol.category for symbol in symbols[1:]))
+    for category in categories:
+        if category not in EMITTERS:
+            raise ValueError(f"Unknown map symbol category: {category}")
+
+    grid, max_column = load_map_array(filepath, max_lines)
+    ts = parser.tile_size
+    level_data['max_width'] = max_column * ts
+
+    if grid.size:
+        codes = lut[grid]
+        rows, cols = np.nonzero(codes)  # row-major = scan order
+        found = codes[rows, cols]
+    else:
+        rows = cols = found = np.zeros(0, dtype=np.intp)
+    # Group tiles by category with one stable sort; each group keeps scan order
+    category_of = np.array([0] + [categories.index(symbol.category) for symbol in symbols[1:]], dtype=np.intp)
+    in_category = category_of[found]
+    order = np.argsort(in_category, kind='stable')
+    rows, cols, found = rows[order], cols[order], found[order]
+    bounds = np.searchsorted(in_category[order], np.arange(len(categories) + 1)).tolist()
+
+    for index, category in enumerate(categories):
+        group = slice(bounds[index], bounds[index + 1])
+        EMITTERS[category](level_data, parser.layout[category], symbols, rows[group], cols[group], found[group], ts)
+    return level_data
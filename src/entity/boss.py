@@ -1,9 +1,16 @@
 import os
 import pygame
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, TYPE_CHECKING
 from entity.entity import Entity
+from core.frame_data import frame_data
+from core.surface_cache import SURFACE_VARIANTS
+from core.hazard_registry import HazardEmitter, HazardProvider
 from utils.exception import AssetLoadError
 
+if TYPE_CHECKING:
+    from core.collision_grid import CollisionView
+
 
 class BossSpell:
     """Spell effect that appears above player position and stays in place."""
@@ -17,20 +24,14 @@ class BossSpell:
         self.is_active = True
         self.damage_dealt = False
         
-        # Spell only deals damage on frames 6-12 (index 5-11)
-        self.damage_frames = set(range(5, 12))  # frames 6-12 (0-indexed = 5-11)
-        
-        # Hazard rect for collision - spell is 40x100, use most of it for damage
-        if frames:
-            # Use most of the spell sprite as damage area: 30x80 centered
-            self.hazard_rect = pygame.Rect(x + 5, y + 10, 30, 80)
-        else:
-            self.hazard_rect = pygame.Rect(x + 5, y + 10, 30, 80)
+        # Damage frames and the 30x80 damage area inside the 40x100 sprite (frame data,
+        # anchored at the spell's top-left); the spell never moves, so the rect is built once
+        self.frame_data = frame_data('boss_spell')
+        self.hazard_rect = self.frame_data.hitbox('spell', 0, 1, pygame.Rect(x, y, 0, 0), pygame.Rect(0, 0, 0, 0))
     
     def is_hazardous(self) -> bool:
         """Check if spell is currently in damage frames."""
-        current_frame = int(self.frame_index)
-        return self.is_active and not self.damage_dealt and current_frame in self.damage_frames
+        return self.is_active and not self.damage_dealt and self.frame_data.active('spell', self.frame_index)
     
     def update(self):
         if self.animation_finished:
@@ -59,6 +60,13 @@ class BossSpell:
 
 class Boss(Entity):
     """Boss enemy with Idle, Walk, Death, Hurt, and Cast spell abilities."""
+    STATE_FIELDS = {
+        **Entity.STATE_FIELDS,
+        'is_dying': 'b', 'remove_at_ms': 'q', 'health': 'q', 'alerted': 'b', 'player_nearby': 'b',
+        'last_attack_time': 'q', 'last_cast_time': 'q', 'is_casting': 'b',
+        'cast_target_x': 'q', 'cast_target_y': 'q', 'active_spells': 'O', '_spell_spawned_this_cast': 'b',
+    }
+
     def __init__(self, x: int, y: int, size=(140, 93), speed: float = 1.5, facing: str = 'right'):
         base_path = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.abspath(os.path.join(base_path, '..', '..'))
@@ -140,12 +148,15 @@ class Boss(Entity):
         # Boss stats
         self.health = 10
         self.is_dying = False
+        self.remove_at_ms = 0
         self.blocks_player = True  # Boss has invisible wall to block player
         
         # AI behavior
         self.alerted = False
         self.detect_range_x = 200
         self.detect_range_y = 100
+        # Cleared by EntityManager.update_player_proximity while the player is far away
+        self.player_nearby = True
         
         # Melee attack
         self.melee_range = 50  # Distance to trigger melee attack
@@ -158,18 +169,23 @@ class Boss(Entity):
         self.is_casting = False
         self.cast_target_x = 0
         self.cast_target_y = 0
+        self._spell_spawned_this_cast = False
         
         # Active spells
         self.active_spells: list[BossSpell] = []
         
-        # Melee attack hit frames - only frames 5-7 are dangerous
-        self.melee_hit_frames = {4, 5, 6}  # Frames 5, 6, 7 (0-indexed = 4, 5, 6)
+        # Melee hit frames (5-7) and box geometry (data/frame_data.json), written into reused rects
+        self.frame_data = frame_data('boss')
+        self._melee_rect = pygame.Rect(0, 0, 0, 0)
+        self._block_rect = pygame.Rect(0, 0, 0, 0)
+        self._wall_rect = pygame.Rect(0, 0, 0, 0)
+        self._hurtbox = pygame.Rect(0, 0, 0, 0)
         
         # No vertical offset to prevent position issues
         self.draw_offset_y = 0
     
     def _player_in_proximity(self, player: Entity) -> bool:
-        if player is None:
+        if player is None or not self.player_nearby:
             return False
         dx = abs(player.rect.centerx - self.rect.centerx)
         dy = abs(player.rect.centery - self.rect.centery)
@@ -229,7 +245,7 @@ class Boss(Entity):
             return self.state
         return 'walk' if self.alerted else 'idle'
     
-    def update(self, platforms: list[pygame.Rect], player: Optional[Entity] = None):
+    def update(self, platforms: 'CollisionView', player: Optional[Entity] = None):
         # Handle death
         if self.is_dying:
             self.velocity.x = 0
@@ -253,15 +269,14 @@ class Boss(Entity):
             
             # Spawn spell at frame 6 so spell starts from frame 0
             # This way spell damage frames (6-12) align with boss cast motion
-            if int(self.frame_index) == 6 and not hasattr(self, '_spell_spawned_this_cast'):
+            if int(self.frame_index) == 6 and not self._spell_spawned_this_cast:
                 self._spawn_spell(start_frame=0)
                 self._spell_spawned_this_cast = True
             
             if self.animation_finished:
                 self.state = 'walk' if self.alerted else 'idle'
                 self.is_casting = False
-                if hasattr(self, '_spell_spawned_this_cast'):
-                    delattr(self, '_spell_spawned_this_cast')
+                self._spell_spawned_this_cast = False
             return
         
         # Handle melee attack
@@ -329,7 +344,7 @@ class Boss(Entity):
     def draw(self, screen: pygame.Surface, camera_offset_x: float, camera_offset_y: float):
         """Draw boss with custom anchor at x=105px from left (character center in sprite)."""
         flip = (self.direction == -1 and self.base_faces_right) or (self.direction == 1 and not self.base_faces_right)
-        final_image = pygame.transform.flip(self.image, True, False) if flip else self.image
+        final_image = SURFACE_VARIANTS.get(self.image, None, True) if flip else self.image
         
         # Character center is at 105px from left edge of sprite
         sprite_center_offset = 105
@@ -361,21 +376,31 @@ class Boss(Entity):
                 hazards.append(spell.get_hazard_rect())
         return hazards
     
+    def hazardous_spells(self) -> list[BossSpell]:
+        """Active spells that are in damage frames."""
+        return [spell for spell in self.active_spells if spell.is_hazardous()]
+    
+    @classmethod
+    def hazard_providers(cls) -> tuple:
+        """Melee hitbox, invisible wall and attackable body (see core.hazard_registry)."""
+        return (
+            HazardProvider('hazard', 'melee', cls.is_melee_active, cls.get_melee_hazard_rect),
+            HazardProvider('block', None, attrgetter('blocks_player'), cls.get_invisible_wall_rect),
+            HazardProvider('enemy', None, attrgetter('is_alive'), cls.get_hurtbox, on_hit=cls.take_damage),
+        )
+    
+    @classmethod
+    def hazard_emitters(cls) -> tuple:
+        """Spells stay hazardous wherever the boss is."""
+        return (HazardEmitter('hazard', 'spell', cls.hazardous_spells, BossSpell.get_hazard_rect),)
+    
     def is_melee_active(self) -> bool:
         """Check if boss melee attack is in hit frames."""
-        return self.state == 'attack' and int(self.frame_index) in self.melee_hit_frames
+        return self.frame_data.active(self.state, self.frame_index)
     
     def get_melee_hazard_rect(self) -> pygame.Rect:
         """Get melee attack hitbox."""
-        block = self.get_block_rect()
-        w = 40
-        h = 35
-        y = int(block.centery - h // 2)
-        if self.direction == 1:
-            x = block.right
-        else:
-            x = block.left - w
-        return pygame.Rect(x, y, w, h)
+        return self.frame_data.hitbox('attack', self.frame_index, self.direction, self.rect, self._melee_rect)
     
     def mark_spell_damage_dealt(self, spell_rect: pygame.Rect):
         """Mark that a spell has dealt damage to prevent multiple hits."""
@@ -384,53 +409,18 @@ class Boss(Entity):
                 spell.damage_dealt = True
                 break
     
-    def get_block_rect(self, width: int = 40, height: int = 40) -> pygame.Rect:
+    def get_block_rect(self) -> pygame.Rect:
         """Boss collision rect - smaller so player can attack from sides."""
-        cx, cy = self.rect.centerx, self.rect.centery
-        left = int(cx - width // 2)
-        top = int(cy - height // 2)
-        return pygame.Rect(left, top, width, height)
+        return self.frame_data.box('block', self.direction, self.rect, self._block_rect)
     
     def get_invisible_wall_rect(self) -> pygame.Rect:
-        """Get invisible wall rect that blocks player from passing through boss easily.
-        
-        Wall dimensions from sprite:
-        - Left edge: 92px from left of sprite
-        - Width: 27px (ending at 119px from left)
-        - Height: 55px from bottom of sprite
-        """
-        # Get sprite dimensions and flip state
-        flip = (self.direction == -1 and self.base_faces_right) or (self.direction == 1 and not self.base_faces_right)
-        sprite_width = 140  # Boss sprite width
-        sprite_height = 93  # Boss sprite height
-        
-        # Character center is at 105px from left edge of sprite
-        sprite_center_offset = 105
-        
-        # Calculate sprite's left position
-        if flip:
-            anchor_x = sprite_width - sprite_center_offset
-        else:
-            anchor_x = sprite_center_offset
-        
-        sprite_left = self.rect.centerx - anchor_x
-        sprite_bottom = self.rect.bottom
-        
-        # Wall position relative to sprite
-        if flip:
-            # When flipped, mirror the wall position
-            # Original: 92px from left, becomes (140 - 92 - 27) = 21px from left when flipped
-            wall_left_offset = sprite_width - 92 - 27
-        else:
-            # Normal: 92px from left of sprite
-            wall_left_offset = 92
-        
-        wall_x = sprite_left + wall_left_offset
-        wall_y = sprite_bottom - 55  # 55px up from bottom
-        wall_width = 27
-        wall_height = 55
-        
-        return pygame.Rect(wall_x, wall_y, wall_width, wall_height)
+        """Invisible wall (27x55 at the sprite's body, 140x93 sprite anchored at 105 px) that
+        blocks the player from passing through the boss easily."""
+        return self.frame_data.box('wall', self.direction, self.rect, self._wall_rect)
+    
+    def get_hurtbox(self) -> pygame.Rect:
+        """Box the player's attack has to hit."""
+        return self.frame_data.hurtbox(self.state, self.frame_index, self.direction, self.rect, self._hurtbox)
     
     def take_damage(self, amount: int = 1):
         """Boss takes damage from player attack."""
@@ -456,13 +446,12 @@ class Boss(Entity):
         self.is_alive = True
         self.remove_at_ms = pygame.time.get_ticks() + 5000
     
-    def _has_ground_ahead(self, platforms: list[pygame.Rect], direction: int | None = None, ahead_px: int = 10) -> bool:
+    def _has_ground_ahead(self, platforms: 'CollisionView', direction: int | None = None, ahead_px: int = 10) -> bool:
         """Check if there's ground ahead to prevent falling off edges."""
         if direction is None:
             direction = self.direction
+        if platforms.nav is not None:
+            return platforms.nav.ground_ahead(self.rect, direction, ahead_px)
         front_x = self.rect.centerx + direction * (self.rect.width // 2 + max(1, ahead_px))
         probe = pygame.Rect(front_x, self.rect.bottom + 1, 2, 3)
-        for plat in platforms:
-            if plat.colliderect(probe):
-                return True
-        return False
+        return platforms.any_solid(probe)
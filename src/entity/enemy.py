@@ -1,11 +1,24 @@
 import os
 import pygame
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, TYPE_CHECKING
 from entity.entity import Entity
+from core.frame_data import frame_data
+from core.surface_cache import SURFACE_VARIANTS
+from core.hazard_registry import HazardProvider
 from utils.exception import AssetLoadError
+from utils.settings import JUMP_STRENGTH
+
+if TYPE_CHECKING:
+    from core.collision_grid import CollisionView
 
 
 class Enemy(Entity):
+    STATE_FIELDS = {
+        **Entity.STATE_FIELDS,
+        'is_dying': 'b', '_idle_locked': 'b', '_idle_until_ms': 'q', 'remove_at_ms': 'q',
+    }
+
     def __init__(self, x: int, y: int, initial_image: Optional[pygame.Surface] = None, size=(30, 30)):
         self.animations = {'run': [], 'idle': []}
         if initial_image is None:
@@ -24,23 +37,39 @@ class Enemy(Entity):
         self.non_looping_states = {'death'}
 
         self.is_dying = False
+        self.remove_at_ms = 0
         self._idle_locked = False
         self._idle_until_ms = 0
         self.base_faces_right = True
         # By default, enemies block the player; subclasses can override
         self.blocks_player = True
+        # Box geometry (data/frame_data.json, set by subclasses), written into reused rects
+        self.frame_data = None
+        self._block_rect = pygame.Rect(0, 0, 0, 0)
+        self._hitbox = pygame.Rect(0, 0, 0, 0)
+        self._hurtbox = pygame.Rect(0, 0, 0, 0)
 
     def draw(self, screen: pygame.Surface, camera_offset_x: float, camera_offset_y: float):
         flip = (self.direction == -1 and self.base_faces_right) or (self.direction == 1 and not self.base_faces_right)
-        final_image = pygame.transform.flip(self.image, True, False) if flip else self.image
+        final_image = SURFACE_VARIANTS.get(self.image, None, True) if flip else self.image
         draw_y_offset = getattr(self, 'draw_offset_y', 0)
         screen.blit(final_image, (self.rect.x - camera_offset_x, self.rect.y - camera_offset_y + draw_y_offset))
 
-    def get_block_rect(self, width: int = 25, height: int = 25) -> pygame.Rect:
-        cx, cy = self.rect.centerx, self.rect.centery
-        left = int(cx - width // 2)
-        top = int(cy - height // 2)
-        return pygame.Rect(left, top, width, height)
+    def get_block_rect(self) -> pygame.Rect:
+        return self.frame_data.box('block', self.direction, self.rect, self._block_rect)
+
+    def get_hurtbox(self) -> pygame.Rect:
+        """Box the player's attack has to hit."""
+        return self.frame_data.hurtbox(self.state, self.frame_index, self.direction, self.rect, self._hurtbox)
+
+    @classmethod
+    def hazard_providers(cls) -> tuple:
+        """Blocking rect and attackable body (see core.hazard_registry)."""
+        return (
+            HazardProvider('block', None, attrgetter('blocks_player'), cls.get_block_rect),
+            HazardProvider('enemy', None, attrgetter('is_alive'), cls.get_hurtbox,
+                           on_hit=cls.on_killed_by_player),
+        )
 
     def on_player_contact(self):
         self._idle_locked = True
@@ -65,21 +94,22 @@ class Enemy(Entity):
         self.remove_at_ms = pygame.time.get_ticks() + 1500
 
     # Navigation helpers
-    def _has_ground_ahead(self, platforms: list[pygame.Rect], direction: int | None = None, ahead_px: int = 6) -> bool:
+    def _has_ground_ahead(self, platforms: 'CollisionView', direction: int | None = None, ahead_px: int = 6) -> bool:
         """Return True if there's solid ground immediately ahead in the current moving direction.
         Checks a small probe just beyond the front foot to prevent stepping off ledges.
         """
         if direction is None:
             direction = self.direction
+        if platforms.nav is not None:
+            return platforms.nav.ground_ahead(self.rect, direction, ahead_px)
         # Probe point slightly ahead of front foot and just below the feet
         front_x = self.rect.centerx + direction * (self.rect.width // 2 + max(1, ahead_px))
         probe = pygame.Rect(front_x, self.rect.bottom + 1, 2, 3)
-        for plat in platforms:
-            if plat.colliderect(probe):
-                return True
-        return False
+        return platforms.any_solid(probe)
     
 class PatrollingEnemy(Enemy):
+    STATE_FIELDS = {**Enemy.STATE_FIELDS, 'permanent_idle': 'b'}
+
     def __init__(self, x: int, y: int, left_bound_x: Optional[float] = None, right_bound_x: Optional[float] = None, size=(30, 30), speed: float = 2.0, sprite_dir: Optional[str] = None):
         run_frames = []
         idle_frames = []
@@ -144,13 +174,14 @@ class PatrollingEnemy(Enemy):
         self._idle_locked = False
         # Patrol should not hard-block the player; let contact pass through
         self.blocks_player = False
+        self.frame_data = frame_data('patrol')
         # When set true (e.g., after killing player), stay idle forever
         self.permanent_idle = False
 
     def compute_state(self) -> str:
         return super().compute_state()
 
-    def update(self, platforms: list[pygame.Rect], player: Optional[Entity] = None):
+    def update(self, platforms: 'CollisionView', player: Optional[Entity] = None):
         # Death takes precedence: play death animation once
         if self.is_dying:
             self.velocity.x = 0
@@ -187,11 +218,28 @@ class PatrollingEnemy(Enemy):
         return self.is_alive and not self.is_dying
 
     def get_hazard_rect(self) -> pygame.Rect:
-        """Use a slightly inflated collider so contact registers even at edge touch."""
-        return self.get_block_rect().inflate(2, 0)
+        """Slightly wider than the block rect so contact registers even at edge touch."""
+        return self.frame_data.box('contact', self.direction, self.rect, self._hitbox)
+
+    def on_player_touched(self):
+        """Contact with the player: idle briefly, and stay idle for good afterwards."""
+        if self.is_alive:
+            self.on_player_contact()
+        self.permanent_idle = True
+
+    @classmethod
+    def hazard_providers(cls) -> tuple:
+        return (HazardProvider('hazard', 'contact', cls.is_hazard_active, cls.get_hazard_rect,
+                               on_hit=cls.on_player_touched),) + super().hazard_providers()
 
 
 class ChaserEnemy(Enemy):
+    STATE_FIELDS = {
+        **Enemy.STATE_FIELDS,
+        'alerted': 'b', 'player_nearby': 'b', 'permanent_combat_idle': 'b', '_nav_direction': 'q',
+        '_combat_idle_until_ms': 'q', '_landed_hit_this_attack': 'b',
+    }
+
     def __init__(self, x: int, y: int, size=(50, 50), speed: float = 2.5, facing: str = 'right', asset_folder: str = 'Light Bandit'):
         base_path = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.abspath(os.path.join(base_path, '..', '..'))
@@ -240,15 +288,21 @@ class ChaserEnemy(Enemy):
         self.direction = 1 if facing == 'right' else -1
         self.alerted = False
         self.base_faces_right = False
+        # Edge direction of the nav link being followed (jump/drop in progress), 0 if none
+        self._nav_direction = 0
 
         self.detect_range_x = 140
         self.detect_range_y = 80
+        # Cleared by EntityManager.update_player_proximity while the player is far away
+        self.player_nearby = True
 
         self.attack_range_x = 30
         self.attack_vertical_tolerance = 30
         self.combat_idle_duration_ms = 300
         self._combat_idle_until_ms = 0
         self._landed_hit_this_attack = False
+        # When set true (after damaging the player), stay in combat idle forever
+        self.permanent_combat_idle = False
 
         self.vertical_offset = 4
         self.rect.bottom -= self.vertical_offset
@@ -257,23 +311,18 @@ class ChaserEnemy(Enemy):
         # Chaser keeps blocking behavior to feel solid
         self.blocks_player = True
 
-        atk_len = len(self.animations.get('attack', []))
-        if atk_len >= 6:
-            self.hit_frames = {4, 5}
-        elif atk_len >= 4:
-            self.hit_frames = {atk_len // 2}
-        else:
-            self.hit_frames = {0}
+        # Attack hit frames and boxes come from the frame data table
+        self.frame_data = frame_data('chaser')
 
     def _player_in_proximity(self, player: Entity) -> bool:
-        if player is None:
+        if player is None or not self.player_nearby:
             return False
         dx = abs(player.rect.centerx - self.rect.centerx)
         dy = player.rect.bottom - self.rect.top
         return dx <= self.detect_range_x and dy <= self.detect_range_y
 
     def _player_jumped_over(self, player: Entity) -> bool:
-        if player is None:
+        if player is None or not self.player_nearby:
             return False
         dx = abs(player.rect.centerx - self.rect.centerx)
         return player.rect.bottom < self.rect.top and dx <= max(24, self.rect.width // 2 + 10)
@@ -294,7 +343,7 @@ class ChaserEnemy(Enemy):
             return self.state
         return 'run' if self.alerted else 'idle'
 
-    def update(self, platforms: list[pygame.Rect], player: Optional[Entity] = None):
+    def update(self, platforms: 'CollisionView', player: Optional[Entity] = None):
         if self.is_dying:
             self.velocity.x = 0
             # Enter hurt first if available, then death
@@ -363,8 +412,17 @@ class ChaserEnemy(Enemy):
                 self.alerted = True
                 self.direction = 1 if (player.rect.centerx >= self.rect.centerx) else -1
 
-        if self.alerted and player:
-            self.direction = 1 if (player.rect.centerx >= self.rect.centerx) else -1
+        if self.alerted and player and self._nav_direction and not self.is_on_ground:
+            # Mid-air on a jump/drop link: keep the run-up speed until landing
+            self.velocity.x = self.speed * self._nav_direction
+        elif self.alerted and player:
+            self._nav_direction = 0
+            # Player on another span: head for the link that leads there
+            link = platforms.nav.route(self.rect, player.rect) if platforms.nav is not None else None
+            if link is not None:
+                self.direction = link.direction
+            else:
+                self.direction = 1 if (player.rect.centerx >= self.rect.centerx) else -1
             if self._can_attack_now() and self._in_attack_range(player):
                 self.state = 'attack'
                 self.frame_index = 0
@@ -374,6 +432,12 @@ class ChaserEnemy(Enemy):
                 # Check if there's ground ahead before moving
                 if self._has_ground_ahead(platforms, self.direction):
                     self.velocity.x = self.speed * self.direction
+                elif link is not None:
+                    # At the edge of the span: take the link (walk off or jump)
+                    self.velocity.x = self.speed * self.direction
+                    self._nav_direction = self.direction
+                    if link.kind == 'jump':
+                        self.velocity.y = -JUMP_STRENGTH
                 else:
                     # Hit invisible wall (edge of platform) - stop and go idle
                     self.velocity.x = 0
@@ -386,20 +450,22 @@ class ChaserEnemy(Enemy):
         self.step(platforms)
 
     def is_hazard_active(self) -> bool:
-        if self.state != 'attack':
-            return False
-        return self.frame_index in getattr(self, 'hit_frames', set())
+        return self.frame_data.active(self.state, self.frame_index)
 
     def get_hazard_rect(self) -> pygame.Rect:
-        block = self.get_block_rect()
-        w = 34
-        h = 28
-        y = int(block.centery - h // 2)
-        if self.direction == 1:
-            x = block.right
-        else:
-            x = block.left - w
-        return pygame.Rect(x, y, w, h)
+        return self.frame_data.hitbox('attack', self.frame_index, self.direction, self.rect, self._hitbox)
+
+    def on_player_damaged(self):
+        """The attack landed: stand in combat idle from now on."""
+        self.permanent_combat_idle = True
+        self.state = 'combat_idle'
+        self.frame_index = 0
+        self.velocity.x = 0
+
+    @classmethod
+    def hazard_providers(cls) -> tuple:
+        return (HazardProvider('hazard', 'contact', cls.is_hazard_active, cls.get_hazard_rect,
+                               on_damage=cls.on_player_damaged),) + super().hazard_providers()
 
     def on_killed_by_player(self):
         """Override to play hurt then death before removal."""
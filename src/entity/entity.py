@@ -1,5 +1,10 @@
 import pygame
+from typing import TYPE_CHECKING
 from utils.settings import GRAVITY, ANIMATION_SPEED
+from core.surface_cache import SURFACE_VARIANTS
+
+if TYPE_CHECKING:
+    from core.collision_grid import CollisionView
 
 # Import new OOP base class (untuk future migration)
 try:
@@ -19,6 +24,13 @@ class Entity:
     - Inheritance: Base class untuk Player, Enemy, NPC
     - Polymorphism: Subclasses override methods seperti draw(), update()
     """
+    # Fields that change while playing, reset on respawn (RuntimeStateTable typecodes)
+    STATE_FIELDS = {
+        'rect': 'O', 'velocity': 'O', 'image': 'O', 'state': 'O',
+        'direction': 'q', 'frame_index': 'q', 'animation_timer': 'q',
+        'is_on_ground': 'b', 'is_alive': 'b', 'animation_finished': 'b',
+    }
+
     def __init__(self, x: int, y: int, image: pygame.Surface):
         self.image = image
         self.rect = self.image.get_rect(bottomleft=(x, y))
@@ -47,40 +59,28 @@ class Entity:
     def draw(self, screen: pygame.Surface, camera_offset_x: float, camera_offset_y: float):
         final_image = self.image
         if self.direction == -1:
-            final_image = pygame.transform.flip(self.image, True, False)
+            final_image = SURFACE_VARIANTS.get(self.image, None, True)
         screen.blit(final_image, (self.rect.x - camera_offset_x, self.rect.y - camera_offset_y))
 
-    def update_physics(self, platforms: list[pygame.Rect]):
+    def update_physics(self, platforms: 'CollisionView'):
         if not self.is_alive:
             self.velocity.x = 0
             self.velocity.y += GRAVITY
-            self.rect.y += self.velocity.y
-            for platform in platforms:
-                if self.rect.colliderect(platform) and self.velocity.y > 0:
-                    self.rect.bottom = platform.top
+            if self.velocity.y > 0:
+                if platforms.move_y(self.rect, self.velocity.y):
                     self.velocity.y = 0
+            else:
+                self.rect.y += self.velocity.y
             return
 
-        self.rect.x += self.velocity.x
-        for platform in platforms:
-            if self.rect.colliderect(platform):
-                if self.velocity.x > 0:
-                    self.rect.right = platform.left
-                elif self.velocity.x < 0:
-                    self.rect.left = platform.right
+        platforms.move_x(self.rect, self.velocity.x)
 
         self.velocity.y += GRAVITY
-        self.rect.y += self.velocity.y
         self.is_on_ground = False
-        for platform in platforms:
-            if self.rect.colliderect(platform):
-                if self.velocity.y > 0:
-                    self.rect.bottom = platform.top
-                    self.velocity.y = 0
-                    self.is_on_ground = True
-                elif self.velocity.y < 0:
-                    self.rect.top = platform.bottom
-                    self.velocity.y = 0
+        hit = platforms.move_y(self.rect, self.velocity.y)
+        if hit:
+            self.velocity.y = 0
+            self.is_on_ground = hit.normal[1] < 0
 
     def compute_state(self) -> str:
         return self.state
@@ -105,7 +105,29 @@ class Entity:
             if len(current_animation) > 0:
                 self.image = current_animation[self.frame_index]
 
-    def step(self, platforms: list[pygame.Rect]):
+    def catch_up(self, ticks: int):
+        """
+        Resume after `ticks` parked ticks (no physics or AI ran meanwhile).
+        Only the animation clock is fast-forwarded, exactly as animate() would.
+        """
+        period = ANIMATION_SPEED + 1
+        total = self.animation_timer + ticks
+        steps = total // period
+        self.animation_timer = total % period
+        current_animation = self.animations.get(self.state, [])
+        if not steps or not current_animation:
+            return
+
+        if self.state in self.non_looping_states:
+            last = len(current_animation) - 1
+            if steps > last - self.frame_index:
+                self.animation_finished = True
+            self.frame_index = min(last, self.frame_index + steps)
+        else:
+            self.frame_index = (self.frame_index + steps) % len(current_animation)
+        self.image = current_animation[self.frame_index]
+
+    def step(self, platforms: 'CollisionView'):
         self.update_physics(platforms)
         self.animate()
 
@@ -187,15 +187,18 @@ class NPC(Entity):
         except Exception:
             self.font = pygame.font.SysFont(None, 16)
 
-    def update(self, player_rect: pygame.Rect):
-        # Hitung jarak ke player dulu (dibutuhkan untuk beberapa kondisi)
-        dist_x = abs(self.rect.centerx - player_rect.centerx)
-        dist_y = abs(self.rect.centery - player_rect.centery)
-        total_dist = (dist_x ** 2 + dist_y ** 2) ** 0.5
+    def update(self, player_rect: pygame.Rect, nearby: bool = True):
+        # Hitung jarak ke player dulu (dibutuhkan untuk beberapa kondisi).
+        # nearby=False: spatial hash sudah memastikan player di luar WATCH_DISTANCE
+        if nearby:
+            dist_x = abs(self.rect.centerx - player_rect.centerx)
+            dist_y = abs(self.rect.centery - player_rect.centery)
+        else:
+            dist_x = dist_y = float('inf')
         
         # Update watching state - HANYA jika sudah pernah ngobrol DAN sesi watch belum selesai
         if self.has_talked and not self.talking and not self.watch_session_ended:
-            if total_dist < self.WATCH_DISTANCE:
+            if dist_x * dist_x + dist_y * dist_y < self.WATCH_DISTANCE * self.WATCH_DISTANCE:
                 self.is_watching_player = True
             else:
                 # Player sudah menjauh, sesi watch selesai PERMANEN
@@ -261,6 +264,14 @@ class NPC(Entity):
             # Sesi watch sudah selesai, tetap di arah default
             self.direction = self.default_direction
 
+    def catch_up(self, ticks: int):
+        """Resume after being parked: advance the idle animation, patrol resumes in place."""
+        if self.talking or self.is_watching_player or self.is_transitioning_to_talk:
+            return
+        if len(self.idle_frames) > 1:
+            self.frame_index = (self.frame_index + self.anim_speed * ticks) % len(self.idle_frames)
+            self.image = self.idle_frames[int(self.frame_index)]
+
     def handle_event(self, event: pygame.event.Event, player_rect: pygame.Rect = None, player=None):
         # player_rect: optional, used to make NPC face the player when conversation starts
         # player: optional, player object to make player face the NPC
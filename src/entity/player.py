@@ -2,6 +2,8 @@ import os
 import pygame
 from utils.settings import *
 from entity.entity import Entity
+from core.frame_data import frame_data
+from core.surface_cache import SURFACE_VARIANTS
 from utils.exception import AssetLoadError, SpriteSheetError
 
 base_path = os.path.dirname(os.path.abspath(__file__))
@@ -23,6 +25,11 @@ class Player(Entity):
         self.attack_state: str | None = None
         self.combo_buffer: bool = False
 
+        # Attack hitbox / hurtbox geometry (data/frame_data.json), written into reused rects
+        self.frame_data = frame_data('player')
+        self._attack_hitbox = pygame.Rect(0, 0, 0, 0)
+        self._hurtbox = pygame.Rect(0, 0, 0, 0)
+
     def _load_animations_from_spritesheet(self):
         self.animations = {'idle': [], 'run': [], 'jump': [], 'fall': [], 'death': []}
         player_asset_path = os.path.join(assets_path, 'Player')
@@ -152,25 +159,17 @@ class Player(Entity):
         if not self.is_alive:
             self.velocity.x = 0 
             self.velocity.y += GRAVITY
-            self.rect.y += self.velocity.y
-            for platform in platforms:
-                if self.rect.colliderect(platform) and self.velocity.y > 0:
-                    self.rect.bottom = platform.top
-                    self.velocity.y = 0
+            if self.velocity.y > 0:
+                if platforms.move_y(self.rect, self.velocity.y): self.velocity.y = 0
+            else:
+                self.rect.y += self.velocity.y
             return
 
-        self.rect.x += self.velocity.x
-        for platform in platforms:
-            if self.rect.colliderect(platform):
-                if self.velocity.x > 0: self.rect.right = platform.left
-                elif self.velocity.x < 0: self.rect.left = platform.right
+        platforms.move_x(self.rect, self.velocity.x)
         self.velocity.y += GRAVITY
-        self.rect.y += self.velocity.y
         self.is_on_ground = False
-        for platform in platforms:
-            if self.rect.colliderect(platform):
-                if self.velocity.y > 0: self.rect.bottom = platform.top; self.velocity.y = 0; self.is_on_ground = True
-                elif self.velocity.y < 0: self.rect.top = platform.bottom; self.velocity.y = 0
+        hit = platforms.move_y(self.rect, self.velocity.y)
+        if hit: self.velocity.y = 0; self.is_on_ground = hit.normal[1] < 0
 
     def compute_state(self) -> str:
         if not self.is_alive:
@@ -184,6 +183,11 @@ class Player(Entity):
     def jump(self):
         if self.is_on_ground and self.is_alive: self.velocity.y = -JUMP_STRENGTH
 
+    @property
+    def dimension(self) -> str:
+        """Current dimension name, used to pick prebuilt level views."""
+        return 'gema' if self.in_gema_dimension else 'normal'
+
     def shift_dimension(self):
         if self.is_alive: self.in_gema_dimension = not self.in_gema_dimension
 
@@ -230,7 +234,7 @@ class Player(Entity):
     def draw(self, screen: pygame.Surface, camera_offset_x: float, camera_offset_y: float):
         img = self.image
         if self.direction == -1:
-            img = pygame.transform.flip(img, True, False)
+            img = SURFACE_VARIANTS.get(img, None, True)
 
         draw_x = self.rect.x - camera_offset_x
         draw_y = (self.rect.bottom - img.get_height()) - camera_offset_y
@@ -243,15 +247,18 @@ class Player(Entity):
 
     # Combat helpers
     def is_attack_active(self) -> bool:
-        return (self.attack_state in ('attack1', 'attack2')) and not getattr(self, 'animation_finished', False)
+        return ((self.attack_state in ('attack1', 'attack2')) and not getattr(self, 'animation_finished', False)
+                and self.frame_data.active(self.attack_state, self.frame_index))
 
-    def get_attack_hitbox(self, width: int = 20) -> pygame.Rect | None:
+    def get_attack_hitbox(self) -> pygame.Rect | None:
+        """Hitbox of the current attack frame (a reused rect; valid until the next call)."""
         if not self.is_attack_active():
             return None
-        if self.direction == 1:
-            return pygame.Rect(self.rect.right, self.rect.top, width, self.rect.height)
-        else:
-            return pygame.Rect(self.rect.left - width, self.rect.top, width, self.rect.height)
+        return self.frame_data.hitbox(self.attack_state, self.frame_index, self.direction,
+                                      self.rect, self._attack_hitbox)
+
+    def get_hurtbox(self) -> pygame.Rect:
+        return self.frame_data.hurtbox(self.state, self.frame_index, self.direction, self.rect, self._hurtbox)
 
     def handle_event(self, event):
         if not self.is_alive: return
@@ -299,8 +306,9 @@ class Player(Entity):
         if self.rect.top > fall_limit_y:
             damage_source = 'fall'
         else:
+            hurtbox = self.get_hurtbox()
             for r in hazard_rects:
-                if self.rect.colliderect(r):
+                if hurtbox.colliderect(r):
                     damage_source = 'trap'
                     break
 
@@ -34,12 +34,18 @@ class Campfire:
         if self.frame_index >= len(frames):
             self.frame_index = 0.0
 
-    def draw(self, surface: pygame.Surface, offset_x: float, offset_y: float, frames: list[pygame.Surface]):
+    def draw(self, surface: pygame.Surface, offset_x: float, offset_y: float, frames: list[pygame.Surface],
+             variants=None):
+        """`variants` (SurfaceVariantCache) supplies the frame pre-scaled to the campfire size."""
         if not frames:
             return
         idx = int(self.frame_index)
         if 0 <= idx < len(frames):
             image_to_draw = frames[idx]
-            scaled_image = pygame.transform.scale(image_to_draw, (self.rect.width, self.rect.height))
+            size = self.rect.size
+            if variants is not None:
+                scaled_image = variants.get(image_to_draw, size)
+            else:
+                scaled_image = pygame.transform.scale(image_to_draw, size)
             vertical_offset = 10
             surface.blit(scaled_image, (self.rect.x - offset_x, self.rect.y - offset_y + vertical_offset))
@@ -45,13 +45,19 @@ class TriggerTrap:
                     self.animation_finished = True
                     self.frame_index = len(frames) - 1
 
-    def draw(self, surface: pygame.Surface, offset_x: float, offset_y: float, frames: list[pygame.Surface]):
+    def draw(self, surface: pygame.Surface, offset_x: float, offset_y: float, frames: list[pygame.Surface],
+             variants=None):
+        """`variants` (SurfaceVariantCache) supplies the frame pre-scaled to the trap size."""
         if not self.is_active or not frames:
             return
         idx = int(self.frame_index)
         if 0 <= idx < len(frames):
             frame_to_draw = frames[idx]
-            scaled_image = pygame.transform.scale(frame_to_draw, (self.trap_rect.width, self.trap_rect.height))
+            size = self.trap_rect.size
+            if variants is not None:
+                scaled_image = variants.get(frame_to_draw, size)
+            else:
+                scaled_image = pygame.transform.scale(frame_to_draw, size)
             vertical_offset = 20
             draw_y = self.trap_rect.y + vertical_offset
             surface.blit(scaled_image, (self.trap_rect.x - offset_x, draw_y - offset_y))
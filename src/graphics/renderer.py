@@ -3,8 +3,10 @@ Renderer - Menangani semua rendering/drawing game.
 Memisahkan render logic dari main game class.
 """
 import pygame
-from typing import List, Dict, Any, TYPE_CHECKING
-from utils.settings import COLOR_BG_NORMAL, COLOR_BG_GEMA
+from typing import List, Dict, Any, Tuple, TYPE_CHECKING
+from utils.settings import COLOR_BG_NORMAL, COLOR_BG_GEMA, RENDER_CULL_MARGIN
+from graphics.tile_chunks import TileChunkCache
+from core.interval_index import IntervalIndex, rect_span
 
 if TYPE_CHECKING:
     from core.entity_manager import EntityManager
@@ -12,6 +14,13 @@ if TYPE_CHECKING:
     from core.asset_loader import AssetLoader
 
 
+# Horizontal extent used to cull each kind of static level object
+CULL_SPANS = {
+    'trigger_traps': lambda trap: (trap.trap_rect.left, trap.trap_rect.right),
+    'campfires': rect_span,
+}
+
+
 class Renderer:
     """
     Renderer class untuk menangani semua drawing operations.
@@ -22,6 +31,11 @@ class Renderer:
         self.game_surface = game_surface
         self.screen = screen
         self.debug_draw = False
+        self._debug_font = None
+        self.tile_chunks = TileChunkCache()
+        # Static level objects indexed by world x, per (kind, dimension) view
+        self._cull_indices: Dict[Tuple[str, str], IntervalIndex] = {}
+        self.cull_counts: Dict[str, Tuple[int, int]] = {}
     
     def toggle_debug(self):
         """Toggle debug drawing mode."""
@@ -35,7 +49,9 @@ class Renderer:
                trigger_traps: List,
                parallax_layers: List,
                moon_object: Any,
-               moon_shadow_object: Any):
+               moon_shadow_object: Any,
+               npcs: List,
+               campfires: List):
         """
         Main render method - draws everything to screen.
         
@@ -43,17 +59,23 @@ class Renderer:
             entity_manager: Entity manager with player, enemies, npcs, campfires
             camera: Camera controller for offset
             asset_loader: Asset loader with tile images and animation frames
-            platforms: List of platform dictionaries
-            trigger_traps: List of trap objects
+            platforms: Platforms of the player's dimension (prebuilt view)
+            trigger_traps: Traps of the player's dimension (prebuilt view)
             parallax_layers: List of parallax layer objects
             moon_object: Moon drawable object
             moon_shadow_object: Moon shadow drawable object
+            npcs: NPCs of the player's dimension (prebuilt view)
+            campfires: Campfires of the player's dimension (prebuilt view)
         """
         player = entity_manager.player
         camera_offset = camera.get_offset(player.rect)
         
         # Get current dimension
-        current_dim = 'gema' if player.in_gema_dimension else 'normal'
+        current_dim = player.dimension
+        
+        # World x range that can appear on screen; everything else is culled
+        view_span = (camera_offset[0] - RENDER_CULL_MARGIN,
+                     camera_offset[0] + self.game_surface.get_width() + RENDER_CULL_MARGIN)
         
         # Clear screen with background color
         bg_color = COLOR_BG_GEMA if current_dim == 'gema' else COLOR_BG_NORMAL
@@ -71,55 +93,58 @@ class Renderer:
         self._draw_platforms(platforms, current_dim, camera_offset, asset_loader)
         
         # Draw traps
-        self._draw_traps(trigger_traps, current_dim, camera_offset, asset_loader)
+        trigger_traps = self._cull('trigger_traps', current_dim, trigger_traps, view_span)
+        self._draw_traps(trigger_traps, camera_offset, asset_loader)
         
         # Draw campfires
-        self._draw_campfires(entity_manager.campfires, camera_offset, asset_loader)
+        campfires = self._cull('campfires', current_dim, campfires, view_span)
+        self._draw_campfires(campfires, camera_offset, asset_loader)
         
         # Draw entities (player, enemies, NPCs)
-        entity_manager.draw_all(self.game_surface, camera_offset[0], camera_offset[1])
+        entity_manager.draw_all(self.game_surface, camera_offset[0], camera_offset[1], npcs=npcs,
+                                view_span=view_span)
         
         # Debug drawing
         if self.debug_draw:
-            self._draw_debug(entity_manager, camera_offset, current_dim)
+            self._draw_debug(entity_manager, camera_offset, npcs, asset_loader)
         
-        # Scale to screen
-        self.screen.blit(
-            pygame.transform.scale(self.game_surface, self.screen.get_size()), 
-            (0, 0)
-        )
+        # Scale to screen (written straight into the screen surface)
+        pygame.transform.scale(self.game_surface, self.screen.get_size(), self.screen)
+    
+    def _cull(self, kind: str, dim: str, items: List, view_span: Tuple[float, float]) -> List:
+        """Static level objects of a dimension view that overlap `view_span`."""
+        index = self._cull_indices.get((kind, dim))
+        if index is None:
+            index = self._cull_indices[(kind, dim)] = IntervalIndex(CULL_SPANS[kind])
+        index.sync(items)
+        visible = index.query(*view_span)
+        self.cull_counts[kind] = (len(visible), len(items) - len(visible))
+        return visible
     
     def _draw_parallax(self, parallax_layers: List, camera_offset: tuple):
         """Draw parallax background layers."""
         for layer in reversed(parallax_layers):
             layer.draw(self.game_surface, camera_offset[0], 0)
     
-    def _draw_platforms(self, platforms: List[Dict], current_dim: str, 
-                        camera_offset: tuple, asset_loader: 'AssetLoader'):
-        """Draw all visible platforms."""
-        for p in platforms:
-            if p['dim'] in [current_dim, 'both']:
-                tile_image = asset_loader.tile_images.get(p['char'])
-                if tile_image:
-                    scaled_image = pygame.transform.scale(
-                        tile_image, 
-                        (p['rect'].width, p['rect'].height)
-                    )
-                    self.game_surface.blit(
-                        scaled_image, 
-                        (p['rect'].x - camera_offset[0], p['rect'].y - camera_offset[1])
-                    )
+    def _draw_platforms(self, platforms: List[Dict], current_dim: str, camera_offset: tuple,
+                        asset_loader: 'AssetLoader'):
+        """Draw the baked tile chunks of the current dimension that are on screen."""
+        self.tile_chunks.draw(
+            self.game_surface, current_dim, platforms, camera_offset,
+            asset_loader.tile_images, asset_loader.variants
+        )
     
-    def _draw_traps(self, trigger_traps: List, current_dim: str,
-                    camera_offset: tuple, asset_loader: 'AssetLoader'):
+    def _draw_traps(self, trigger_traps: List, camera_offset: tuple,
+                    asset_loader: 'AssetLoader'):
         """Draw all active traps."""
         for trap in trigger_traps:
-            if trap.is_active and trap.dim in [current_dim, 'both']:
+            if trap.is_active:
                 trap.draw(
                     self.game_surface, 
                     camera_offset[0], 
                     camera_offset[1], 
-                    asset_loader.spike_frames
+                    asset_loader.spike_frames,
+                    asset_loader.variants
                 )
     
     def _draw_campfires(self, campfires: List, camera_offset: tuple, 
@@ -130,11 +155,12 @@ class Renderer:
                 self.game_surface, 
                 camera_offset[0], 
                 camera_offset[1], 
-                asset_loader.campfire_frames
+                asset_loader.campfire_frames,
+                asset_loader.variants
             )
     
     def _draw_debug(self, entity_manager: 'EntityManager', 
-                    camera_offset: tuple, current_dim: str):
+                    camera_offset: tuple, npcs: List, asset_loader: 'AssetLoader'):
         """Draw debug hitboxes for all entities."""
         player = entity_manager.player
         
@@ -176,14 +202,47 @@ class Renderer:
             )
         
         # NPC hitboxes (cyan)
-        for npc in entity_manager.npcs:
-            if getattr(npc, "dim", "both") in (current_dim, "both"):
-                pygame.draw.rect(
-                    self.game_surface, (0, 255, 255),
-                    pygame.Rect(
-                        npc.rect.x - camera_offset[0], 
-                        npc.rect.y - camera_offset[1],
-                        npc.rect.width, 
-                        npc.rect.height
-                    ), 1
-                )
+        for npc in npcs:
+            pygame.draw.rect(
+                self.game_surface, (0, 255, 255),
+                pygame.Rect(
+                    npc.rect.x - camera_offset[0], 
+                    npc.rect.y - camera_offset[1],
+                    npc.rect.width, 
+                    npc.rect.height
+                ), 1
+            )
+        
+        # Activation stats (awake / total)
+        counts = entity_manager.activation_counts()
+        self._draw_debug_text(
+            f"Active enemies {counts['enemies'][0]}/{counts['enemies'][1]}  "
+            f"NPCs {counts['npcs'][0]}/{counts['npcs'][1]}",
+            4, 4
+        )
+        variants = asset_loader.variants
+        self._draw_debug_text(
+            f"Surface variants {len(variants)}  hit {variants.hits}  miss {variants.misses}  "
+            f"evicted {variants.evictions}",
+            4, 16
+        )
+        chunks = self.tile_chunks
+        self._draw_debug_text(
+            f"Tile chunks drawn {chunks.drawn}  culled {chunks.culled}  cached {chunks.cached}  "
+            f"built {chunks.built}",
+            4, 28
+        )
+        # Per-frame submitted/culled counts
+        counts = dict(self.cull_counts, **entity_manager.cull_counts)
+        self._draw_debug_text(
+            "Culling " + "  ".join(
+                f"{kind} {submitted}/{culled}" for kind, (submitted, culled) in counts.items()
+            ) + "  (submitted/culled)",
+            4, 40
+        )
+    
+    def _draw_debug_text(self, text: str, x: int, y: int):
+        """Small debug line on the game surface."""
+        if self._debug_font is None:
+            self._debug_font = pygame.font.Font(None, 16)
+        self.game_surface.blit(self._debug_font.render(text, True, (255, 255, 255)), (x, y))
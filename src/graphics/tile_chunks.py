@@ -0,0 +1,142 @@
+"""
+Tile Chunks - Geometri statis level (tile G/P) dipanggang ke surface chunk
+selebar TILE_CHUNK_WIDTH px per dimensi. Chunk dibuat saat pertama terlihat,
+lalu tiap frame hanya 1-3 chunk yang memotong viewport di-blit (bukan satu
+blit per tile). Saat view platform dibangun ulang (level baru, chunk stream
+dimuat) hanya chunk yang isinya berubah yang dibuang; invalidate(rect) untuk
+perubahan geometri di tempat (editor, trap yang mengubah tile).
+"""
+import pygame
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from utils.settings import TILE_CHUNK_WIDTH, TILE_CHUNK_MAX_SURFACES
+
+
+class _DimensionChunks:
+    """Chunk state of one dimension's platform view."""
+
+    def __init__(self):
+        self.source: Optional[List[Dict]] = None
+        self.top = 0
+        self.height = 0
+        self.buckets: Dict[int, List[Dict]] = {}
+        self.signatures: Dict[int, tuple] = {}
+        self.surfaces: 'OrderedDict[int, pygame.Surface]' = OrderedDict()
+
+
+class TileChunkCache:
+    """
+    Cache surface chunk per dimensi.
+
+    draw() mendeteksi view platform baru dari identitas list-nya (DimensionViews
+    selalu membuat list baru saat build), membagi ulang tile per chunk dan
+    membandingkan isi tiap chunk dengan sebelumnya.
+    """
+
+    def __init__(self, chunk_width: int = TILE_CHUNK_WIDTH, max_surfaces: int = TILE_CHUNK_MAX_SURFACES):
+        self.chunk_width = chunk_width
+        self.max_surfaces = max_surfaces
+        self._dims: Dict[str, _DimensionChunks] = {}
+        self.built = 0
+        self.drawn = 0
+        self.culled = 0
+
+    def _sync(self, state: _DimensionChunks, platforms: List[Dict]):
+        """Re-bucket a new platform view, keeping surfaces of unchanged chunks."""
+        width = self.chunk_width
+        buckets: Dict[int, List[Dict]] = {}
+        top, bottom = None, None
+        for p in platforms:
+            rect = p['rect']
+            for index in range(rect.left // width, (rect.right - 1) // width + 1):
+                buckets.setdefault(index, []).append(p)
+            top = rect.top if top is None else min(top, rect.top)
+            bottom = rect.bottom if bottom is None else max(bottom, rect.bottom)
+        top = top or 0
+        height = (bottom or 0) - top
+
+        signatures = {
+            index: tuple((p['char'], tuple(p['rect'])) for p in bucket)
+            for index, bucket in buckets.items()
+        }
+        if (top, height) != (state.top, state.height):
+            state.surfaces.clear()
+        else:
+            for index in list(state.surfaces):
+                if signatures.get(index) != state.signatures.get(index):
+                    del state.surfaces[index]
+
+        state.source = platforms
+        state.top, state.height = top, height
+        state.buckets = buckets
+        state.signatures = signatures
+
+    def _build(self, state: _DimensionChunks, index: int, tile_images: Dict, variants) -> pygame.Surface:
+        """Render one chunk's tiles into a transparent surface."""
+        left = index * self.chunk_width
+        surface = pygame.Surface((self.chunk_width, max(state.height, 1)), pygame.SRCALPHA)
+        top = state.top
+        for p in state.buckets[index]:
+            tile_image = tile_images.get(p['char'])
+            if tile_image:
+                rect = p['rect']
+                surface.blit(variants.get(tile_image, rect.size), (rect.x - left, rect.y - top))
+        surfaces = state.surfaces
+        surfaces[index] = surface
+        while len(surfaces) > self.max_surfaces:
+            surfaces.popitem(last=False)
+        self.built += 1
+        return surface
+
+    def draw(self, target: pygame.Surface, dim: str, platforms: List[Dict], camera_offset: Tuple[float, float],
+             tile_images: Dict, variants):
+        """Blit the chunks of `platforms` (the `dim` view) that intersect the viewport."""
+        state = self._dims.get(dim)
+        if state is None:
+            state = self._dims[dim] = _DimensionChunks()
+        if state.source is not platforms:
+            self._sync(state, platforms)
+
+        width = self.chunk_width
+        offset_x, offset_y = camera_offset
+        first = int(offset_x // width)
+        last = int((offset_x + target.get_width() - 1) // width)
+        y = state.top - offset_y
+        buckets, surfaces = state.buckets, state.surfaces
+        drawn = 0
+        for index in range(first, last + 1):
+            if index not in buckets:
+                continue
+            surface = surfaces.get(index)
+            if surface is None:
+                surface = self._build(state, index, tile_images, variants)
+            else:
+                surfaces.move_to_end(index)
+            target.blit(surface, (index * width - offset_x, y))
+            drawn += 1
+        self.drawn = drawn
+        self.culled = len(buckets) - drawn
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None, dim: Optional[str] = None):
+        """Drop baked chunks overlapping `rect` (all chunks if None) in `dim` (every dimension if None)."""
+        if dim is None:
+            states = list(self._dims.values())
+        else:
+            states = [self._dims[dim]] if dim in self._dims else []
+        for state in states:
+            if rect is None:
+                state.surfaces.clear()
+                state.source = None
+                continue
+            for index in range(rect.left // self.chunk_width, (rect.right - 1) // self.chunk_width + 1):
+                state.surfaces.pop(index, None)
+            # Tiles may have been edited in place: re-bucket on the next draw
+            state.source = None
+
+    @property
+    def cached(self) -> int:
+        return sum(len(state.surfaces) for state in self._dims.values())
+
+    def clear(self):
+        self._dims.clear()
@@ -4,21 +4,36 @@ Refactored untuk lebih modular dengan separation of concerns.
 """
 import pygame
 import os
+import time
+from itertools import chain
 
 # Core controllers
 from core.game_state import GameStateEnum
 from core.game_setup import GameSetup
+from core.level_prefetcher import LevelPrefetcher
+from core.dimension_views import DimensionViews
+from core.collision_grid import CollisionGrid
+from core.nav_graph import NavGraph
+from core.snapshot import LevelSnapshot
+from core.fixed_step import FixedStepClock, Interpolator
+from core.headless import NULL_TIMER
+from entity.npc import NPC
 
 # UI
 from graphics import UI
-from utils.settings import FPS, PLAYER_SPEED, JUMP_STRENGTH
+from utils.settings import (PLAYER_SPEED, JUMP_STRENGTH, LEVEL_PREFETCH_FRACTION,
+                            SIM_TICK_RATE, MAX_CATCH_UP_TICKS, RENDER_FPS,
+                            NAV_AGENT_SIZE, NAV_AGENT_SPEED)
 from utils.exception import AssetLoadError, AudioLoadError
 
 
 class Game:
     """Main game class - orchestrates all game systems."""
     
-    def __init__(self):
+    def __init__(self, headless=False):
+        # Headless runs (core.headless) use a simulated clock and never write saves
+        self.headless = headless
+        
         # Initialize Pygame and display
         self.screen, self.game_surface, self.clock, self.font = GameSetup.init_pygame()
         self.game_surface_width = self.game_surface.get_width()
@@ -51,14 +66,44 @@ class Game:
         
         # Level data
         self.platforms = []
+        self.collision_platforms = []  # CollisionGrid source: merged spans, or the platforms list itself
         self.trigger_traps = []
         self.end_triggers = []
         self.level_width_pixels = 0
         
+        # Per-dimension views of the lists above (rebuilt when they change)
+        self.level_views = DimensionViews()
+        
+        # Tile grid used for physics, rebuilt with the views
+        self.collision_grid = CollisionGrid(self.level_controller.tile_size)
+        
+        # Walkable spans + jump/drop links per dimension, attached to the grid views
+        self.nav_graph = NavGraph(NAV_AGENT_SIZE, NAV_AGENT_SPEED)
+        self._nav_platforms = None  # platform list the nav graph was built from
+        self._nav_stream = None  # level stream the nav graph follows incrementally
+        
+        # Static structures of the current level, shared across restarts
+        self.level_snapshot = None
+        
+        # Per-system update timings (core.headless.SystemTimer while profiling)
+        self.system_timer = NULL_TIMER
+        
+        # Fixed-timestep simulation, interpolated rendering
+        self.sim_clock = FixedStepClock(SIM_TICK_RATE, MAX_CATCH_UP_TICKS)
+        self.interpolator = Interpolator()
+        
         # Cached level data to prevent re-parsing
         self._cached_normal_data = None
         self._cached_gema_data = None
         
+        # Streamed level (chunked loading, only for very wide maps)
+        self.level_stream = None
+        self._stream_structures = {}  # chunk index -> static structures
+        self._stream_parked = {}      # chunk index -> {list name: entities}
+        
+        # Next level is prepared on a worker thread while this one is played
+        self.level_prefetcher = LevelPrefetcher(self.level_controller)
+        
         # Parallax
         self.parallax_layers = []
         self.moon_object = None
@@ -75,10 +120,14 @@ class Game:
         self.last_click_time = 0
         self.click_cooldown_ms = 300  # 300ms between clicks
     
-    def setup_level(self, new_game=False, force_reparse=False):
-        """Setup current level from level controller."""
+    def setup_level(self, new_game=False, force_reparse=False, prefetched=None):
+        """
+        Setup current level from level controller.
+        `prefetched` is a result from LevelPrefetcher for this level (new_game only).
+        """
         if new_game:
             self.platforms = []
+            self.collision_platforms = []
             self.trigger_traps = []
             self.end_triggers = []
             self.camera.set_right_limit(None)
@@ -86,24 +135,35 @@ class Game:
             self.entity_manager.clear_all()
             self._cached_normal_data = None
             self._cached_gema_data = None
+            self.level_snapshot = None
+            self._close_level_stream()
+            if self.level_controller.should_stream():
+                self.level_stream = self.level_controller.open_level_stream()
         
-        # Get level file paths
-        normal_path, gema_path = self.level_controller.get_level_paths()
+        if self.level_stream:
+            self._setup_streamed_level(new_game)
+            return
+        
+        if new_game and prefetched:
+            self._setup_prefetched_level(prefetched)
+            return
         
-        # Parse or use cached data
+        # Load (compiled or parsed) or use cached data
         if force_reparse or self._cached_normal_data is None or self._cached_gema_data is None:
-            normal_data = self.level_controller.parse_level_file(normal_path)
-            gema_data = self.level_controller.parse_level_file(gema_path)
+            normal_data, gema_data = self.level_controller.load_level_pair()
             self._cached_normal_data = normal_data
             self._cached_gema_data = gema_data
+            self.level_snapshot = None
         else:
             normal_data = self._cached_normal_data
             gema_data = self._cached_gema_data
         
-        # Setup level elements using GameSetup
-        self.platforms = GameSetup.setup_platforms(normal_data, gema_data)
-        self.trigger_traps = GameSetup.setup_trigger_traps(normal_data, gema_data)
-        self.end_triggers = GameSetup.setup_end_triggers(normal_data, gema_data)
+        # Setup level elements once per loaded level, shared by reference afterwards
+        if self.level_snapshot is None:
+            self.level_snapshot = GameSetup.build_level_snapshot(normal_data, gema_data)
+        else:
+            self.level_snapshot.restore()
+        self._use_level_snapshot()
         
         # Setup entities
         if new_game or not self.entity_manager.player:
@@ -112,19 +172,7 @@ class Game:
         
         # Setup enemies, NPCs, campfires
         if new_game:
-            GameSetup.setup_enemies(
-                self.entity_manager, normal_data, gema_data, 
-                self.level_controller.tile_size
-            )
-            GameSetup.setup_npcs(
-                self.entity_manager, 
-                normal_data['npc_spawns'], gema_data['npc_spawns'],
-                self.snap_actor_to_ground
-            )
-            GameSetup.setup_campfires(
-                self.entity_manager,
-                normal_data['campfires'], gema_data['campfires']
-            )
+            self._spawn_level_entities(normal_data, gema_data)
         
         # Setup parallax
         if new_game:
@@ -137,23 +185,222 @@ class Game:
             limit = normal_data['camera_right_limit'] or gema_data['camera_right_limit']
             self.camera.set_right_limit(limit)
         
+        self.rebuild_level_views()
+        
         # Reset gameplay handler state
         self.gameplay.reset_state()
     
+    def _spawn_level_entities(self, normal_data, gema_data):
+        """Create the enemies, NPCs and campfires of a freshly loaded level."""
+        GameSetup.setup_enemies(
+            self.entity_manager, normal_data, gema_data, 
+            self.level_controller.tile_size
+        )
+        GameSetup.setup_npcs(
+            self.entity_manager, 
+            normal_data['npc_spawns'], gema_data['npc_spawns'],
+            self.snap_actor_to_ground
+        )
+        GameSetup.setup_campfires(
+            self.entity_manager,
+            normal_data['campfires'], gema_data['campfires']
+        )
+    
+    def _setup_prefetched_level(self, prefetched):
+        """Swap in a level built by the prefetcher (main thread work only)."""
+        normal_data = prefetched['normal_data']
+        gema_data = prefetched['gema_data']
+        self._cached_normal_data = normal_data
+        self._cached_gema_data = gema_data
+        
+        self.level_snapshot = LevelSnapshot(prefetched)
+        self._use_level_snapshot()
+        
+        # Entities load sprites and fonts, so they are only ever built here
+        start_pos = normal_data['start_pos'] or (100, 100)
+        self.entity_manager.create_player(start_pos[0], start_pos[1])
+        self._spawn_level_entities(normal_data, gema_data)
+        
+        result = GameSetup.setup_parallax(self.asset_loader)
+        self.parallax_layers, self.moon_object, self.moon_shadow_object = result
+        
+        self.level_width_pixels = max(normal_data['max_width'], gema_data['max_width']) + 40
+        limit = normal_data['camera_right_limit'] or gema_data['camera_right_limit']
+        if limit:
+            self.camera.set_right_limit(limit)
+        
+        self.rebuild_level_views()
+        self.gameplay.reset_state()
+    
+    def _use_level_snapshot(self):
+        """Point the level lists at the snapshot (no copying)."""
+        snapshot = self.level_snapshot
+        self.platforms = snapshot.platforms
+        self.collision_platforms = snapshot.collision_platforms
+        self.trigger_traps = snapshot.trigger_traps
+        self.end_triggers = snapshot.end_triggers
+    
+    def rebuild_level_views(self, changed_ranges=None):
+        """
+        Partition level lists per dimension (call after any of them change).
+        `changed_ranges` lists the world x ranges whose geometry changed
+        (streamed chunks); the nav graph then only re-simulates links near them.
+        """
+        views = self.level_views
+        views.build('platforms', self.platforms)
+        views.build('trigger_traps', self.trigger_traps)
+        views.build('end_triggers', self.end_triggers)
+        views.build('npcs', self.entity_manager.npcs)
+        views.build('campfires', self.entity_manager.campfires)
+        self.collision_grid.build(self.collision_platforms)
+        self.asset_loader.prewarm_level(self.platforms, self.trigger_traps, self.entity_manager.campfires)
+        if self._nav_platforms is not self.platforms:
+            # Links are simulated, so only rebuild when the platform list itself changed
+            if changed_ranges is not None and self._nav_stream is self.level_stream:
+                self.nav_graph.update(self.collision_grid, changed_ranges)
+            else:
+                self.nav_graph.build(self.collision_grid)
+                print(f"[LEVEL] Nav graph: {self.nav_graph.stats()} (spans, links)")
+            self._nav_platforms = self.platforms
+            self._nav_stream = self.level_stream
+        self.entity_manager.refresh_spatial()
+        self.entity_manager.prepare_enemy_batch()
+    
+    def update_level_prefetch(self, player):
+        """Start building the next level once its end is near."""
+        next_index = self.level_controller.current_level_index + 1
+        if next_index >= self.level_controller.total_levels:
+            return
+        if self.level_prefetcher.is_requested(next_index):
+            return
+        
+        near_end = player.rect.centerx >= self.level_width_pixels * LEVEL_PREFETCH_FRACTION
+        if not near_end and self.end_triggers:
+            offset_x, offset_y = self.camera.get_offset(player.rect)
+            view = pygame.Rect(offset_x, offset_y, self.game_surface_width, self.game_surface_height)
+            near_end = any(view.colliderect(et['rect']) for et in self.end_triggers)
+        
+        if near_end:
+            self.level_prefetcher.request(next_index)
+    
+    def _setup_streamed_level(self, new_game=False):
+        """Setup a chunked level - only chunks around the camera are built."""
+        normal_globals = self.level_stream.global_data('normal')
+        gema_globals = self.level_stream.global_data('gema')
+        
+        if new_game or not self.entity_manager.player:
+            start_pos = normal_globals['start_pos'] or (100, 100)
+            self.entity_manager.create_player(start_pos[0], start_pos[1])
+        
+        if new_game:
+            result = GameSetup.setup_parallax(self.asset_loader)
+            self.parallax_layers, self.moon_object, self.moon_shadow_object = result
+        
+        self.level_width_pixels = self.level_stream.max_width + 40
+        limit = normal_globals['camera_right_limit'] or gema_globals['camera_right_limit']
+        if limit:
+            self.camera.set_right_limit(limit)
+        
+        self.update_level_stream()
+        self.gameplay.reset_state()
+    
+    def _close_level_stream(self):
+        """Drop the current level stream and its chunk state."""
+        if self.level_stream:
+            self.level_stream.close()
+        self.level_stream = None
+        self._stream_structures = {}
+        self._stream_parked = {}
+    
+    def update_level_stream(self):
+        """Load chunks near the camera and evict chunks left behind."""
+        stream = self.level_stream
+        offset_x, _ = self.camera.get_offset(self.entity_manager.player.rect)
+        loaded, evicted = stream.update(offset_x, self.game_surface_width)
+        if not loaded and not evicted:
+            return
+        
+        for index in evicted:
+            structures = self._stream_structures.pop(index, None)
+            if structures is not None:
+                # Traps keep their runtime state (sprung or not) while the chunk is away
+                self._stream_parked.setdefault(index, {})['trigger_traps'] = structures['trigger_traps']
+        for index in loaded:
+            structures = GameSetup.setup_stream_chunk(stream.loaded[index])
+            parked_traps = self._stream_parked.get(index, {}).pop('trigger_traps', None)
+            if parked_traps is not None:
+                structures['trigger_traps'] = parked_traps
+            self._stream_structures[index] = structures
+        
+        # Rebuild flat lists in chunk order
+        chunks = [self._stream_structures[i] for i in sorted(self._stream_structures)]
+        for key in ('platforms', 'collision_platforms', 'trigger_traps', 'end_triggers'):
+            setattr(self, key, [item for chunk in chunks for item in chunk[key]])
+        
+        # Bring back entities parked with reloaded chunks
+        for index in loaded:
+            for name, items in self._stream_parked.pop(index, {}).items():
+                getattr(self.entity_manager, name).extend(items)
+        
+        # Spawn entities the first time a chunk is seen
+        for index in stream.first_load(loaded):
+            chunk = stream.loaded[index]
+            GameSetup.setup_enemies(
+                self.entity_manager, chunk['normal'], chunk['gema'],
+                self.level_controller.tile_size
+            )
+            GameSetup.setup_npcs(
+                self.entity_manager,
+                chunk['normal']['npc_spawns'], chunk['gema']['npc_spawns'],
+                self.snap_actor_to_ground, append=True
+            )
+            GameSetup.setup_campfires(
+                self.entity_manager,
+                chunk['normal']['campfires'], chunk['gema']['campfires']
+            )
+        
+        self._park_unloaded_entities()
+        chunk_px = stream.chunk_px
+        self.rebuild_level_views([(index * chunk_px, (index + 1) * chunk_px)
+                                  for index in sorted(set(loaded) | set(evicted))])
+    
+    def _park_unloaded_entities(self):
+        """Move entities standing in unloaded chunks out of the active lists."""
+        stream = self.level_stream
+        for name in ('enemies', 'npcs', 'campfires'):
+            active = []
+            for item in getattr(self.entity_manager, name):
+                index = int(item.rect.centerx // stream.chunk_px)
+                if index in stream.loaded:
+                    active.append(item)
+                else:
+                    self._stream_parked.setdefault(index, {}).setdefault(name, []).append(item)
+            setattr(self.entity_manager, name, active)
+    
     def respawn_player(self):
         """Respawn player and reset level state."""
         self.entity_manager.respawn_player()
         self.entity_manager.respawn_all_enemies()
+        if self.level_stream:
+            # Respawned enemies replace parked ones; re-park by chunk
+            for parked in self._stream_parked.values():
+                parked.pop('enemies', None)
+            self._park_unloaded_entities()
+            self.rebuild_level_views()
         
         # Reset gameplay state
         self.gameplay.reset_state()
         self.input_locked = False
         self.camera.unlock_camera()
         
-        for trap in self.trigger_traps:
-            trap.is_active = False
-            trap.frame_index = 0.0
-            trap.animation_finished = False
+        if self.level_snapshot:
+            self.level_snapshot.restore()
+        else:
+            parked_traps = [parked.get('trigger_traps', ()) for parked in self._stream_parked.values()]
+            for trap in chain(self.trigger_traps, *parked_traps):
+                trap.is_active = False
+                trap.frame_index = 0.0
+                trap.animation_finished = False
     
     def quick_restart_level(self):
         """Quick restart current level without re-parsing files."""
@@ -164,6 +411,12 @@ class Game:
         self.input_locked = False
         self.camera.unlock_camera()
         
+        if self.level_stream or self.level_snapshot:
+            # Static structures are shared; respawn only resets runtime state
+            self.respawn_player()
+            print("[DEBUG] quick_restart_level completed")
+            return
+        
         # Use GameSetup to rebuild level from cache
         level_data = GameSetup.quick_restart_from_cache(
             self._cached_normal_data, 
@@ -171,8 +424,10 @@ class Game:
         )
         
         self.platforms = level_data['platforms']
+        self.collision_platforms = level_data['collision_platforms']
         self.trigger_traps = level_data['trigger_traps']
         self.end_triggers = level_data['end_triggers']
+        self.rebuild_level_views()
         
         # Respawn player and enemies
         self.respawn_player()
@@ -210,56 +465,95 @@ class Game:
 
         # Jika masih ada level berikutnya
         if has_next_level:
-            self.save_manager.save_progress(
-                self.level_controller.current_level,
-                current_hearts
-            )
-            self.setup_level(new_game=True)
+            if not self.headless:
+                self.save_manager.save_progress(
+                    self.level_controller.current_level,
+                    current_hearts
+                )
+            prefetched = self.level_prefetcher.take(self.level_controller.current_level_index)
+            self.setup_level(new_game=True, prefetched=prefetched)
             self.entity_manager.player.hearts = current_hearts
         else:
             # Semua level selesai → WIN SCREEN
             self.state_controller.change_state(GameStateEnum.GAME_OVER_WIN)
 
     
+    def view_rect(self):
+        """World-space rect the camera currently shows."""
+        offset_x, offset_y = self.camera.get_offset(self.entity_manager.player.rect)
+        return pygame.Rect(int(offset_x), int(offset_y), self.game_surface_width, self.game_surface_height)
+    
     def update(self):
         """Main update loop."""
         player = self.entity_manager.player
+        timer = self.system_timer
+        timer.start()
         
         # Update invincibility
         self.gameplay.update_invincibility()
         
-        # Get active platforms for current dimension
-        current_dim = 'gema' if player.in_gema_dimension else 'normal'
-        active_platforms = [p['rect'] for p in self.platforms if p['dim'] in [current_dim, 'both']]
+        # Stream level chunks around the camera
+        if self.level_stream:
+            self.update_level_stream()
+        
+        # Prepare the next level in the background
+        self.update_level_prefetch(player)
+        timer.mark('level')
+        
+        # Collision world for current dimension
+        current_dim = player.dimension
+        views = self.level_views
+        active_platforms = self.collision_grid.view(current_dim)
         
         # Update based on game state
         if self.gameplay.end_sequence_active:
             self.update_end_sequence(active_platforms)
+            timer.mark('end_sequence')
         else:
             # Normal gameplay
             player.update(active_platforms)
+            timer.mark('player')
             
-            # Update all entities
-            for enemy in self.entity_manager.enemies:
-                enemy.update(active_platforms, player)
+            # Let AI detection skip enemies far from the player
+            entity_manager = self.entity_manager
+            entity_manager.refresh_spatial()
+            entity_manager.update_player_proximity()
             
-            # Update NPCs
-            for npc in self.entity_manager.npcs:
-                if getattr(npc, 'dim', 'both') in (current_dim, 'both'):
-                    npc.update(player.rect)
+            # Park enemies/NPCs far from the viewport
+            entity_manager.update_activation(self.view_rect())
+            timer.mark('spatial')
+            
+            # Update awake entities
+            entity_manager.update_enemies(active_platforms, player)
+            entity_manager.refresh_spatial()
+            timer.mark('enemies')
+            
+            # Update NPCs (distance checks only for NPCs the hash finds near the player)
+            near_npcs = set(entity_manager.npcs_near(*player.rect.center, NPC.WATCH_DISTANCE, current_dim))
+            awake_npcs = entity_manager.awake_npcs
+            for npc in views.active('npcs', current_dim):
+                if npc in awake_npcs:
+                    npc.update(player.rect, npc in near_npcs)
+            timer.mark('npcs')
             
             # Handle interactions
             if player.is_alive:
                 # Check triggers
-                end_mode = self.gameplay.handle_triggers(player, self.trigger_traps, self.end_triggers)
+                end_mode = self.gameplay.handle_triggers(
+                    player,
+                    views.active('trigger_traps', current_dim),
+                    views.active('end_triggers', current_dim)
+                )
                 if end_mode:
                     self.gameplay.start_end_sequence(end_mode)
                     self.input_locked = True
                 
                 # Handle damage and combat
-                self.gameplay.handle_damage(player, self.trigger_traps)
+                self.gameplay.update_broadphase(player, views.active('trigger_traps', current_dim))
+                self.gameplay.handle_damage(player)
                 self.gameplay.handle_enemy_blocking(player)
                 self.gameplay.handle_combat(player)
+            timer.mark('combat')
         
         # Update animated elements
         for trap in self.trigger_traps:
@@ -267,6 +561,7 @@ class Game:
         
         for campfire in self.entity_manager.campfires:
             campfire.update(self.asset_loader.campfire_frames)
+        timer.mark('animation')
         
         # Handle death
         if not player.is_alive:
@@ -277,18 +572,34 @@ class Game:
         
         # Cleanup dead enemies
         self.entity_manager.cleanup_dead_enemies()
+        timer.mark('cleanup')
     
-    def draw(self):
+    def interpolated_entities(self):
+        """Moving bodies whose drawn position is blended between ticks."""
+        entity_manager = self.entity_manager
+        yield entity_manager.player
+        yield from entity_manager.enemies
+        yield from entity_manager.npcs
+    
+    def draw(self, alpha=1.0):
         """Main draw loop - delegates to renderer."""
+        with self.interpolator.applied(self.interpolated_entities(), alpha):
+            self._render()
+    
+    def _render(self):
+        current_dim = self.entity_manager.player.dimension
+        views = self.level_views
         self.renderer.render(
             entity_manager=self.entity_manager,
             camera=self.camera,
             asset_loader=self.asset_loader,
-            platforms=self.platforms,
-            trigger_traps=self.trigger_traps,
+            platforms=views.active('platforms', current_dim),
+            trigger_traps=views.active('trigger_traps', current_dim),
             parallax_layers=self.parallax_layers,
             moon_object=self.moon_object,
-            moon_shadow_object=self.moon_shadow_object
+            moon_shadow_object=self.moon_shadow_object,
+            npcs=views.active('npcs', current_dim),
+            campfires=views.active('campfires', current_dim)
         )
     
     def snap_actor_to_ground(self, actor_rect, dim='normal', max_dx=160):
@@ -297,6 +608,27 @@ class Game:
             self.platforms, actor_rect, dim, max_dx
         )
     
+    def dispatch_input(self, event):
+        """Route an input event to NPC dialogs and the player (window loop and headless runs)."""
+        # Check if any NPC is talking
+        visible_npcs = self.level_views.active('npcs', self.entity_manager.player.dimension)
+        any_npc_talking = any(npc.talking for npc in visible_npcs)
+        
+        # Lock player input when NPC is talking
+        if self.entity_manager.player:
+            self.entity_manager.player.input_locked = any_npc_talking
+        
+        if self.state_controller.is_state(GameStateEnum.PLAYING) and not self.input_locked:
+            # Handle NPC dialog input (always allow E key for dialog)
+            player = self.entity_manager.player
+            for npc in visible_npcs:
+                npc.handle_event(event, player.rect, player)  # Pass player object
+            
+            # Only allow player movement if no NPC is talking
+            if not any_npc_talking:
+                if self.entity_manager.player:
+                    self.entity_manager.player.handle_event(event)
+    
     def run(self):
         """Main game loop."""
         # Load saved progress
@@ -308,7 +640,14 @@ class Game:
         from graphics.ui_buttons import UIButtons
         ui_buttons = UIButtons()
         
+        sim_clock = self.sim_clock
+        last_frame = time.perf_counter()
+        
         while self.running:
+            now = time.perf_counter()
+            elapsed_ms = (now - last_frame) * 1000.0
+            last_frame = now
+            
             mouse_pos = pygame.mouse.get_pos()
             
             # Event handling
@@ -332,52 +671,43 @@ class Game:
                     elif event.key == pygame.K_F3:
                         self.renderer.toggle_debug()
                 
-                # Player input - check if any NPC is talking
-                any_npc_talking = any(
-                    npc.talking for npc in self.entity_manager.npcs
-                    if getattr(npc, 'dim', 'both') in (
-                        'gema' if self.entity_manager.player.in_gema_dimension else 'normal', 
-                        'both'
-                    )
-                )
-                
-                # Lock player input when NPC is talking
-                if self.entity_manager.player:
-                    self.entity_manager.player.input_locked = any_npc_talking
-                
-                if self.state_controller.is_state(GameStateEnum.PLAYING) and not self.input_locked:
-                    # Handle NPC dialog input (always allow E key for dialog)
-                    player = self.entity_manager.player
-                    current_dim = 'gema' if player.in_gema_dimension else 'normal'
-                    for npc in self.entity_manager.npcs:
-                        if getattr(npc, 'dim', 'both') in (current_dim, 'both'):
-                            npc.handle_event(event, player.rect, player)  # Pass player object
-                    
-                    # Only allow player movement if no NPC is talking
-                    if not any_npc_talking:
-                        if self.entity_manager.player:
-                            self.entity_manager.player.handle_event(event)
+                # Player input
+                self.dispatch_input(event)
                 
                 # UI input
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     ui_buttons.handle_click(self, mouse_pos)
             
-            # Update
+            # Update in fixed ticks; the accumulator carries the remainder to the next frame
+            alpha = 1.0
             if self.state_controller.is_state(GameStateEnum.PLAYING):
-                self.update()
+                for _ in range(sim_clock.advance(elapsed_ms)):
+                    self.interpolator.capture(self.interpolated_entities())
+                    self.update()
+                    if not self.state_controller.is_state(GameStateEnum.PLAYING):
+                        break
+                alpha = sim_clock.alpha
+            else:
+                sim_clock.reset()
+                self.interpolator.clear()
             
             # Draw
-            self.draw()
+            self.draw(alpha)
             
             # Draw UI
             ui_buttons.draw_ui(self, mouse_pos)
             
             pygame.display.flip()
-            self.clock.tick(FPS)
+            self.clock.tick(RENDER_FPS)
         
+        self.level_prefetcher.shutdown()
         pygame.quit()
 
 
 if __name__ == '__main__':
+    import sys
+    if '--headless' in sys.argv[1:]:
+        from core.headless import main as headless_main
+        sys.exit(headless_main(Game))
     game = Game()
     game.run()
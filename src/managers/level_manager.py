@@ -2,10 +2,11 @@
 Level Manager - Mengelola level loading, transitions, dan progression.
 Demonstrasi Encapsulation dan Composition.
 """
-import pygame
 import os
 from typing import List, Tuple, Dict, Optional
 from utils.exception import LevelFileNotFound
+from core.level_parser import LevelParser, MANAGER_LAYOUT
+from core.level_index import LevelIndex
 
 
 class LevelData:
@@ -32,6 +33,7 @@ class LevelManager:
         self._levels: List[LevelData] = []
         self._current_level_index = 0
         self._tile_size = 40
+        self._parser = LevelParser(self._tile_size, layout=MANAGER_LAYOUT)
     
     @property
     def current_level_number(self) -> int:
@@ -63,27 +65,14 @@ class LevelManager:
             print(f"[WARNING] Levels folder not found: {full_path}")
             return
         
-        # Find all level files
-        level_files = {}
-        for filename in os.listdir(full_path):
-            if filename.startswith('level_') and filename.endswith('.txt'):
-                # Parse level_X_type.txt
-                parts = filename.replace('.txt', '').split('_')
-                if len(parts) >= 3:
-                    level_num = int(parts[1])
-                    map_type = parts[2]  # 'normal' or 'gema'
-                    
-                    if level_num not in level_files:
-                        level_files[level_num] = {}
-                    level_files[level_num][map_type] = os.path.join(full_path, filename)
-        
-        # Add levels in order
-        for level_num in sorted(level_files.keys()):
-            if 'normal' in level_files[level_num] and 'gema' in level_files[level_num]:
-                self.add_level(
-                    level_files[level_num]['normal'],
-                    level_files[level_num]['gema']
-                )
+        # Level list comes from the persisted index (files are only re-read when changed)
+        index = LevelIndex(full_path, self._tile_size)
+        index.refresh()
+        for entry in index.levels:
+            self.add_level(
+                os.path.join(full_path, entry['normal']['file']),
+                os.path.join(full_path, entry['gema']['file'])
+            )
     
     def set_current_level(self, level_number: int) -> bool:
         """
@@ -135,61 +124,7 @@ class LevelManager:
         }
         
         try:
-            with open(filepath, 'r') as file:
-                for y, line in enumerate(file):
-                    for x, char in enumerate(line):
-                        world_x, world_y = x * self._tile_size, y * self._tile_size
-                        rect = pygame.Rect(world_x, world_y, self._tile_size, self._tile_size)
-                        
-                        if world_x > result['max_width']:
-                            result['max_width'] = world_x
-                        
-                        # Parse different tile types
-                        if char in 'Gg':
-                            result['platforms'].append({'rect': rect, 'char': 'G'})
-                        elif char in 'Pp':
-                            plat_rect = pygame.Rect(world_x, world_y, self._tile_size, 20)
-                            result['platforms'].append({'rect': plat_rect, 'char': 'P'})
-                        elif char in 'Hh':
-                            facing = 'right' if char == 'H' else 'left'
-                            result['enemies'].append({'rect': rect, 'type': 'patrol', 'facing': facing})
-                        elif char in 'Ff':
-                            facing = 'right' if char == 'F' else 'left'
-                            result['enemies'].append({'rect': rect, 'type': 'chaser', 'facing': facing})
-                        elif char in 'Nn':
-                            facing = 'right' if char == 'N' else 'left'
-                            result['enemies'].append({'rect': rect, 'type': 'chaser_heavy', 'facing': facing})
-                        elif char in 'Bb':
-                            facing = 'right' if char == 'B' else 'left'
-                            result['enemies'].append({'rect': rect, 'type': 'boss', 'facing': facing})
-                        elif char in 'Aa':
-                            facing = 'left' if char == 'A' else 'right'
-                            result['npcs'].append({'rect': rect, 'type': 'A', 'facing': facing})
-                        elif char in 'Qq':
-                            facing = 'left' if char == 'Q' else 'right'
-                            result['npcs'].append({'rect': rect, 'type': 'Q', 'facing': facing})
-                        elif char in 'Ww':
-                            facing = 'left' if char == 'W' else 'right'
-                            result['npcs'].append({'rect': rect, 'type': 'W', 'facing': facing})
-                        elif char in 'Tt':
-                            result['triggers'].append(rect)
-                        elif char in 'jJyY':
-                            result['traps'].append(rect)
-                        elif char in 'Cc':
-                            result['campfires'].append(rect)
-                        elif char == 'D':
-                            result['end_triggers'].append({'rect': rect, 'mode': 'jump_walk'})
-                        elif char == 'd':
-                            result['end_triggers'].append({'rect': rect, 'mode': 'walk'})
-                        elif char in 'Ss':
-                            result['start_pos'] = (world_x, world_y + self._tile_size)
-                        elif char == 'K':
-                            result['camera_limit'] = world_x + self._tile_size // 2
-                        elif char in 'lL':
-                            result['left_markers'].setdefault(y, []).append(world_x + self._tile_size // 2)
-                        elif char in 'rR':
-                            result['right_markers'].setdefault(y, []).append(world_x + self._tile_size // 2)
-            
+            self._parser.parse_file(filepath, result)
             result['max_width'] += self._tile_size
             return result
             
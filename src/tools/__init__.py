@@ -0,0 +1,4 @@
+"""
+Tools module - Script pendukung (benchmark, utilitas level) yang dijalankan
+dari folder src, misalnya `python -m tools.bench_level_parser`.
+"""
@@ -0,0 +1,221 @@
+"""
+Benchmark parser level: parser asli per-karakter vs tabel simbol (regex) vs NumPy (vector_parser).
+Membuat map sintetis yang sangat lebar lalu membandingkan waktu dan output.
+Parser asli disalin beku di sini sebagai baseline; speedup dihitung terhadapnya.
+
+Usage (dari folder src):
+    python -m tools.bench_level_parser --columns 10000 --rows 20 --repeat 5
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.level_controller import LevelController
+from core.vector_parser import NUMPY_AVAILABLE
+
+
+def _baseline_parse_tile(char: str, rect: pygame.Rect, world_x: int, world_y: int, row: int,
+                         level_data: Dict, tile_size: int):
+    """Frozen copy of the original LevelController._parse_tile."""
+    # Ground tiles
+    if char in 'Gg':
+        level_data['platforms'].append({'rect': rect, 'char': 'G'})
+
+    # Platform tiles
+    elif char in 'Pp':
+        plat_rect = pygame.Rect(world_x, world_y, tile_size, 20)
+        level_data['platforms'].append({'rect': plat_rect, 'char': 'P'})
+
+    # Enemies
+    elif char in 'Hh':
+        facing = 'right' if char == 'H' else 'left'
+        level_data['enemy_spawns'].append({
+            'rect': rect, 'type': 'patrol', 'facing': facing
+        })
+    elif char in 'Nn':
+        facing = 'right' if char == 'N' else 'left'
+        level_data['enemy_spawns'].append({
+            'rect': rect, 'type': 'chaser_heavy', 'facing': facing
+        })
+    elif char in 'Ff':
+        facing = 'right' if char == 'F' else 'left'
+        level_data['enemy_spawns'].append({
+            'rect': rect, 'type': 'chaser', 'facing': facing
+        })
+    elif char in 'Bb':
+        facing = 'right' if char == 'B' else 'left'
+        level_data['enemy_spawns'].append({
+            'rect': rect, 'type': 'boss', 'facing': facing
+        })
+
+    # Triggers and traps
+    elif char in 'Tt':
+        level_data['triggers'].append(rect)
+    elif char in 'jJyY':
+        level_data['trap_zones'].append(rect)
+
+    # Start position
+    elif char in 'Ss':
+        level_data['start_pos'] = (world_x, world_y + tile_size)
+
+    # End triggers
+    elif char == 'D':
+        level_data['end_triggers'].append({'rect': rect, 'mode': 'jump_walk'})
+    elif char == 'd':
+        level_data['end_triggers'].append({'rect': rect, 'mode': 'walk'})
+
+    # Campfires
+    elif char in 'Cc':
+        level_data['campfires'].append(rect)
+
+    # Patrol markers
+    elif char in 'lL':
+        level_data['left_markers'].setdefault(row, []).append(world_x + tile_size // 2)
+    elif char in 'rR':
+        level_data['right_markers'].setdefault(row, []).append(world_x + tile_size // 2)
+
+    # NPCs
+    elif char in 'Aa':
+        facing = 'left' if char == 'A' else 'right'
+        level_data['npc_spawns']['A'].append({'rect': rect, 'facing': facing})
+    elif char in 'Qq':
+        facing = 'left' if char == 'Q' else 'right'
+        level_data['npc_spawns']['Q'].append({'rect': rect, 'facing': facing})
+    elif char in 'Ww':
+        facing = 'left' if char == 'W' else 'right'
+        level_data['npc_spawns']['W'].append({'rect': rect, 'facing': facing})
+
+    # Camera limit
+    elif char == 'K':
+        level_data['camera_right_limit'] = world_x + tile_size // 2
+
+
+def baseline_parse_level_file(filepath: str, tile_size: int = 40) -> Dict:
+    """
+    Frozen copy of the original char-by-char LevelController.parse_level_file
+    (one Rect and one _parse_tile call per character). Kept only as the
+    benchmark baseline; do not use it for loading levels.
+    """
+    level_data = {
+        'platforms': [],
+        'triggers': [],
+        'trap_zones': [],
+        'enemy_spawns': [],
+        'npc_spawns': {'A': [], 'Q': [], 'W': []},
+        'campfires': [],
+        'end_triggers': [],
+        'start_pos': None,
+        'left_markers': {},
+        'right_markers': {},
+        'camera_right_limit': None,
+        'max_width': 0
+    }
+
+    line_count = 0
+    max_lines = 1000
+    with open(filepath, 'r') as file:
+        for y, line in enumerate(file):
+            line_count += 1
+            if line_count > max_lines:
+                print(f"Warning: Level file {filepath} exceeded {max_lines} lines, stopping parse")
+                break
+
+            for x, char in enumerate(line):
+                world_x = x * tile_size
+                world_y = y * tile_size
+                rect = pygame.Rect(world_x, world_y, tile_size, tile_size)
+
+                if world_x > level_data['max_width']:
+                    level_data['max_width'] = world_x
+
+                # Parse different tile types
+                _baseline_parse_tile(char, rect, world_x, world_y, y, level_data, tile_size)
+    return level_data
+
+
+def generate_map(columns: int, rows: int, seed: int = 0) -> str:
+    """Generate a playable-looking map: ground rows, floating platforms, spawns, markers."""
+    rng = random.Random(seed)
+    grid = [[' '] * columns for _ in range(rows)]
+    ground = rows - 2
+
+    for x in range(columns):
+        # Ground with occasional gaps
+        if x % 60 not in (30, 31, 32):
+            grid[ground][x] = 'G'
+            grid[ground + 1][x] = 'G'
+
+    for x in range(8, columns - 8, 23):
+        y = rng.randint(ground - 6, ground - 3)
+        for dx in range(rng.randint(2, 6)):
+            grid[y][x + dx] = 'P'
+
+    for x in range(40, columns - 40, 45):
+        kind = rng.choice('HhFfNn')
+        grid[ground - 1][x] = kind
+        grid[ground - 1][x - 4] = 'l'
+        grid[ground - 1][x + 4] = 'r'
+
+    for x in range(70, columns - 70, 150):
+        grid[ground - 1][x] = rng.choice('TC')
+        grid[ground][x + 2] = 'j'
+        grid[ground - 3][x + 5] = rng.choice('AQW')
+
+    grid[ground - 1][2] = 'S'
+    grid[ground - 1][columns - 4] = 'D'
+    grid[0][columns - 2] = 'K'
+    return '\n'.join(''.join(row).rstrip() for row in grid) + '\n'
+
+
+def best_time(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--columns', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    scalar_parser = LevelController('.', use_compiled_cache=False, use_vector_parser=False)
+    vector_parser = LevelController('.', use_compiled_cache=False, use_vector_parser=True)
+    if not NUMPY_AVAILABLE:
+        print("NumPy is not installed; the numpy column repeats the symbol-table parser.")
+
+    print(f"{'columns':>8} {'tiles':>8} {'orig ms':>9} {'table ms':>10} {'numpy ms':>10} "
+          f"{'table x':>8} {'numpy x':>8}  same")
+    with tempfile.TemporaryDirectory() as tmp:
+        for columns in args.columns:
+            path = os.path.join(tmp, f'bench_{columns}.txt')
+            with open(path, 'w') as f:
+                f.write(generate_map(columns, args.rows))
+
+            baseline = baseline_parse_level_file(path)
+            scalar = scalar_parser.parse_level_file(path)
+            vector = vector_parser.parse_level_file(path)
+
+            t_base = best_time(lambda: baseline_parse_level_file(path), args.repeat)
+            t_scalar = best_time(lambda: scalar_parser.parse_level_file(path), args.repeat)
+            t_vector = best_time(lambda: vector_parser.parse_level_file(path), args.repeat)
+            print(f"{columns:>8} {len(baseline['platforms']):>8} {t_base * 1000:>9.2f} "
+                  f"{t_scalar * 1000:>10.2f} {t_vector * 1000:>10.2f} "
+                  f"{t_base / t_scalar:>7.1f}x {t_base / t_vector:>7.1f}x  {baseline == scalar == vector}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Benchmark restart level: snapshot (reset state) vs rebuild dari cache.
+Level sintetis dengan lebar berbeda di-load lalu quick_restart_level diukur.
+
+Usage (dari folder src):
+    python -m tools.bench_restart --columns 100 1000 4000 --repeat 20
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.level_controller import LevelController
+from tools.bench_level_parser import generate_map
+
+
+def time_restarts(game, repeat: int, rebuild: bool) -> float:
+    """Average quick_restart_level time in ms."""
+    total = 0.0
+    for _ in range(repeat):
+        if rebuild:
+            # Force the old path: rebuild structures and reconstruct enemies
+            game.level_snapshot = None
+            game.entity_manager.enemy_snapshots.clear()
+        start = time.perf_counter()
+        game.quick_restart_level()
+        total += time.perf_counter() - start
+    return total / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--columns', type=int, nargs='+', default=[100, 1000, 4000])
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    import main as game_main
+    game = game_main.Game()
+
+    print(f"{'columns':>8} {'platforms':>10} {'enemies':>8} {'snapshot ms':>12} {'rebuild ms':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for columns in args.columns:
+            text = generate_map(columns, args.rows)
+            for dim in ('normal', 'gema'):
+                with open(os.path.join(tmp, f'level_1_{dim}.txt'), 'w') as f:
+                    f.write(text)
+
+            controller = LevelController(tmp, use_compiled_cache=False)
+            controller.stream_min_columns = max(args.columns) + 1  # measure full loads only
+            game.level_controller = controller
+            game.setup_level(new_game=True)
+
+            snapshot_ms = time_restarts(game, args.repeat, rebuild=False)
+            rebuild_ms = time_restarts(game, args.repeat, rebuild=True)
+            print(f"{columns:>8} {len(game.platforms):>10} {len(game.entity_manager.enemies):>8} "
+                  f"{snapshot_ms:>12.3f} {rebuild_ms:>11.3f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
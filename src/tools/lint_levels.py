@@ -0,0 +1,209 @@
+"""
+Level linter - Validasi semua pasangan level (paralel) + estimasi biaya runtime.
+Mengecek aturan dari levels/SOP Level.md dan melaporkan pelanggaran beserta
+koordinat tile (baris, kolom), lalu memperkirakan beban collision/enemy.
+
+Usage (dari folder src):
+    python -m tools.lint_levels                 # semua level di levels/
+    python -m tools.lint_levels --levels 1 3    # level tertentu
+    python -m tools.lint_levels --json report.json
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.level_controller import LevelController
+from core.level_diff import diff_dimension_tiles
+from core.level_parser import SYMBOL_TABLE
+from core.span_merge import merge_platform_spans
+from utils.settings import SCREEN_WIDTH, CAMERA_ZOOM_DIVIDER
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_LEVELS_DIR = os.path.join(SRC_DIR, 'levels')
+
+# Visible world width in pixels (game surface is the screen divided by zoom)
+VIEW_WIDTH = int(SCREEN_WIDTH // CAMERA_ZOOM_DIVIDER)
+
+
+def _issue(issues: List[Dict], severity: str, filename: str, row, col, message: str):
+    issues.append({'severity': severity, 'file': filename, 'row': row, 'col': col, 'message': message})
+
+
+def _lint_map(path: str, data: Dict, tile_size: int, issues: List[Dict]):
+    """Rules that only need one map."""
+    name = os.path.basename(path)
+    ts = tile_size
+
+    # Count lines the way LevelParser.parse_file does (no phantom line after a trailing newline)
+    with open(path, 'r') as f:
+        lines = f.readlines()
+    if len(lines) > LevelController.MAX_LEVEL_LINES:
+        _issue(issues, 'error', name, None, None,
+               f"{len(lines)} lines, parser stops at {LevelController.MAX_LEVEL_LINES}")
+
+    for row, line in enumerate(lines):
+        for col, char in enumerate(line):
+            if char not in SYMBOL_TABLE and not char.isspace():
+                _issue(issues, 'warning', name, row, col, f"unknown symbol {char!r} is ignored")
+
+    # T should sit directly above its trap tile (SOP). setup_trigger_traps pairs
+    # them in scan order, so only a count mismatch actually breaks the level.
+    traps = {(r.x, r.y) for r in data['trap_zones']}
+    for r in data['triggers']:
+        if (r.x, r.y + ts) not in traps:
+            _issue(issues, 'warning', name, r.y // ts, r.x // ts, "T without j/y directly below")
+    if len(data['triggers']) != len(data['trap_zones']):
+        _issue(issues, 'error', name, None, None,
+               f"{len(data['triggers'])} triggers vs {len(data['trap_zones'])} traps; "
+               f"pairs are zipped in scan order and will be mismatched")
+
+    # Patrol enemies need markers on the same row
+    for spawn in data['enemy_spawns']:
+        if spawn['type'] != 'patrol':
+            continue
+        r = spawn['rect']
+        row = r.y // ts
+        sx = r.centerx
+        has_left = any(x <= sx for x in data['left_markers'].get(row, []))
+        has_right = any(x >= sx for x in data['right_markers'].get(row, []))
+        if not (has_left and has_right):
+            missing = ' and '.join(m for m, ok in (('l', has_left), ('r', has_right)) if not ok)
+            _issue(issues, 'warning', name, row, r.x // ts,
+                   f"patrol enemy without {missing} marker on its row (defaults to +-80 px)")
+
+    if not data['end_triggers']:
+        _issue(issues, 'warning', name, None, None, "no end trigger (D/d)")
+
+
+def _max_in_window(xs: List[int], width: int) -> int:
+    """Largest number of xs inside any window [x, x + width)."""
+    xs = sorted(xs)
+    best = 0
+    start = 0
+    for end, x in enumerate(xs):
+        while xs[start] < x - width + 1:
+            start += 1
+        best = max(best, end - start + 1)
+    return best
+
+
+def _max_rects_per_column(rects: List, tile_size: int) -> Tuple[int, int]:
+    """(worst count, column) of rects overlapping a single tile column."""
+    counts: Dict[int, int] = {}
+    for r in rects:
+        for col in range(r.left // tile_size, (r.right - 1) // tile_size + 1):
+            counts[col] = counts.get(col, 0) + 1
+    if not counts:
+        return 0, 0
+    col = max(counts, key=counts.get)
+    return counts[col], col
+
+
+def lint_level_pair(level_number: int, normal_path: str, gema_path: str, tile_size: int = 40) -> Dict:
+    """
+    Lint one level pair and estimate its runtime cost (runs in a worker process).
+
+    Returns:
+        {'level', 'issues': [...], 'cost': {...}}
+    """
+    issues: List[Dict] = []
+    controller = LevelController(os.path.dirname(normal_path), tile_size, use_compiled_cache=False)
+    try:
+        normal = controller.parse_level_file(normal_path)
+        gema = controller.parse_level_file(gema_path)
+    except Exception as e:
+        _issue(issues, 'error', os.path.basename(normal_path), None, None, f"cannot parse: {e}")
+        return {'level': level_number, 'issues': issues, 'cost': {}}
+
+    for path, data in ((normal_path, normal), (gema_path, gema)):
+        _lint_map(path, data, tile_size, issues)
+
+    # Level-wide rules (start is read from the normal map, K from either)
+    if normal['start_pos'] is None:
+        _issue(issues, 'error', os.path.basename(normal_path), None, None,
+               "no start point S (player spawns at 100,100)")
+    if normal['camera_right_limit'] is None and gema['camera_right_limit'] is None:
+        _issue(issues, 'warning', os.path.basename(normal_path), None, None,
+               "no camera limit K in either map")
+
+    # Cost estimate
+    shared, normal_only, gema_only = diff_dimension_tiles(normal['platforms'], gema['platforms'])
+    spans = {
+        'shared': merge_platform_spans(shared),
+        'normal': merge_platform_spans(normal_only),
+        'gema': merge_platform_spans(gema_only),
+    }
+    worst = {}
+    for dim in ('normal', 'gema'):
+        rects = [p['rect'] for p in spans['shared'] + spans[dim]]
+        worst[dim] = _max_rects_per_column(rects, tile_size)
+
+    enemy_xs = [s['rect'].x for s in normal['enemy_spawns'] + gema['enemy_spawns']]
+    width = max(normal['max_width'], gema['max_width']) + tile_size
+    cost = {
+        'width_px': width,
+        'tiles': {'normal': len(normal['platforms']), 'gema': len(gema['platforms'])},
+        'rects_after_merge': {
+            'shared': len(spans['shared']), 'normal': len(spans['normal']), 'gema': len(spans['gema'])
+        },
+        'enemies': len(enemy_xs),
+        'max_enemies_per_screen': _max_in_window(enemy_xs, VIEW_WIDTH),
+        'worst_collision_per_column': {
+            dim: {'count': count, 'col': col} for dim, (count, col) in worst.items()
+        },
+    }
+    return {'level': level_number, 'issues': issues, 'cost': cost}
+
+
+def _print_report(report: Dict):
+    cost = report['cost']
+    errors = sum(1 for i in report['issues'] if i['severity'] == 'error')
+    print(f"Level {report['level']}: {errors} error(s), {len(report['issues']) - errors} warning(s)")
+    for i in report['issues']:
+        where = f"row {i['row']} col {i['col']}" if i['row'] is not None else "-"
+        print(f"  {i['severity']:<7} {i['file']} [{where}] {i['message']}")
+    if cost:
+        merged = cost['rects_after_merge']
+        worst = cost['worst_collision_per_column']
+        print(f"  cost: {cost['tiles']['normal']}+{cost['tiles']['gema']} tiles -> "
+              f"{merged['shared']} shared + {merged['normal']} normal + {merged['gema']} gema rects, "
+              f"{cost['enemies']} enemies (max {cost['max_enemies_per_screen']} per screen), "
+              f"worst column {worst['normal']['count']} normal / {worst['gema']['count']} gema rects")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--levels-dir', default=DEFAULT_LEVELS_DIR)
+    parser.add_argument('--levels', type=int, nargs='*', help="Level numbers (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size")
+    parser.add_argument('--json', metavar='PATH', help="Also write the full report as JSON")
+    args = parser.parse_args()
+
+    controller = LevelController(args.levels_dir, use_compiled_cache=False)
+    numbers = args.levels or list(range(1, controller.total_levels + 1))
+    jobs = []
+    for number in numbers:
+        normal_path, gema_path = controller.get_level_paths(number - 1)
+        jobs.append((number, normal_path, gema_path, controller.tile_size))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        reports = list(pool.map(lint_level_pair, *zip(*jobs)))
+
+    for report in reports:
+        _print_report(report)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+    has_errors = any(i['severity'] == 'error' for r in reports for i in r['issues'])
+    return 1 if has_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
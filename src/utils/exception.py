@@ -39,3 +39,13 @@ class SpriteSheetError(GameException):
     def __str__(self) -> str:
         d = f" ({self.detail})" if self.detail else ""
         return f"Error memuat sprite sheet: {self.file_path}{d}"
+
+
+class FrameDataError(GameException):
+    def __init__(self, file_path: str, detail: Exception | str | None = None):
+        self.file_path = file_path
+        self.detail = detail
+
+    def __str__(self) -> str:
+        d = f" ({self.detail})" if self.detail else ""
+        return f"Error memuat frame data: {self.file_path}{d}"
@@ -21,5 +21,39 @@ CAMERA_ZOOM_DIVIDER = 2.0
 CAMERA_MANUAL_OFFSET_X = 180 
 CAMERA_MANUAL_OFFSET_Y = 370 
 
+# Level streaming (map lebih lebar dari ini di-load per chunk)
+LEVEL_STREAM_MIN_COLUMNS = 512
+LEVEL_CHUNK_COLUMNS = 32
+
+# Prefetch level berikutnya setelah pemain melewati fraksi lebar level ini
+LEVEL_PREFETCH_FRACTION = 0.6
+
+# Fixed timestep: simulasi selalu SIM_TICK_RATE tick/detik, render dibatasi RENDER_FPS (0 = tanpa batas)
+SIM_TICK_RATE = FPS
+MAX_CATCH_UP_TICKS = 5
+RENDER_FPS = 144
+
+# Enemy/NPC hanya di-update dalam viewport kamera + margin ini (px)
+ACTIVATION_MARGIN = 160
+
+# Enemy patrol/chaser disimulasikan sebagai batch NumPy kalau level punya minimal sekian enemy
+# (cek terhadap update per objek: python -m main --headless --level N --compare-batch)
+ENEMY_BATCH = True
+ENEMY_BATCH_MIN_ENEMIES = 24
+
+# Navigasi chaser: link lompat/jatuh disimulasikan dengan body agent ini (chaser paling lambat)
+NAV_AGENT_SIZE = (50, 50)
+NAV_AGENT_SPEED = 2.2
+
+# Varian surface (skala/flip) yang disimpan di cache sebelum entry terlama dibuang
+SURFACE_CACHE_MAX_ENTRIES = 2048
+
+# Tile statis dipanggang ke chunk selebar ini (px); chunk terlama dibuang di atas batas per dimensi
+TILE_CHUNK_WIDTH = 512
+TILE_CHUNK_MAX_SURFACES = 12
+
+# Objek digambar hanya kalau rentang x-nya dalam span kamera + margin ini (sprite boss melebar ~85 px dari rect)
+RENDER_CULL_MARGIN = 128
+
 # Debug
 DEBUG_DRAW_HITBOXES = False 